@@ -2,27 +2,77 @@
 
 from .autopilot import BobcatAutopilot
 from .diagnoser import *
-from .bobcat import Bobcat
+from .bobcat import Bobcat, BobcatAttributes
+from .async_bobcat import AsyncBobcat
 from .api import BobcatAPI
-from .connection import BobcatConnection
+from .connection import BobcatConnection, BobcatDiscovery, BobcatHttpStats, BobcatPing
 from .base import BobcatBase
-from .logger import BobcatLogger
+from .cache import BobcatCacheStats, BobcatDiscoveryCache, BobcatEndpointCache
+from .retry import BobcatRetryPolicy
+from .polling import BobcatPoller, BobcatPollingPolicy, BobcatRecovery
+from .speed import BobcatSpeedResult, BobcatSpeedWorker
+from .snapshot import (
+    BobcatPeerSession,
+    BobcatSnapshot,
+    StatusSnapshot,
+    MinerSnapshot,
+    TempSnapshot,
+    SpeedSnapshot,
+    DigSnapshot,
+)
+from .ratelimit import BobcatRateLimiter, BobcatRateLimitStats, TokenBucket
+from .neighbors import BobcatNeighborSource, ArpTableNeighborSource, IpNeighNeighborSource
+from .logger import BobcatLogger, BobcatTraceDescription
 from .errors import (
     BobcatSearchNetworkError,
     BobcatNotFoundError,
     BobcatVerificationError,
     BobcatConnectionError,
+    BobcatRefreshError,
+    BobcatRateLimitError,
+    BobcatSpeedTestNotReadyError,
 )
 
 __all__ = (
     "BobcatAutopilot",
     "Bobcat",
+    "BobcatAttributes",
+    "AsyncBobcat",
     "BobcatAPI",
     "BobcatConnection",
+    "BobcatDiscovery",
+    "BobcatHttpStats",
+    "BobcatPing",
     "BobcatBase",
+    "BobcatDiscoveryCache",
+    "BobcatEndpointCache",
+    "BobcatCacheStats",
+    "BobcatRetryPolicy",
+    "BobcatPollingPolicy",
+    "BobcatPoller",
+    "BobcatRecovery",
+    "BobcatSpeedResult",
+    "BobcatSpeedWorker",
+    "BobcatPeerSession",
+    "BobcatSnapshot",
+    "StatusSnapshot",
+    "MinerSnapshot",
+    "TempSnapshot",
+    "SpeedSnapshot",
+    "DigSnapshot",
+    "BobcatRateLimiter",
+    "BobcatRateLimitStats",
+    "TokenBucket",
+    "BobcatNeighborSource",
+    "ArpTableNeighborSource",
+    "IpNeighNeighborSource",
     "BobcatLogger",
+    "BobcatTraceDescription",
     "BobcatSearchNetworkError",
     "BobcatNotFoundError",
     "BobcatVerificationError",
     "BobcatConnectionError",
+    "BobcatRefreshError",
+    "BobcatRateLimitError",
+    "BobcatSpeedTestNotReadyError",
 )
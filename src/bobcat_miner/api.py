@@ -1,19 +1,31 @@
 from __future__ import annotations
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 from requests import Response
 
-import json
-import time
-
+try:
+    from cache import BobcatCacheStats, BobcatEndpointCache
+except:
+    from .cache import BobcatCacheStats, BobcatEndpointCache
 try:
     from connection import BobcatConnection
 except:
     from .connection import BobcatConnection
+try:
+    from speed import BobcatSpeedResult, BobcatSpeedWorker
+except:
+    from .speed import BobcatSpeedResult, BobcatSpeedWorker
+try:
+    from errors import *
+except:
+    from .errors import *
 try:
     from constants import *
 except:
     from .constants import *
 
+import threading
+
 
 class BobcatAPI(BobcatConnection):
     """A class for interacting with the Bobcat API endpoints."""
@@ -21,26 +33,125 @@ class BobcatAPI(BobcatConnection):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+        self._endpoint_cache = BobcatEndpointCache(self._cache_ttls)
+        self._revalidate_executor = None
+        self._revalidating: Dict[str, Future] = {}
+        self._revalidate_lock = threading.Lock()
+        self._speed_worker = None
+
+    def _refresh(self, endpoint: str, hostname: str = None) -> Dict:
+        """Refresh the endpoint data and record when it was refreshed.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            hostname (str, optional): The hostname to refresh. This will override the hostname instance attribute.
+        Returns:
+            (Dict): The endpoint data.
+        """
+        data = super()._refresh(endpoint, hostname)
+        self._endpoint_cache.touch(endpoint)
+        return data
+
+    def _refresh_cached(self, endpoint: str) -> None:
+        """Refresh the endpoint data when it is missing. Stale data is served while it is refreshed in the background.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        """
+        # the speed worker keeps the speed data fresh without blocking the caller
+        if endpoint == "speed" and self._speed_worker and self._speed_worker.running:
+            return
+
+        freshness = self._endpoint_cache.lookup(endpoint)
+
+        if freshness == BobcatEndpointCache.MISS:
+            getattr(self, f"refresh_{endpoint}")()
+        elif freshness == BobcatEndpointCache.STALE:
+            self._revalidate(endpoint)
+
+    def _revalidate(self, endpoint: str) -> None:
+        """Refresh the endpoint data in the background unless a refresh is already running.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        """
+        with self._revalidate_lock:
+            if (future := self._revalidating.get(endpoint)) and not future.done():
+                return
+
+            if not self._revalidate_executor:
+                self._revalidate_executor = ThreadPoolExecutor(
+                    max_workers=len(self.ENDPOINTS), thread_name_prefix="bobcat-revalidate"
+                )
+
+            future = self._revalidate_executor.submit(getattr(self, f"refresh_{endpoint}"))
+            self._revalidating[endpoint] = future
+
+        def log_error(future: Future) -> None:
+            if err := future.exception():
+                self.logger.warning(f"Refresh: Unable to refresh stale {endpoint} data ({err!r})")
+
+        future.add_done_callback(log_error)
+
+    def cache_stats(self, endpoint: str = None) -> BobcatCacheStats:
+        """Get the endpoint cache statistics.
+        Args:
+            endpoint (str, optional): The endpoint name e.g. status, miner, temp, speed or dig. Defaults to the total for every endpoint.
+        Returns:
+            (BobcatCacheStats): The cache hits, misses and stale hits.
+        """
+        return self._endpoint_cache.stats(endpoint)
+
+    def start_speed_worker(
+        self, interval: float = THIRTY_MINUTES, retry_interval: float = THIRTY_SECONDS
+    ) -> BobcatSpeedWorker:
+        """Start refreshing the network speed data in the background. The speed attributes are then served from the last good result without waiting for a speed test.
+        Args:
+            interval (float, optional): The seconds between speed tests. Defaults to THIRTY_MINUTES.
+            retry_interval (float, optional): The seconds before an empty or failed speed test is retried. Defaults to THIRTY_SECONDS.
+        Returns:
+            (BobcatSpeedWorker): The running speed worker.
+        """
+        if not self._speed_worker or not self._speed_worker.running:
+            self._speed_worker = BobcatSpeedWorker(self, interval, retry_interval).start()
+
+        return self._speed_worker
+
+    def stop_speed_worker(self, timeout: float = None) -> None:
+        """Stop the background network speed refresh.
+        Args:
+            timeout (float, optional): The max seconds to wait for a running speed test. Defaults to waiting until it finishes.
+        """
+        if self._speed_worker:
+            self._speed_worker.stop(timeout)
+
+    def speed_result(self) -> Optional[BobcatSpeedResult]:
+        """Get the last good network speed result from the speed worker.
+        Returns:
+            (BobcatSpeedResult, None): The last good result and its age or None when the worker has no result yet.
+        """
+        return self._speed_worker.result if self._speed_worker else None
+
+    def wait_for_speed_result(self, timeout: float = None) -> Optional[BobcatSpeedResult]:
+        """Wait for the first good network speed result from the speed worker.
+        Args:
+            timeout (float, optional): The max seconds to wait. Defaults to waiting until the speed test succeeds.
+        Returns:
+            (BobcatSpeedResult, None): The last good result or None when there is no speed worker or the timeout expired first.
+        """
+        return self._speed_worker.wait(timeout) if self._speed_worker else None
+
+    def close(self) -> None:
+        """Stop the background refreshes and close the HTTP session."""
+        self.stop_speed_worker(timeout=0)
+
+        if self._revalidate_executor:
+            self._revalidate_executor.shutdown(wait=False)
+        super().close()
+
     def refresh_status(self) -> BobcatAPI:
         """Refresh Bobcat status data.
         Returns:
             (BobcatAPI): The instance of the BobcatAPI.
         """
-        self._status_data = self._BobcatConnection__get(
-            "http://" + self._hostname + "/status.json"
-        ).json()
-
-        if self._trace:
-            self.logger.debug(
-                "Refresh: Status Data",
-                extra={"description": f"\n```\n{json.dumps(self._status_data, indent=4)}\n```"},
-            )
-        else:
-            self.logger.debug("Refresh: Status Data")
-
-        if self._status_data == {"message": "rate limit exceeded"}:
-            time.sleep(30)
-            self.refresh_status()
+        self._refresh("status")
         return self
 
     def refresh_miner(self) -> BobcatAPI:
@@ -59,28 +170,7 @@ class BobcatAPI(BobcatConnection):
             (BobcatAPI): The instance of the BobcatAPI.
         """
         # https://bobcatminer.zendesk.com/hc/en-us/articles/4407606223899-Netspeed-Blockchain-Reboot
-        self._speed_data = self._BobcatConnection__get(
-            "http://" + self._hostname + "/speed.json"
-        ).json()
-
-        if self._trace:
-            self.logger.debug(
-                "Refresh: Network Speed Data",
-                extra={"description": f"\n```\n{json.dumps(self._speed_data, indent=4)}\n```"},
-            )
-        else:
-            self.logger.debug("Refresh: Network Speed Data")
-
-        if (self._speed_data == {"message": "rate limit exceeded"}) or (
-            self._speed_data
-            == {
-                "DownloadSpeed": "",
-                "UploadSpeed": "",
-                "Latency": "",
-            }  # https://github.com/aidanmelen/bobcat-miner-python/issues/6
-        ):
-            time.sleep(30)
-            self.refresh_speed()
+        self._refresh("speed")
         return self
 
     def refresh_temp(self) -> BobcatAPI:
@@ -88,21 +178,7 @@ class BobcatAPI(BobcatConnection):
         Returns:
             (BobcatAPI): The instance of the BobcatAPI.
         """
-        self._temp_data = self._BobcatConnection__get(
-            "http://" + self._hostname + "/temp.json"
-        ).json()
-
-        if self._trace:
-            self.logger.debug(
-                "Refresh: Temperature Data",
-                extra={"description": f"\n```\n{json.dumps(self._temp_data, indent=4)}\n```"},
-            )
-        else:
-            self.logger.debug("Refresh: Temperature Data")
-
-        if self._temp_data == {"message": "rate limit exceeded"}:
-            time.sleep(30)
-            self.refresh_temp()
+        self._refresh("temp")
         return self
 
     def refresh_dig(self) -> BobcatAPI:
@@ -110,21 +186,7 @@ class BobcatAPI(BobcatConnection):
         Returns:
             (BobcatAPI): The instance of the BobcatAPI.
         """
-        self._dig_data = self._BobcatConnection__get(
-            "http://" + self._hostname + "/dig.json"
-        ).json()
-
-        if self._trace:
-            self.logger.debug(
-                "Refresh: DNS Data",
-                extra={"description": f"\n```\n{json.dumps(self._dig_data, indent=4)}\n```"},
-            )
-        else:
-            self.logger.debug("Refresh: DNS Data")
-
-        if self._dig_data == {"message": "rate limit exceeded"}:
-            time.sleep(30)
-            self.refresh_dig()
+        self._refresh("dig")
         return self
 
     def refresh(
@@ -135,7 +197,7 @@ class BobcatAPI(BobcatConnection):
         speed: bool = True,
         dig: bool = True,
     ) -> BobcatAPI:
-        """Refresh data for the Bobcat.
+        """Refresh data for the Bobcat. The endpoints are fetched concurrently so the refresh takes as long as the slowest endpoint.
         Args:
             status (bool): Whether to refresh the Bobcat status data.
             miner (bool): Whether to refresh the Bobcat miner data.
@@ -144,17 +206,49 @@ class BobcatAPI(BobcatConnection):
             dig (bool): Whether to refresh the Bobcat DNS data.
         Returns:
             (BobcatAPI): The instance of the BobcatAPI.
+        Raises:
+            BobcatRefreshError: When one or more endpoints fail to refresh. The data for the other endpoints is still refreshed.
         """
-        if status:
-            self.refresh_status()
-        if miner:
-            self.refresh_miner()
-        if speed:
-            self.refresh_speed()
-        if temp:
-            self.refresh_temp()
-        if dig:
-            self.refresh_dig()
+        refreshes = {
+            endpoint: refresh
+            for endpoint, refresh, enabled in [
+                ("status", self.refresh_status, status),
+                ("miner", self.refresh_miner, miner),
+                ("speed", self.refresh_speed, speed),
+                ("temp", self.refresh_temp, temp),
+                ("dig", self.refresh_dig, dig),
+            ]
+            if enabled
+        }
+
+        if not refreshes:
+            return self
+
+        def deferred_refresh(refresh, deferred):
+            with self._defer_refresh_logs(deferred):
+                refresh()
+
+        # the refresh logs are emitted in endpoint order once each endpoint is done
+        deferred = {endpoint: [] for endpoint in refreshes}
+
+        errors = {}
+        with ThreadPoolExecutor(max_workers=len(refreshes)) as executor:
+            futures = {
+                endpoint: executor.submit(deferred_refresh, refresh, deferred[endpoint])
+                for endpoint, refresh in refreshes.items()
+            }
+
+            for endpoint, future in futures.items():
+                err = future.exception()
+                self._emit_refresh_logs(deferred[endpoint])
+
+                if err:
+                    self.logger.error(f"Refresh: Unable to refresh {endpoint} data ({err!r})")
+                    errors[endpoint] = err
+
+        if errors:
+            raise BobcatRefreshError(errors)
+
         return self
 
     def __reboot(self) -> Response:
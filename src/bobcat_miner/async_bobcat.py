@@ -0,0 +1,457 @@
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import aiohttp
+import asyncio
+
+try:
+    from bobcat import BobcatAttributes
+except:
+    from .bobcat import BobcatAttributes
+try:
+    from connection import BobcatConnection
+except:
+    from .connection import BobcatConnection
+try:
+    from retry import UNSENT_ERRORS
+except:
+    from .retry import UNSENT_ERRORS
+try:
+    from polling import REACHABLE, UNREACHABLE, BobcatPoller, BobcatRecovery
+except:
+    from .polling import REACHABLE, UNREACHABLE, BobcatPoller, BobcatRecovery
+try:
+    from constants import *
+except:
+    from .constants import *
+try:
+    from errors import *
+except:
+    from .errors import *
+
+
+class AsyncBobcat(BobcatAttributes, BobcatConnection):
+    """A class for the Bobcat miner with an async API. Many Bobcats can be monitored from one event loop by sharing one aiohttp session."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """The Async Bobcat constructor. No network requests are made until the Bobcat is connected.
+
+        Args:
+            session (aiohttp.ClientSession, optional): A session shared with other Bobcats. The session is not closed by the Bobcat. Defaults to a session owned by the Bobcat.
+            discover (bool, optional): Whether to verify or find the Bobcat when it is connected. Defaults to True.
+        """
+        self._client_session = kwargs.pop("session", None)
+        self._owns_client_session = self._client_session is None
+        self._connect_discover = kwargs.pop("discover", True)
+
+        super().__init__(*args, discover=False, **kwargs)
+
+    def __enter__(self) -> AsyncBobcat:
+        raise TypeError(
+            "The AsyncBobcat must be closed with `await bobcat.close()`. Use `async with AsyncBobcat(...)` instead."
+        )
+
+    def __exit__(self, *args) -> None:
+        raise TypeError(
+            "The AsyncBobcat must be closed with `await bobcat.close()`. Use `async with AsyncBobcat(...)` instead."
+        )
+
+    async def __aenter__(self) -> AsyncBobcat:
+        if not self._connect_discover:
+            return self
+
+        try:
+            return await self.connect()
+        except Exception as err:
+            await self.close()
+            raise
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def connect(self) -> AsyncBobcat:
+        """Verify the Bobcat hostname or find the Bobcat in the local networks when there is no hostname.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        Raises:
+            BobcatConnectionError: When the Bobcat hostname is unreachable.
+            BobcatVerificationError: When the host is not a bobcat or does not match the bobcat animal.
+            BobcatNotFoundError: When a bobcat is not found in the local networks.
+        """
+        if self._hostname:
+            if not (await self.verify(self._hostname))[0]:
+                if not (await self.ping()).reachable:
+                    raise BobcatConnectionError(f"Unable to connect to Bobcat: {self._hostname}")
+                else:
+                    raise BobcatVerificationError(
+                        f"The bobcat ({self._hostname}) was either not a bobcat or did not match the bobcat animal."
+                    )
+            return self
+
+        discoveries = self.find_all()
+        try:
+            async for discovery in discoveries:
+                self._hostname = discovery.hostname
+                self.logger.debug(f"Found Bobcat: {self._hostname}")
+                return self
+        finally:
+            await discoveries.aclose()
+
+        raise BobcatNotFoundError(
+            f"Unable to find the bobcat{' (' + self._animal + ')' if self._animal else ''} in these networks: {', '.join(self._networks)}"
+        )
+
+    async def close(self) -> None:
+        """Close the aiohttp session when it is owned by the Bobcat."""
+        if self._owns_client_session and self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+
+        super().close()
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the session shared by the running scan or the client session outside of a scan.
+        Returns:
+            (AsyncIterator[aiohttp.ClientSession]): The HTTP session.
+        """
+        if self._scan_session is not None:
+            yield self._scan_session
+            return
+
+        if self._client_session is None or self._client_session.closed:
+            self._client_session = aiohttp.ClientSession()
+            self._owns_client_session = True
+
+        yield self._client_session
+
+    def _autorefresh(self, endpoint: str) -> None:
+        """Async attributes are never refreshed implicitly because properties cannot be awaited.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Raises:
+            RuntimeError: When the endpoint data has not been refreshed.
+        """
+        if getattr(self, f"_{endpoint}_data"):
+            return
+
+        raise RuntimeError(
+            f"The Bobcat {endpoint} data has not been refreshed. Run `await bobcat.refresh_{endpoint}()` first."
+        )
+
+    async def _refresh(self, endpoint: str) -> Dict:
+        """Refresh the endpoint data. Rate limited responses pause the host's requests and are retried up to `rate_limit_max_attempts` times.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Returns:
+            (Dict): The endpoint data.
+        Raises:
+            BobcatRateLimitError: When the endpoint is still rate limited after the max number of attempts.
+            BobcatSpeedTestNotReadyError: When the speed test still has no results after the max number of attempts.
+        """
+        path, _ = self.ENDPOINTS[endpoint]
+
+        for attempt in range(1, self._rate_limit_max_attempts + 1):
+            body = await self._get(f"http://{self._hostname}/{path}")
+
+            if (data := self._accept(endpoint, body, attempt, self._hostname)) is not None:
+                return data
+
+    async def refresh_status(self) -> AsyncBobcat:
+        """Refresh Bobcat status data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        """
+        await self._refresh("status")
+        return self
+
+    async def refresh_miner(self) -> AsyncBobcat:
+        """Refresh Bobcat miner data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        """
+        await self._refresh("miner")
+        return self
+
+    async def refresh_speed(self) -> AsyncBobcat:
+        """Refresh Bobcat network speed data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        """
+        await self._refresh("speed")
+        return self
+
+    async def refresh_temp(self) -> AsyncBobcat:
+        """Refresh Bobcat temperature data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        """
+        await self._refresh("temp")
+        return self
+
+    async def refresh_dig(self) -> AsyncBobcat:
+        """Refresh Bobcat DNS data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        """
+        await self._refresh("dig")
+        return self
+
+    async def refresh(
+        self,
+        status: bool = True,
+        miner: bool = True,
+        temp: bool = True,
+        speed: bool = True,
+        dig: bool = True,
+    ) -> AsyncBobcat:
+        """Refresh data for the Bobcat. The endpoints are fetched concurrently.
+        Args:
+            status (bool): Whether to refresh the Bobcat status data.
+            miner (bool): Whether to refresh the Bobcat miner data.
+            temp (bool): Whether to refresh the Bobcat temperature data.
+            speed (bool): Whether to refresh the Bobcat network speed data.
+            dig (bool): Whether to refresh the Bobcat DNS data.
+        Returns:
+            (AsyncBobcat): The instance of the AsyncBobcat.
+        Raises:
+            BobcatRefreshError: When one or more endpoints fail to refresh. The data for the other endpoints is still refreshed.
+        """
+        endpoints = [
+            endpoint
+            for endpoint, enabled in [
+                ("status", status),
+                ("miner", miner),
+                ("speed", speed),
+                ("temp", temp),
+                ("dig", dig),
+            ]
+            if enabled
+        ]
+
+        async def deferred_refresh(endpoint, deferred):
+            with self._defer_refresh_logs(deferred):
+                await self._refresh(endpoint)
+
+        # the refresh logs are emitted in endpoint order once every endpoint is done
+        deferred = {endpoint: [] for endpoint in endpoints}
+
+        results = await asyncio.gather(
+            *(deferred_refresh(endpoint, deferred[endpoint]) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+        errors = {}
+        for endpoint, result in zip(endpoints, results):
+            self._emit_refresh_logs(deferred[endpoint])
+
+            if isinstance(result, Exception):
+                self.logger.error(f"Refresh: Unable to refresh {endpoint} data ({result!r})")
+                errors[endpoint] = result
+
+        if errors:
+            raise BobcatRefreshError(errors)
+
+        return self
+
+    async def _get(self, url: str) -> bytes:
+        """Make GET request for a URL. Connection errors and timeouts are retried with the retry policy.
+        Args:
+            url (str): A URL to GET.
+        Returns:
+            (bytes): The raw response body.
+        """
+
+        async def get() -> bytes:
+            await asyncio.sleep(self._throttle(url))
+
+            async with self._session() as session:
+                async with session.get(url, timeout=self._retry_policy.client_timeout) as response:
+                    return await response.read()
+
+        return await self._retry_policy.retry(get, logger=self.logger)()
+
+    async def _post(self, path: str) -> str:
+        """Make POST request for a Bobcat admin path. The actions are not idempotent so only requests that were never sent are retried.
+        Args:
+            path (str): The admin path e.g. admin/reboot.
+        Returns:
+            (str): The response text.
+        """
+        url = f"http://{self._hostname}/{path}"
+
+        async def post() -> str:
+            await asyncio.sleep(self._throttle(url))
+
+            async with self._session() as session:
+                async with session.post(
+                    url,
+                    headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"},
+                    timeout=self._retry_policy.client_timeout,
+                ) as response:
+                    return await response.text()
+
+        return await self._retry_policy.retry(post, retryable=UNSENT_ERRORS, logger=self.logger)()
+
+    async def reboot(self) -> Optional[BobcatRecovery]:
+        """Reboot the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the reboot was skipped.
+        """
+        if self._dry_run:
+            self.logger.warning("Dry Run: Reboot Skipped")
+        else:
+            self.logger.warning("Rebooting Bobcat")
+            self.logger.debug(self._parse_html(await self._post("admin/reboot")))
+            return await self._recover("Reboot", goes_down=True)
+
+    async def reset(self) -> Optional[BobcatRecovery]:
+        """Reset the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the reset was skipped.
+        """
+        if self._dry_run:
+            self.logger.warning("Dry Run: Reset Skipped")
+        else:
+            self.logger.warning("Resetting Bobcat")
+            self.logger.debug(self._parse_html(await self._post("admin/reset")))
+            return await self._recover("Reset")
+
+    async def resync(self) -> Optional[BobcatRecovery]:
+        """Resync the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the resync was skipped.
+        """
+        if self._dry_run:
+            self.logger.warning("Dry Run: Resync Skipped")
+        else:
+            self.logger.warning("Resyncing Bobcat")
+            self.logger.debug(self._parse_html(await self._post("admin/resync")))
+            return await self._recover("Resync")
+
+    async def fastsync(self) -> Optional[BobcatRecovery]:
+        """Fastsync the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the fastsync was skipped.
+        """
+        if self._dry_run:
+            self.logger.warning("Dry Run: Fastsync Skipped")
+        else:
+            await self.refresh(status=True, miner=True, temp=False, speed=False, dig=False)
+
+            if not self._can_fastsync():
+                return
+
+            self.logger.warning("Fastsyncing Bobcat")
+            self.logger.debug(self._parse_html(await self._post("admin/fastsync")))
+            return await self._recover("Fastsync")
+
+    async def _recover(self, action: str, goes_down: bool = False) -> BobcatRecovery:
+        """Track the Bobcat through the action phases. An action that takes the Bobcat down is watched at a fine interval until it goes down, and tracking stops when it never does. Then the Bobcat is polled until the miner is running again.
+        Args:
+            action (str): The action name e.g. Reboot.
+            goes_down (bool, optional): Whether the action takes the Bobcat down e.g. a reboot. The other actions only restart the miner so the diagnoser stays up. Defaults to False.
+        Returns:
+            (BobcatRecovery): The action phases with the time they were first seen.
+        """
+        recovery = self._start_recovery(action)
+
+        if goes_down:
+            for interval in self._down_watch(recovery):
+                await self.wait(interval)
+
+                if not (await self.ping()).reachable:
+                    recovery.record(UNREACHABLE)
+
+            if not recovery.went_down:
+                return self._stop_recovery(recovery)
+
+        poller = self._polling_policy.start()
+        await self.wait_for_connection(poller=poller)
+        recovery.record(REACHABLE)
+
+        return self._finish_recovery(recovery, await self.wait_until_running(poller=poller))
+
+    async def wait(self, duration) -> None:
+        """Wait without blocking the event loop.
+
+        Args:
+            duration (int, optional): An arbitrary duration of time to wait.
+        """
+        await asyncio.sleep(self._wait_duration(duration))
+
+    async def wait_for_connection(
+        self,
+        backoff_duration: float = None,
+        max_attempts: int = None,
+        poller: BobcatPoller = None,
+    ) -> None:
+        """Wait for a Bobcat connection. The interval between connection attempts grows until the polling deadline.
+
+        Args:
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+            poller (BobcatPoller, optional): The poller for the intervals. Defaults to starting the polling policy.
+        Raises:
+            BobcatConnectionError: Unable to connect before the polling deadline.
+        """
+        poller = self._start_polling(poller, backoff_duration, max_attempts)
+
+        while not (await self.ping()).reachable:
+            await self.wait(self._next_connection_attempt(poller))
+
+    async def wait_until_running(
+        self,
+        backoff_duration: float = None,
+        max_attempts: int = None,
+        poller: BobcatPoller = None,
+    ) -> bool:
+        """Wait until the Bobcat is running. The status is polled again as soon as the interval passes and polling stops when the miner is running. Failed refreshes are polled again until the polling deadline.
+
+        Args:
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+            poller (BobcatPoller, optional): The poller for the intervals. Defaults to starting the polling policy.
+        Returns:
+            (bool): Whether the Bobcat is running before the polling deadline.
+        """
+        poller = self._start_polling(poller, backoff_duration, max_attempts)
+
+        while not await self._is_running():
+            interval = self._next_running_check(poller)
+            if interval is None:
+                return False
+
+            await self.wait(interval)
+
+        return True
+
+    async def _is_running(self) -> bool:
+        """Refresh the status and miner data and check whether the miner is running. A refresh that fails while the miner is still booting counts as not running.
+        Returns:
+            (bool): Whether the miner is running.
+        """
+        try:
+            await self.refresh(status=True, miner=True, temp=False, speed=False, dig=False)
+        except BobcatRefreshError:
+            return False
+
+        return self.miner_state.lower() == "running"
+
+    async def heartbeat(self, backoff_duration: float = None, max_attempts: int = None) -> bool:
+        """Heartbeat check for a Bobcat. Checks connection and running status with one shared polling deadline (one hour by default).
+
+        Args:
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+        Returns:
+            (bool): Whether the Bobcat is running before the polling deadline.
+        Raises:
+            BobcatConnectionError: Unable to connect before the polling deadline.
+        """
+        poller = self._start_polling(None, backoff_duration, max_attempts)
+        await self.wait_for_connection(poller=poller)
+        running = await self.wait_until_running(poller=poller)
+        self._log_reconnected(running)
+        return running
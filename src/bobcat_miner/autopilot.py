@@ -121,6 +121,9 @@ class BobcatAutopilot(Bobcat):
             lock.acquire()
             self.bobcat.logger.debug(f"Lock Acquired: {self.lock_file}")
 
+            # the speed test runs while the other checks run instead of blocking the network check
+            self.bobcat.start_speed_worker()
+
             OnlineStatusCheck(self.bobcat, self.verbose).check()
 
             for check in self.error_checks:
@@ -153,6 +156,9 @@ class BobcatAutopilot(Bobcat):
             sys.exit(1)  # 👋
 
         finally:
+            # an unfinished speed test is abandoned rather than delaying the exit
+            self.bobcat.stop_speed_worker(timeout=0)
+
             lock.release()
             self.bobcat.logger.debug(f"Lock Released: {self.lock_file}")
 
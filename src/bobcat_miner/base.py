@@ -1,12 +1,55 @@
 from __future__ import annotations
 
+from typing import Any, Iterator, Optional
+
+import dataclasses
 import json
 import os
+import random
+import warnings
 
 try:
-    from logger import BobcatLogger
+    from logger import BobcatLogger, BobcatTraceDescription
+except:
+    from .logger import BobcatLogger, BobcatTraceDescription
+try:
+    from neighbors import ArpTableNeighborSource
+except:
+    from .neighbors import ArpTableNeighborSource
+try:
+    from polling import (
+        ACCEPTED,
+        RUNNING,
+        SYNCED,
+        BobcatPoller,
+        BobcatPollingPolicy,
+        BobcatRecovery,
+    )
+except:
+    from .polling import (
+        ACCEPTED,
+        RUNNING,
+        SYNCED,
+        BobcatPoller,
+        BobcatPollingPolicy,
+        BobcatRecovery,
+    )
+try:
+    from ratelimit import BobcatRateLimiter
+except:
+    from .ratelimit import BobcatRateLimiter
+try:
+    from retry import BobcatRetryPolicy
+except:
+    from .retry import BobcatRetryPolicy
+try:
+    from errors import *
+except:
+    from .errors import *
+try:
+    from constants import *
 except:
-    from .logger import BobcatLogger
+    from .constants import *
 
 
 class BobcatBase:
@@ -18,7 +61,45 @@ class BobcatBase:
         self._animal = kwargs.pop("animal", None)
         self._dry_run = kwargs.pop("dry_run", None)
         self._no_wait = kwargs.pop("no_wait", None)
+        self._discover = kwargs.pop("discover", True)
         self._trace = kwargs.pop("trace", False)
+        self._trace_max_length = kwargs.pop("trace_max_length", None)
+        self._trace_sample_rate = kwargs.pop("trace_sample_rate", 1.0)
+        self._search_concurrency = kwargs.pop("search_concurrency", 256)
+        self._http_pool_size = kwargs.pop("http_pool_size", 5)  # one connection per endpoint
+        self._discovery_cache_file = kwargs.pop("discovery_cache_file", None)
+        self._discovery_cache_ttl = kwargs.pop("discovery_cache_ttl", ONE_DAY)
+        self._neighbor_source = kwargs.pop("neighbor_source", ArpTableNeighborSource())
+        self._rate_limiter = kwargs.pop("rate_limiter", BobcatRateLimiter())
+        self._rate_limit_max_attempts = kwargs.pop("rate_limit_max_attempts", 3)
+        self._rate_limit_backoff = kwargs.pop("rate_limit_backoff", THIRTY_SECONDS)
+        self._cache_ttls = kwargs.pop("cache_ttls", None)
+
+        # the retry policy can be passed whole or built from the individual CLI options
+        retry_policy_kwargs = {
+            key: kwargs.pop(key)
+            for key in [
+                "connect_timeout",
+                "read_timeout",
+                "max_attempts",
+                "backoff_factor",
+                "backoff_max",
+            ]
+            if kwargs.get(key) is not None
+        }
+        self._retry_policy = kwargs.pop("retry_policy", BobcatRetryPolicy(**retry_policy_kwargs))
+
+        # the polling policy can be passed whole or built from the recovery deadline CLI option
+        recovery_deadline = kwargs.pop("recovery_deadline", None)
+        self._polling_policy = kwargs.pop(
+            "polling_policy",
+            (
+                BobcatPollingPolicy(deadline=recovery_deadline)
+                if recovery_deadline is not None
+                else BobcatPollingPolicy()
+            ),
+        )
+        self._last_recovery = None
         self._networks = kwargs.pop(
             "networks",
             [
@@ -45,3 +126,224 @@ class BobcatBase:
         self._temp_data = {}
         self._speed_data = {}
         self._dig_data = {}
+        self._snapshots = {}
+
+    def _trace_description(self, data: Any) -> Optional[BobcatTraceDescription]:
+        """Get the trace log description for the data. Only a `trace_sample_rate` fraction of the data is traced.
+        Args:
+            data (Any): The traced data e.g. the refreshed endpoint data.
+        Returns:
+            (BobcatTraceDescription, None): The lazy description or None when tracing is off or the data was not sampled.
+        """
+        if not self._trace or random.random() >= self._trace_sample_rate:
+            return None
+
+        return BobcatTraceDescription(data, self._trace_max_length)
+
+    def last_recovery(self) -> Optional[BobcatRecovery]:
+        """Get the recovery after the last action e.g. a reboot.
+        Returns:
+            (BobcatRecovery, None): The recovery or None when no action has run.
+        """
+        return self._last_recovery
+
+    @property
+    def _name(self) -> str:
+        """Get the name of the Bobcat for the logs.
+        Returns:
+            (str): The hostname.
+        """
+        return self._hostname
+
+    def _wait_duration(self, duration: float) -> float:
+        """Log a wait and get how long to wait for. The wait is cut to one second with `no_wait`.
+        Args:
+            duration (float): The seconds to wait.
+        Returns:
+            (float): The seconds to wait.
+        """
+        if self._no_wait:
+            duration = 1
+
+        self.logger.debug(f"Waiting for {self._format_duration(duration)} ⏳")
+        return duration
+
+    def _start_polling(
+        self,
+        poller: Optional[BobcatPoller],
+        backoff_duration: Optional[float],
+        max_attempts: Optional[int],
+    ) -> BobcatPoller:
+        """Get the poller for a wait. The deprecated `backoff_duration` and `max_attempts` arguments are mapped onto the polling policy with a fixed interval.
+        Args:
+            poller (BobcatPoller, None): The poller for the intervals. Defaults to starting the polling policy.
+            backoff_duration (float, None): Deprecated. The seconds to wait between attempts. Defaults to FIVE_MINUTES.
+            max_attempts (int, None): Deprecated. The max number of attempts before giving up. Defaults to 12 attempts.
+        Returns:
+            (BobcatPoller): The poller for the intervals.
+        """
+        if backoff_duration is None and max_attempts is None:
+            return poller or self._polling_policy.start()
+
+        warnings.warn(
+            "The backoff_duration and max_attempts arguments are deprecated. Pass a polling_policy to the Bobcat instead.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        backoff_duration = FIVE_MINUTES if backoff_duration is None else backoff_duration
+        max_attempts = 12 if max_attempts is None else max_attempts
+
+        return dataclasses.replace(
+            self._polling_policy,
+            initial_interval=backoff_duration,
+            growth=1.0,
+            max_interval=backoff_duration,
+            deadline=backoff_duration * max_attempts,
+        ).start()
+
+    def _can_fastsync(self) -> bool:
+        """Check whether the Bobcat can be fastsynced. The status data must be refreshed first.
+        Returns:
+            (bool): Whether the gap is larger than 400 and the Bobcat is healthy.
+        """
+        if not isinstance(self.gap, int):
+            self.logger.error(
+                f"Cancelling the Fastsync. Unable to read the blockchain gap ({self.gap})"
+            )
+            return False
+
+        if self.gap <= 400:
+            self.logger.warning(
+                f"Cancelling Fastsync because it only works when the gap is larger than 400. The current gap is: {self.gap}"
+            )
+            return False
+
+        if not self.is_healthy:
+            self.logger.warning(
+                f"Cancelling Fastsync because it can only be run on a healthy Bobcat. The current status is: {self.status}"
+            )
+            return False
+
+        return True
+
+    def _start_recovery(self, action: str) -> BobcatRecovery:
+        """Start tracking an action that the Bobcat accepted.
+        Args:
+            action (str): The action name e.g. Reboot.
+        Returns:
+            (BobcatRecovery): The recovery with the accepted phase.
+        """
+        recovery = BobcatRecovery(action=action)
+        recovery.record(ACCEPTED)
+        return recovery
+
+    def _down_watch(self, recovery: BobcatRecovery) -> Iterator[float]:
+        """Get the intervals between the checks for the Bobcat going down after an action. The watch ends once the caller records the unreachable phase.
+        Args:
+            recovery (BobcatRecovery): The recovery of the action.
+        Returns:
+            (Iterator[float]): The seconds to wait before each check.
+        """
+        down_watch = self._polling_policy.start_down_watch()
+        while (interval := down_watch.next_interval()) is not None:
+            yield interval
+
+            if recovery.went_down:
+                return
+
+        self.logger.warning(
+            f"The Bobcat ({self._name}) did not go down after the {recovery.action}"
+        )
+
+    def _next_connection_attempt(self, poller: BobcatPoller) -> float:
+        """Log the unreachable Bobcat and get the interval before the next connection attempt.
+        Args:
+            poller (BobcatPoller): The poller for the intervals.
+        Returns:
+            (float): The seconds to wait before the next connection attempt.
+        Raises:
+            BobcatConnectionError: Unable to connect before the polling deadline.
+        """
+        self.logger.warning(f"The Bobcat ({self._name}) is unreachable")
+
+        interval = poller.next_interval()
+        if interval is None:
+            raise BobcatConnectionError(
+                f"Waited for {self._format_duration(poller.elapsed)} and still cannot connect to {self._hostname}"
+            )
+
+        return interval
+
+    def _next_running_check(self, poller: BobcatPoller) -> Optional[float]:
+        """Log the Bobcat that is not running and get the interval before the next status check.
+        Args:
+            poller (BobcatPoller): The poller for the intervals.
+        Returns:
+            (float, None): The seconds to wait before the next status check or None when the polling deadline has passed.
+        """
+        self.logger.warning(f"The Bobcat ({self._name}) is not running")
+
+        interval = poller.next_interval()
+        if interval is None:
+            self.logger.warning(
+                f"Waited for {self._format_duration(poller.elapsed)} and still not running"
+            )
+
+        return interval
+
+    def _stop_recovery(self, recovery: BobcatRecovery) -> BobcatRecovery:
+        """Stop tracking an action that never took the Bobcat down. The action was likely ignored and the miner state is still from before it, so no later phase is recorded.
+        Args:
+            recovery (BobcatRecovery): The recovery of the action.
+        Returns:
+            (BobcatRecovery): The action phases with the time they were first seen.
+        """
+        self._last_recovery = recovery
+        self.logger.debug(f"Recovery: {recovery}")
+        return recovery
+
+    def _finish_recovery(self, recovery: BobcatRecovery, running: bool) -> BobcatRecovery:
+        """Record the last phases of an action once the Bobcat is reachable again.
+        Args:
+            recovery (BobcatRecovery): The recovery of the action.
+            running (bool): Whether the miner is running before the polling deadline.
+        Returns:
+            (BobcatRecovery): The action phases with the time they were first seen.
+        """
+        if running:
+            recovery.record(RUNNING)
+
+            if self.status == "Synced":
+                recovery.record(SYNCED)
+
+        self._last_recovery = recovery
+        self._log_reconnected(running)
+        self.logger.debug(f"Recovery: {recovery}")
+        return recovery
+
+    def _log_reconnected(self, running: bool) -> None:
+        """Log the Bobcat that is reachable again. It only counts as reconnected once the miner is running.
+        Args:
+            running (bool): Whether the miner is running before the polling deadline.
+        """
+        if running:
+            self.logger.info(f"Reconnected to the Bobcat ({self._name})")
+        else:
+            self.logger.warning(
+                f"The Bobcat ({self._name}) is reachable but the miner is not running"
+            )
+
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
+        """Format a duration for the logs e.g. 5 Minutes or 30 Seconds.
+        Args:
+            seconds (float): The duration in seconds.
+        Returns:
+            (str): The duration in whole minutes, or whole seconds when it is less than a minute.
+        """
+        value, unit = (
+            (int(seconds / ONE_MINUTE), "Minute")
+            if seconds >= ONE_MINUTE
+            else (int(seconds), "Second")
+        )
+        return f"{value} {unit}{'' if value == 1 else 's'}"
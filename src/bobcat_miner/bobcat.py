@@ -1,5 +1,6 @@
-from typing import List
-from bs4 import BeautifulSoup
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from typing import List, Optional
 
 import time
 import sys
@@ -8,6 +9,14 @@ try:
     from api import BobcatAPI
 except:
     from .api import BobcatAPI
+try:
+    from polling import REACHABLE, UNREACHABLE, BobcatPoller, BobcatRecovery
+except:
+    from .polling import REACHABLE, UNREACHABLE, BobcatPoller, BobcatRecovery
+try:
+    from snapshot import SNAPSHOTS, BobcatSnapshot
+except:
+    from .snapshot import SNAPSHOTS, BobcatSnapshot
 try:
     from constants import *
 except:
@@ -18,250 +27,255 @@ except:
     from .errors import *
 
 
-class Bobcat(BobcatAPI):
-    """A class for the Bobcat miner."""
+class BobcatHTMLText(HTMLParser):
+    """A class for extracting the text from the short `<br>` separated HTML action responses."""
 
-    def __init__(self, *args, **kwargs) -> None:
+    # the text inside these tags is not part of the response text
+    IGNORED_TAGS = ("script", "style", "template")
 
-        try:
-            super().__init__(*args, **kwargs)
+    def __init__(self) -> None:
+        """The Bobcat HTML Text constructor."""
+        super().__init__(convert_charrefs=True)
+        self.strings = []
+        self._ignored = 0
 
-        except BobcatSearchNetworkError as err:
-            self.logger.critical(str(err))
-            sys.exit(1)  # 👋
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        if tag in self.IGNORED_TAGS:
+            self._ignored += 1
 
-        except (BobcatConnectionError, BobcatVerificationError, BobcatNotFoundError) as err:
-            msg = "\n".join(
-                [
-                    f"{err}",
-                    "   Please verify the IP address and network connection",
-                    "   Troubleshooting Guide: https://bobcatminer.zendesk.com/hc/en-us/articles/4412905935131-How-to-Access-the-Diagnoser",
-                ]
-            )
-            self.logger.critical(msg)
-            sys.exit(1)  # 👋
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.IGNORED_TAGS and self._ignored:
+            self._ignored -= 1
 
-        except Exception as err:
-            self.logger.exception(f"An unexpected error has occurred: {str(err)}")
-            sys.exit(1)  # 👋
+    def handle_data(self, data: str) -> None:
+        if data and not self._ignored:
+            self.strings.append(data)
+
+    def get_text(self, html: str, separator: str = "\n") -> str:
+        """Get the text of the HTML.
+        Args:
+            html (str): The HTML to be parsed.
+            separator (str, optional): The separator between the text strings. Defaults to a newline.
+        Returns:
+            (str): The text strings joined by the separator.
+        """
+        self.feed(html)
+        self.close()
+        return separator.join(self.strings)
+
+
+class BobcatAttributes(ABC):
+    """An abstract mixin class for the parsed Bobcat attributes. The `_autorefresh` hook is called before the endpoint data is parsed."""
+
+    @abstractmethod
+    def _autorefresh(self, endpoint: str) -> None:
+        """Refresh the endpoint data before it is parsed when it is missing or stale.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        """
+        raise NotImplementedError
+
+    def _snapshot(self, endpoint: str) -> BobcatSnapshot:
+        """Get the snapshot of the endpoint data. The snapshot is parsed once and reused until a refresh replaces the data.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Returns:
+            (BobcatSnapshot): The parsed endpoint data.
+        """
+        self._autorefresh(endpoint)
+        data = getattr(self, f"_{endpoint}_data")
+
+        snapshot = self._snapshots.get(endpoint)
+        if snapshot is None or snapshot.raw is not data:
+            snapshot = self._snapshots[endpoint] = SNAPSHOTS[endpoint](data)
+
+        return snapshot
 
     @property
     def status(self):
         """Get status."""
-        if not self._status_data:
-            self.refresh_status()
-        return self._status_data.get("status")
+        return self._snapshot("status").status
 
     @property
     def gap(self):
         """Get gap."""
-        if not self._status_data:
-            self.refresh_status()
-        gap = self._status_data.get("gap")
-        return int(gap) if gap.lstrip("-").isdigit() else gap
+        return self._snapshot("status").gap
 
     @property
     def blockchain_height(self):
         """Get blockchain height."""
-        if not self._status_data:
-            self.refresh_status()
-        blockchain_height = self._status_data.get("blockchain_height")
-        return (
-            int(blockchain_height) if blockchain_height.lstrip("-").isdigit() else blockchain_height
-        )
+        return self._snapshot("status").blockchain_height
 
     @property
     def epoch(self):
         """Get epoch."""
-        if not self._status_data:
-            self.refresh_status()
-        epoch = self._status_data.get("epoch")
-        return int(epoch) if epoch.lstrip("-").isdigit() else epoch
+        return self._snapshot("status").epoch
 
     @property
     def tip(self):
         """Get tip. Only available during error state."""
-        if not self._status_data:
-            self.refresh_status()
-        return self._status_data.get("tip")
+        return self._snapshot("status").tip
 
     @property
     def ota_version(self):
         """Get OTA version."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("ota_version")
+        return self._snapshot("miner").ota_version
 
     @property
     def region(self):
         """Get region."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("region")
+        return self._snapshot("miner").region
 
     @property
     def frequency_plan(self):
         """Get frequency plan."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("frequency_plan")
+        return self._snapshot("miner").frequency_plan
 
     @property
     def animal(self):
         """Get animal."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("animal")
+        return self._snapshot("miner").animal
 
     @property
     def helium_animal(self):
         """Get animal in Helium format."""
-        return " ".join([word.capitalize() for word in self.animal.split("-")])
+        return self._snapshot("miner").helium_animal
 
     @property
     def pubkey(self):
         """Get pubic key."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("pubkey")
+        return self._snapshot("miner").pubkey
 
     @property
     def miner_state(self):
         """Get miner state."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return str(self._miner_data.get("miner", {}).get("State"))
+        return self._snapshot("miner").miner_state
 
     @property
     def miner_status(self):
         """Get miner status."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner", {}).get("Status")
+        return self._snapshot("miner").miner_status
 
     @property
     def miner_height(self):
         """Get miner height."""
-        if not self._status_data:
-            self.refresh_status()
-        miner_height = self._status_data.get("miner_height")
-        return int(miner_height) if miner_height.lstrip("-").isdigit() else miner_height
+        return self._snapshot("status").miner_height
 
     @property
     def miner_alert(self):
         """Get miner status."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner_alert", None)
+        return self._snapshot("miner").miner_alert
 
     @property
     def miner_desc(self):
         """Get miner status."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner_desc", {})
+        return self._snapshot("miner").miner_desc
 
     @property
     def names(self):
         """Get miner names."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner", {}).get("Names")
+        return self._snapshot("miner").names
 
     @property
     def image(self):
         """Get miner image."""
         # https://bobcatminer.zendesk.com/hc/en-us/articles/4413004080667-Access-Diagnoser-Check-OTA-Version
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner", {}).get("Image")
+        return self._snapshot("miner").image
 
     @property
     def created(self):
         """Get miner created."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("miner", {}).get("Created")
+        return self._snapshot("miner").created
 
     @property
     def p2p_status(self):
         """Get p2p status."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return "\n".join(self._miner_data.get("p2p_status"))
+        return self._snapshot("miner").p2p_status
 
     @property
     def ports_desc(self):
         """Get port description."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("ports_desc")
+        return self._snapshot("miner").ports_desc
 
     @property
     def ports(self):
         """Get ports."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("ports", {})
+        return self._snapshot("miner").ports
 
     @property
     def private_ip(self):
         """Get private ip."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("private_ip")
+        return self._snapshot("miner").private_ip
 
     @property
     def public_ip(self):
         """Get public ip."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("public_ip")
+        return self._snapshot("miner").public_ip
 
     @property
     def peerbook(self):
         """Get peerbook."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return "\n".join(self._miner_data.get("peerbook", []))
+        return self._snapshot("miner").peerbook
+
+    @property
+    def connected(self):
+        """Get whether the miner is connected to the p2p network."""
+        return self._snapshot("miner").connected
+
+    @property
+    def dialable(self):
+        """Get whether the miner is dialable on the p2p network."""
+        return self._snapshot("miner").dialable
+
+    @property
+    def nat_type(self):
+        """Get the nat type e.g. none, symmetric, restricted or unknown."""
+        return self._snapshot("miner").nat_type
+
+    @property
+    def p2p_height(self):
+        """Get the p2p status height."""
+        return self._snapshot("miner").p2p_height
+
+    @property
+    def listen_addrs(self):
+        """Get the prioritized peerbook listen addresses."""
+        return self._snapshot("miner").listen_addrs
+
+    @property
+    def sessions(self):
+        """Get the peerbook sessions."""
+        return self._snapshot("miner").sessions
 
     @property
     def timestamp(self):
         """Get timestamp."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("timestamp")
+        return self._snapshot("miner").timestamp
 
     @property
     def error(self):
         """Get error."""
-        if not self._miner_data:
-            self.refresh_miner()
-        return self._miner_data.get("error", None)
+        return self._snapshot("miner").error
 
     @property
     def temp0(self):
         """Get CPU temp sensor 0 Celsius."""
-        if not self._temp_data:
-            self.refresh_temp()
-        return int(self._temp_data.get("temp0"))
+        return self._snapshot("temp").temp0
 
     @property
     def temp1(self):
         """Get CPU temp sensor 1 in Celsius."""
-        if not self._temp_data:
-            self.refresh_temp()
-        return int(self._temp_data.get("temp1"))
+        return self._snapshot("temp").temp1
 
     @property
     def coldest_temp(self):
         """Get the lowest of the CPU temp from the two sensors."""
-        return self.temp0 if self.temp0 < self.temp1 else self.temp1
+        return self._snapshot("temp").coldest_temp
 
     @property
     def hottest_temp(self):
         """Get the highest of the CPU temp from the two sensors."""
-        return self.temp0 if self.temp0 > self.temp1 else self.temp1
+        return self._snapshot("temp").hottest_temp
 
     @property
     def temp0_c(self):
@@ -276,61 +290,47 @@ class Bobcat(BobcatAPI):
     @property
     def temp0_f(self):
         """Get CPU temp sensor 0 Fahrenheit."""
-        return round(self.temp0 * 1.8 + 32, 1)
+        return self._snapshot("temp").temp0_f
 
     @property
     def temp1_f(self):
         """Get CPU temp sensor 1 in Fahrenheit."""
-        return round(self.temp1 * 1.8 + 32, 1)
+        return self._snapshot("temp").temp1_f
 
     @property
     def download_speed(self):
         """Get download speed."""
-        if not self._speed_data:
-            self.refresh_speed()
-        return self._speed_data.get("DownloadSpeed")
+        return self._snapshot("speed").download_speed
 
     @property
     def upload_speed(self):
         """Get upload speed."""
-        if not self._speed_data:
-            self.refresh_speed()
-        return self._speed_data.get("UploadSpeed")
+        return self._snapshot("speed").upload_speed
 
     @property
     def latency(self):
         """Get latency."""
-        if not self._speed_data:
-            self.refresh_speed()
-        return self._speed_data.get("Latency")
+        return self._snapshot("speed").latency
 
     @property
     def dig_name(self):
         """Get dig name."""
-        if not self._dig_data:
-            self.refresh_dig()
-        return self._dig_data.get("name")
+        return self._snapshot("dig").name
 
     @property
     def dig_message(self):
         """Get dig message."""
-        if not self._dig_data:
-            self.refresh_dig()
-        return self._dig_data.get("message")
+        return self._snapshot("dig").message
 
     @property
     def dig_dns(self):
         """Get dig DNS."""
-        if not self._dig_data:
-            self.refresh_dig()
-        return self._dig_data.get("DNS")
+        return self._snapshot("dig").dns
 
     @property
     def dig_records(self):
         """Get dig records."""
-        if not self._dig_data:
-            self.refresh_dig()
-        return self._dig_data.get("records", [])
+        return self._snapshot("dig").records
 
     @property
     def is_healthy(self):
@@ -348,64 +348,125 @@ class Bobcat(BobcatAPI):
         Returns:
             (str): The parsed HTML response payload.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.get_text(separator="\n")
+        return BobcatHTMLText().get_text(html, separator="\n")
+
+
+class Bobcat(BobcatAttributes, BobcatAPI):
+    """A class for the Bobcat miner."""
+
+    def __init__(self, *args, **kwargs) -> None:
+
+        try:
+            super().__init__(*args, **kwargs)
+
+        except BobcatSearchNetworkError as err:
+            self.logger.critical(str(err))
+            sys.exit(1)  # 👋
+
+        except (BobcatConnectionError, BobcatVerificationError, BobcatNotFoundError) as err:
+            msg = "\n".join(
+                [
+                    f"{err}",
+                    "   Please verify the IP address and network connection",
+                    "   Troubleshooting Guide: https://bobcatminer.zendesk.com/hc/en-us/articles/4412905935131-How-to-Access-the-Diagnoser",
+                ]
+            )
+            self.logger.critical(msg)
+            sys.exit(1)  # 👋
+
+        except Exception as err:
+            self.logger.exception(f"An unexpected error has occurred: {str(err)}")
+            sys.exit(1)  # 👋
+
+    @property
+    def _name(self) -> str:
+        """Get the name of the Bobcat for the logs.
+        Returns:
+            (str): The animal name.
+        """
+        return self.animal
 
-    def reboot(self) -> None:
-        """Reboot the Bobcat and wait."""
+    def _autorefresh(self, endpoint: str) -> None:
+        """Refresh the endpoint data before it is parsed. Missing data is refreshed and stale data is refreshed in the background.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        """
+        self._refresh_cached(endpoint)
+
+    def reboot(self) -> Optional[BobcatRecovery]:
+        """Reboot the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the reboot was skipped.
+        """
         if self._dry_run:
             self.logger.warning("Dry Run: Reboot Skipped")
         else:
             self.logger.debug(self._parse_html(self._BobcatAPI__reboot().text))
-            self.wait(FIVE_MINUTES)
-            self.heartbeat()
+            return self._recover("Reboot", goes_down=True)
 
-    def reset(self) -> None:
-        """Reset the Bobcat and wait."""
+    def reset(self) -> Optional[BobcatRecovery]:
+        """Reset the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the reset was skipped.
+        """
         if self._dry_run:
             self.logger.warning("Dry Run: Reset Skipped")
         else:
             self.logger.debug(self._parse_html(self._BobcatAPI__reset().text))
-            self.wait(FIVE_MINUTES)
-            self.heartbeat()
+            return self._recover("Reset")
 
-    def resync(self) -> None:
-        """Resync the Bobcat and wait."""
+    def resync(self) -> Optional[BobcatRecovery]:
+        """Resync the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the resync was skipped.
+        """
         if self._dry_run:
             self.logger.warning("Dry Run: Resync Skipped")
         else:
             self.logger.debug(self._parse_html(self._BobcatAPI__resync().text))
-            self.wait(FIVE_MINUTES)
-            self.heartbeat()
+            return self._recover("Resync")
 
-    def fastsync(self) -> None:
-        """Fastsync the Bobcat and wait."""
+    def fastsync(self) -> Optional[BobcatRecovery]:
+        """Fastsync the Bobcat and track it until the miner is running again.
+        Returns:
+            (BobcatRecovery, None): The action phases or None when the fastsync was skipped.
+        """
         if self._dry_run:
             self.logger.warning("Dry Run: Fastsync Skipped")
         else:
             self.refresh_status()
 
-            if not isinstance(self.gap, int):
-                self.logger.error(
-                    f"Cancelling the Fastsync. Unable to read the blockchain gap ({self.gap})"
-                )
+            if not self._can_fastsync():
                 return
 
-            if self.gap <= 400:
-                self.logger.warning(
-                    f"Cancelling Fastsync because it only works when the gap is larger than 400. The current gap is: {self.gap}"
-                )
-                return
+            self.logger.debug(self._parse_html(self._BobcatAPI__fastsync().text))
+            return self._recover("Fastsync")
 
-            if not self.is_healthy:
-                self.logger.warning(
-                    f"Cancelling Fastsync because it can only be run on a healthy Bobcat. The current status is: {self.status}"
-                )
-                return
+    def _recover(self, action: str, goes_down: bool = False) -> BobcatRecovery:
+        """Track the Bobcat through the action phases. An action that takes the Bobcat down is watched at a fine interval until it goes down, and tracking stops when it never does. Then the Bobcat is polled until the miner is running again.
+        Args:
+            action (str): The action name e.g. Reboot.
+            goes_down (bool, optional): Whether the action takes the Bobcat down e.g. a reboot. The other actions only restart the miner so the diagnoser stays up. Defaults to False.
+        Returns:
+            (BobcatRecovery): The action phases with the time they were first seen.
+        """
+        recovery = self._start_recovery(action)
 
-            self.logger.debug(self._parse_html(self._BobcatAPI__fastsync().text))
-            self.wait(FIVE_MINUTES)
-            self.heartbeat()
+        if goes_down:
+            for interval in self._down_watch(recovery):
+                self.wait(interval)
+
+                if not self.can_connect():
+                    recovery.record(UNREACHABLE)
+
+            if not recovery.went_down:
+                return self._stop_recovery(recovery)
+
+        poller = self._polling_policy.start()
+        self.wait_for_connection(poller=poller)
+        recovery.record(REACHABLE)
+
+        return self._finish_recovery(recovery, self.wait_until_running(poller=poller))
 
     def wait(self, duration) -> None:
         """Wait.
@@ -413,76 +474,79 @@ class Bobcat(BobcatAPI):
         Args:
             duration (int, optional): An arbitrary duration of time to wait.
         """
-        if self._no_wait:
-            duration = 1
+        time.sleep(self._wait_duration(duration))
 
-        self.logger.debug(f"Waiting for {int(duration / 60)} Minutes ⏳")
-        time.sleep(duration)
-
-    def wait_for_connection(self, backoff_duration: int, max_attempts: int) -> None:
-        """Wait for a Bobcat connection.
+    def wait_for_connection(
+        self,
+        backoff_duration: float = None,
+        max_attempts: int = None,
+        poller: BobcatPoller = None,
+    ) -> None:
+        """Wait for a Bobcat connection. The interval between connection attempts grows until the polling deadline.
 
         Args:
-            backoff_duration int: A backoff duration of time in seconds to wait after connection attempts.
-            max_attempts int: The max number of attempts before giving up.
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+            poller (BobcatPoller, optional): The poller for the intervals. Defaults to starting the polling policy.
+        Raises:
+            BobcatConnectionError: Unable to connect before the polling deadline.
         """
-        if self._no_wait:
-            backoff_duration = 1
+        poller = self._start_polling(poller, backoff_duration, max_attempts)
 
-        attempt_count = 0
         while not self.can_connect():
-            self.logger.warning(f"The Bobcat ({self.animal}) is unreachable")
-
-            self.wait(backoff_duration)
+            self.wait(self._next_connection_attempt(poller))
 
-            attempt_count += 1
-            if attempt_count >= max_attempts:
-                raise BobcatConnectionError(
-                    f"Waited for {int(int(backoff_duration * max_attempts) / 60)} minute{'s' if backoff_duration > 60 else ''} and still cannot connect to {self._hostname}"
-                )
-
-    def wait_until_running(self, backoff_duration: int, max_attempts: int) -> None:
-        """Wait until the Bobcat is running.
+    def wait_until_running(
+        self,
+        backoff_duration: float = None,
+        max_attempts: int = None,
+        poller: BobcatPoller = None,
+    ) -> bool:
+        """Wait until the Bobcat is running. The status is polled again as soon as the interval passes and polling stops when the miner is running. Failed refreshes are polled again until the polling deadline.
 
         Args:
-            backoff_duration int: A backoff duration of time in seconds to wait after status attempts.
-            max_attempts int: The max number of attempts before giving up.
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+            poller (BobcatPoller, optional): The poller for the intervals. Defaults to starting the polling policy.
+        Returns:
+            (bool): Whether the Bobcat is running before the polling deadline.
         """
-        if self._no_wait:
-            backoff_duration = 1
+        poller = self._start_polling(poller, backoff_duration, max_attempts)
 
-        refresh_kwargs = {
-            "status": True,
-            "miner": True,
-            "temp": False,
-            "speed": False,
-            "dig": False,
-        }
-        self.refresh(**refresh_kwargs)
+        while not self._is_running():
+            interval = self._next_running_check(poller)
+            if interval is None:
+                return False
 
-        attempt_count = 0
-        while self.miner_state.lower() != "running":
+            self.wait(interval)
 
-            self.logger.warning(f"The Bobcat ({self.animal}) is not running")
+        return True
 
-            self.wait(backoff_duration)
-
-            attempt_count += 1
-            if attempt_count >= max_attempts:
-                self.logger.warning(
-                    f"Waited for {int(int(backoff_duration * max_attempts) / 60)} minute{'s' if backoff_duration > 60 else ''} and still not running"
-                )
-                break
+    def _is_running(self) -> bool:
+        """Refresh the status and miner data and check whether the miner is running. A refresh that fails while the miner is still booting counts as not running.
+        Returns:
+            (bool): Whether the miner is running.
+        """
+        try:
+            self.refresh(status=True, miner=True, temp=False, speed=False, dig=False)
+        except BobcatRefreshError:
+            return False
 
-            self.refresh(**refresh_kwargs)
+        return self.miner_state.lower() == "running"
 
-    def heartbeat(self, backoff_duration: int = FIVE_MINUTES, max_attempts: int = 12) -> None:
-        """Heartbeat check for a Bobcat. Checks connection and running status. Default total wait time is 1 hour (12 attempts * 5 min).
+    def heartbeat(self, backoff_duration: float = None, max_attempts: int = None) -> bool:
+        """Heartbeat check for a Bobcat. Checks connection and running status with one shared polling deadline (one hour by default).
 
         Args:
-            backoff_duration (int, optional): A backoff duration of time in seconds to wait after connection or status attempts. Defaults to FIVE_MINUTES.
-            max_attempts (int, optional): The max number of attempts before giving up. Defaults to 12 attempts.
+            backoff_duration (float, optional): Deprecated. The seconds to wait between attempts. Use the polling policy instead.
+            max_attempts (int, optional): Deprecated. The max number of attempts before giving up. Use the polling policy instead.
+        Returns:
+            (bool): Whether the Bobcat is running before the polling deadline.
+        Raises:
+            BobcatConnectionError: Unable to connect before the polling deadline.
         """
-        self.wait_for_connection(backoff_duration, max_attempts)
-        self.wait_until_running(backoff_duration, max_attempts)
-        self.logger.info(f"Reconnected to the Bobcat ({self.animal})")
+        poller = self._start_polling(None, backoff_duration, max_attempts)
+        self.wait_for_connection(poller=poller)
+        running = self.wait_until_running(poller=poller)
+        self._log_reconnected(running)
+        return running
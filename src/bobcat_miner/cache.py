@@ -0,0 +1,196 @@
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import os
+import threading
+import time
+
+try:
+    import serialization
+except:
+    from . import serialization
+try:
+    from constants import *
+except:
+    from .constants import *
+
+
+class BobcatDiscoveryCache:
+    """A class for the Bobcat discovery cache. The cache file maps the animal name to the last verified hostname."""
+
+    ANY_ANIMAL = "*"
+
+    def __init__(self, cache_file: str, ttl: int = ONE_DAY) -> None:
+        """The Bobcat Discovery Cache constructor.
+
+        Args:
+            cache_file (str): The discovery cache file path.
+            ttl (int, optional): The time in seconds before a cached hostname expires. Defaults to ONE_DAY.
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+
+    def _key(self, animal: str = None) -> str:
+        """Return the cache key for the animal.
+        Args:
+            animal (str, optional): The normalized animal name. Defaults to any animal.
+        Returns:
+            (str): The cache key.
+        """
+        return animal if animal else self.ANY_ANIMAL
+
+    def _load(self) -> Dict:
+        """Load the discovery cache file.
+        Returns:
+            (Dict): The cache entries. Missing or corrupt cache files are treated as empty.
+        """
+        try:
+            with open(self.cache_file, "r") as f:
+                cache = serialization.load(f)
+        except (OSError, serialization.JSONDecodeError) as err:
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def get(self, animal: str = None) -> (str, None):
+        """Get the cached hostname for the animal.
+        Args:
+            animal (str, optional): The normalized animal name. Defaults to any animal.
+        Returns:
+            (str, None): The cached hostname or None when the entry is missing or expired.
+        """
+        entry = self._load().get(self._key(animal))
+
+        if not isinstance(entry, dict) or time.time() - entry.get("timestamp", 0) > self.ttl:
+            return None
+
+        return entry.get("hostname")
+
+    def set(self, hostname: str, animal: str = None) -> None:
+        """Cache the verified hostname for the animal.
+        Args:
+            hostname (str): The verified hostname.
+            animal (str, optional): The normalized animal name. Defaults to any animal.
+        Raises:
+            OSError: When the cache file cannot be written.
+        """
+        cache = self._load()
+        cache[self._key(animal)] = {"hostname": hostname, "timestamp": time.time()}
+
+        if dirname := os.path.dirname(self.cache_file):
+            os.makedirs(dirname, exist_ok=True)
+
+        # write then rename so concurrent readers never see a partial file
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            serialization.dump(cache, f)
+        os.replace(tmp_file, self.cache_file)
+
+
+@dataclass
+class BobcatCacheStats:
+    """A class for the endpoint cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0  # stale hits that were served while the data was refreshed in the background
+
+
+class BobcatEndpointCache:
+    """A class for the endpoint data freshness. Data older than the endpoint TTL is stale but is still served while it is refreshed in the background."""
+
+    HIT = "hit"
+    STALE = "stale"
+    MISS = "miss"
+
+    # the diagnoser regenerates speed.json with a slow speed test so it is refreshed least often
+    DEFAULT_TTLS = {
+        "status": THIRTY_SECONDS,
+        "miner": ONE_MINUTE,
+        "temp": ONE_MINUTE,
+        "speed": THIRTY_MINUTES,
+        "dig": ONE_HOUR,
+    }
+
+    def __init__(self, ttls: Dict[str, float] = None) -> None:
+        """The Bobcat Endpoint Cache constructor.
+
+        Args:
+            ttls (Dict[str, float], optional): The endpoint name mapped to the time in seconds before its data is stale. Defaults to DEFAULT_TTLS.
+        """
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self._refreshed: Dict[str, float] = {}
+        self._stats: Dict[str, BobcatCacheStats] = defaultdict(BobcatCacheStats)
+        self._lock = threading.Lock()
+
+    def touch(self, endpoint: str) -> None:
+        """Record that the endpoint data was refreshed.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        """
+        with self._lock:
+            self._refreshed[endpoint] = time.monotonic()
+
+    def invalidate(self, endpoint: str = None) -> None:
+        """Forget when the endpoint data was refreshed so the next lookup is a miss.
+        Args:
+            endpoint (str, optional): The endpoint name. Defaults to every endpoint.
+        """
+        with self._lock:
+            if endpoint:
+                self._refreshed.pop(endpoint, None)
+            else:
+                self._refreshed.clear()
+
+    def age(self, endpoint: str) -> Optional[float]:
+        """Get the age of the endpoint data.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Returns:
+            (float, None): The seconds since the endpoint data was refreshed or None when it was never refreshed.
+        """
+        with self._lock:
+            refreshed = self._refreshed.get(endpoint)
+        return None if refreshed is None else time.monotonic() - refreshed
+
+    def lookup(self, endpoint: str) -> str:
+        """Look up the endpoint data freshness and count the hit or miss.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Returns:
+            (str): HIT when the data is fresh, STALE when it is older than the TTL or MISS when it was never refreshed.
+        """
+        age = self.age(endpoint)
+
+        with self._lock:
+            stats = self._stats[endpoint]
+
+            if age is None:
+                stats.misses += 1
+                return self.MISS
+
+            stats.hits += 1
+            if age > self.ttls.get(endpoint, 0):
+                stats.stale += 1
+                return self.STALE
+
+            return self.HIT
+
+    def stats(self, endpoint: str = None) -> BobcatCacheStats:
+        """Get the cache statistics.
+        Args:
+            endpoint (str, optional): The endpoint name. Defaults to the total for every endpoint.
+        Returns:
+            (BobcatCacheStats): A copy of the cache statistics.
+        """
+        with self._lock:
+            if endpoint:
+                return BobcatCacheStats(**vars(self._stats[endpoint]))
+
+            return BobcatCacheStats(
+                hits=sum(stats.hits for stats in self._stats.values()),
+                misses=sum(stats.misses for stats in self._stats.values()),
+                stale=sum(stats.stale for stats in self._stats.values()),
+            )
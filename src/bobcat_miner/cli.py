@@ -1,7 +1,8 @@
+import asyncio
 import click
+import dataclasses
 import logging
 import os
-import json
 import time
 import requests
 
@@ -13,6 +14,14 @@ try:
     from .autopilot import BobcatAutopilot
 except:
     from autopilot import BobcatAutopilot
+try:
+    from . import serialization
+except:
+    import serialization
+try:
+    from .constants import *
+except:
+    from constants import *
 
 
 LOG_LEVELS_CHOICES = ["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -61,6 +70,92 @@ LOG_LEVELS_CHOICES = ["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     show_envvar=True,
     help="The networks used to search for a Bobcat.",
 )
+@click.option(
+    "--search-concurrency",
+    "-sc",
+    default=256,
+    show_default=True,
+    type=click.IntRange(min=1),
+    metavar="NUM",
+    envvar="BOBCAT_SEARCH_CONCURRENCY",
+    show_envvar=True,
+    help="The max number of hosts probed at once while searching for a Bobcat.",
+)
+@click.option(
+    "--discovery-cache-file",
+    "-dc",
+    required=False,
+    type=click.Path(writable=True),
+    envvar="BOBCAT_DISCOVERY_CACHE_FILE",
+    show_envvar=True,
+    help="The discovery cache file path. The last verified Bobcat hostname is tried before searching the networks.",
+)
+@click.option(
+    "--discovery-cache-ttl",
+    "-dt",
+    default=ONE_DAY,
+    show_default=True,
+    type=click.IntRange(min=0),
+    metavar="SECONDS",
+    envvar="BOBCAT_DISCOVERY_CACHE_TTL",
+    show_envvar=True,
+    help="The time in seconds before a cached Bobcat hostname expires.",
+)
+@click.option(
+    "--connect-timeout",
+    "-ct",
+    default=5.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    envvar="BOBCAT_CONNECT_TIMEOUT",
+    show_envvar=True,
+    help="The time in seconds to wait while connecting to the Bobcat.",
+)
+@click.option(
+    "--read-timeout",
+    "-rt",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    envvar="BOBCAT_READ_TIMEOUT",
+    show_envvar=True,
+    help="The time in seconds to wait for the Bobcat to send data.",
+)
+@click.option(
+    "--max-attempts",
+    "-ma",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    metavar="NUM",
+    envvar="BOBCAT_MAX_ATTEMPTS",
+    show_envvar=True,
+    help="The max number of attempts for a request that failed to connect or timed out.",
+)
+@click.option(
+    "--backoff-max",
+    "-bm",
+    default=30.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    metavar="SECONDS",
+    envvar="BOBCAT_BACKOFF_MAX",
+    show_envvar=True,
+    help="The max time in seconds between request attempts.",
+)
+@click.option(
+    "--recovery-deadline",
+    "-rd",
+    default=3600.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    envvar="BOBCAT_RECOVERY_DEADLINE",
+    show_envvar=True,
+    help="The max time in seconds to wait for the Bobcat to recover after an action e.g. a reboot.",
+)
 @click.option(
     "--dry-run",
     "-dr",
@@ -85,6 +180,27 @@ LOG_LEVELS_CHOICES = ["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     show_envvar=True,
     help="Trace logging when Bobcat endpoint data is refreshed.",
 )
+@click.option(
+    "--trace-max-length",
+    "-tm",
+    required=False,
+    type=click.IntRange(min=1),
+    metavar="NUM",
+    envvar="BOBCAT_TRACE_MAX_LENGTH",
+    show_envvar=True,
+    help="The max number of characters of traced data per log event e.g. 4096 for Discord.",
+)
+@click.option(
+    "--trace-sample-rate",
+    "-ts",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0, max=1),
+    metavar="RATE",
+    envvar="BOBCAT_TRACE_SAMPLE_RATE",
+    show_envvar=True,
+    help="The fraction of refreshes that are traced.",
+)
 @click.option(
     "--log-file",
     "-f",
@@ -146,8 +262,12 @@ def cli(*args, **kwargs) -> None:
     # The CLI users should instead adjust the handler's log level e.g. --log-level-console, --log-level-file, and --log-level-discord
     kwargs["log_level"] = "DEBUG"
 
+    ctx.obj["BOBCAT_KWARGS"] = kwargs
+
     # create bobcat instance
-    ctx.obj["BOBCAT"] = Bobcat(**kwargs)
+    # the find sub-command creates its own instance because `bobcat find --all` does not search for a single bobcat
+    if ctx.invoked_subcommand != "find":
+        ctx.obj["BOBCAT"] = Bobcat(**kwargs)
 
 
 @cli.command()
@@ -195,9 +315,28 @@ def autopilot(*args, **kwargs) -> None:
 
 @cli.command()
 @click.pass_context
-def find(ctx) -> None:
+@click.option(
+    "find_all",
+    "--all",
+    "-A",
+    is_flag=True,
+    help="Find every Bobcat miner and print each one as a JSON line as soon as it is verified.",
+)
+def find(ctx, find_all) -> None:
     """Search local network and find the Bobcat miner."""
-    click.echo(ctx.obj["BOBCAT"]._hostname)
+    kwargs = ctx.obj["BOBCAT_KWARGS"]
+
+    if not find_all:
+        click.echo(Bobcat(**kwargs)._hostname)
+        return
+
+    bobcat = Bobcat(discover=False, **kwargs)
+
+    async def echo_all() -> None:
+        async for discovery in bobcat.find_all():
+            click.echo(serialization.dumps(dataclasses.asdict(discovery)))
+
+    asyncio.run(echo_all())
 
 
 @cli.command()
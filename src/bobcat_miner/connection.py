@@ -1,10 +1,30 @@
 from __future__ import annotations
-from typing import Tuple
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 try:
     from base import BobcatBase
 except:
     from .base import BobcatBase
+try:
+    from cache import BobcatDiscoveryCache
+except:
+    from .cache import BobcatDiscoveryCache
+try:
+    from ratelimit import BobcatRateLimitStats
+except:
+    from .ratelimit import BobcatRateLimitStats
+try:
+    from retry import UNSENT_ERRORS
+except:
+    from .retry import UNSENT_ERRORS
+try:
+    import serialization
+except:
+    from . import serialization
 try:
     from errors import *
 except:
@@ -17,20 +37,109 @@ except:
 import aiohttp
 import asyncio
 
-# import backoff
+import hashlib
 import ipaddress
-import json
+import itertools
 import requests
-import socket
+import threading
 import time
+import urllib.parse
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# the refresh logs that are held back during a concurrent refresh
+_deferred_refresh_logs: ContextVar[Optional[List[Tuple[str, Dict]]]] = ContextVar(
+    "deferred_refresh_logs", default=None
+)
+
+
+class BobcatHTTPAdapter(requests.adapters.HTTPAdapter):
+    """A class for the HTTP adapter that applies the retry policy timeout to requests without an explicit timeout."""
+
+    def __init__(self, *args, timeout: Tuple[float, float] = None, **kwargs) -> None:
+        """The Bobcat HTTP Adapter constructor.
+
+        Args:
+            timeout (Tuple[float, float], optional): The default connect and read timeouts in seconds.
+        """
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs) -> requests.Response:
+        return super().send(
+            request, timeout=timeout if timeout is not None else self.timeout, **kwargs
+        )
+
+
+@dataclass
+class BobcatDiscovery:
+    """A class for a Bobcat found in the local network."""
+
+    hostname: str
+    animal: str
+    pubkey: str
+    elapsed: float  # seconds to probe and verify the host
+
+
+@dataclass
+class BobcatPing:
+    """A class for a Bobcat reachability probe result."""
+
+    hostname: str
+    reachable: bool
+    latency: Optional[float]  # seconds to open the TCP connection when reachable
+    error: Optional[str]  # the exception class name when unreachable e.g. TimeoutError
+    timestamp: float
+
+
+@dataclass
+class BobcatHttpStats:
+    """A class for the Bobcat HTTP session statistics."""
+
+    requests: int
+    connections: int  # new TCP connections opened by the session
+    reuse_ratio: float  # fraction of requests sent over a kept-alive connection
 
 
 class BobcatConnection(BobcatBase):
     """A class for Bobcat Connection."""
 
+    # the diagnoser dashboard title is near the top of the page but is followed by many KB of inline CSS and HTML
+    HOMEPAGE_FINGERPRINT_BYTES = 4096
+    HOMEPAGE_CHUNK_SIZE = 1024
+
+    # the number of ping results kept per host
+    PING_HISTORY_SIZE = 20
+
+    # the endpoint name mapped to the endpoint path and the refresh log description
+    ENDPOINTS = {
+        "status": ("status.json", "Status Data"),
+        "miner": ("miner.json", "Miner Data"),
+        "speed": ("speed.json", "Network Speed Data"),
+        "temp": ("temp.json", "Temperature Data"),
+        "dig": ("dig.json", "DNS Data"),
+    }
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+        self._scan_session = None
+        self._scan_miner_data = {}
+        self._ping_history = defaultdict(lambda: deque(maxlen=self.PING_HISTORY_SIZE))
+        self._http_session = self._new_http_session()
+        self._http_request_count = 0
+        self._http_request_count_lock = threading.Lock()
+        self._payloads: Dict[str, Tuple[bytes, Dict]] = {}
+        self._changed: Dict[str, bool] = {}
+        self._discovery_cache = (
+            BobcatDiscoveryCache(self._discovery_cache_file, self._discovery_cache_ttl)
+            if self._discovery_cache_file
+            else None
+        )
+
+        if not self._discover:
+            return
+
         if self._hostname:
             if not asyncio.run(self.verify(self._hostname))[0]:
                 if not self.can_connect(self._hostname):
@@ -39,9 +148,238 @@ class BobcatConnection(BobcatBase):
                     raise BobcatVerificationError(
                         f"The bobcat ({self._hostname}) was either not a bobcat or did not match the bobcat animal."
                     )
+        elif cached_hostname := self._find_cached():
+            self._hostname = cached_hostname
         else:
             self._hostname = self.find()
 
+        self._cache_hostname()
+
+    def _normalize_animal(self, animal: str) -> (str, None):
+        """Normalize the animal name e.g. "Fancy Awesome Bobcat" to "fancy-awesome-bobcat".
+        Args:
+            animal (str): The animal name.
+        Returns:
+            (str, None): The normalized animal name or None when there is no animal name.
+        """
+        if not animal:
+            return None
+        return str(animal).strip().strip("'").strip('"').replace(" ", "-").lower()
+
+    def _find_cached(self) -> (str, None):
+        """Find the Bobcat from the discovery cache. The cached hostname is verified before it is used.
+        Returns:
+            (str, None): The cached hostname when it is still a verified bobcat otherwise None.
+        """
+        if not self._discovery_cache:
+            return None
+
+        if not (hostname := self._discovery_cache.get(self._normalize_animal(self._animal))):
+            self.logger.debug("Discovery Cache Miss")
+            return None
+
+        if asyncio.run(self.verify(hostname))[0]:
+            self.logger.debug(f"Discovery Cache Hit: {hostname}")
+            return hostname
+
+        self.logger.debug(f"Discovery Cache Stale: {hostname}")
+        return None
+
+    def _cache_hostname(self) -> None:
+        """Save the verified hostname to the discovery cache."""
+        if not self._discovery_cache:
+            return
+
+        try:
+            self._discovery_cache.set(self._hostname, self._normalize_animal(self._animal))
+        except OSError as err:
+            self.logger.warning(f"Unable to write the discovery cache: {err}")
+
+    def _is_rate_limited(self, data: Dict) -> bool:
+        """Check whether the endpoint data is a rate limited response that should be retried.
+        Args:
+            data (Dict): The endpoint data.
+        Returns:
+            (bool): Whether the Bobcat rate limited the request.
+        """
+        return data == {"message": "rate limit exceeded"}
+
+    def _is_speed_test_pending(self, endpoint: str, data: Dict) -> bool:
+        """Check whether the endpoint data is an empty speed test result that should be retried.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            data (Dict): The endpoint data.
+        Returns:
+            (bool): Whether the speed test has no results yet.
+        """
+        return endpoint == "speed" and data == {
+            "DownloadSpeed": "",
+            "UploadSpeed": "",
+            "Latency": "",
+        }  # https://github.com/aidanmelen/bobcat-miner-python/issues/6
+
+    def _should_retry(self, endpoint: str, data: Dict) -> bool:
+        """Check whether the endpoint data is a rate limited response or an empty speed test result.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            data (Dict): The endpoint data.
+        Returns:
+            (bool): Whether the data should be discarded and the request retried.
+        """
+        return self._is_rate_limited(data) or self._is_speed_test_pending(endpoint, data)
+
+    def _is_unchanged(self, endpoint: str, digest: bytes) -> bool:
+        """Check whether a response body is byte-identical to the one behind the current endpoint data.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            digest (bytes): The digest of the response body.
+        Returns:
+            (bool): Whether the body matches the current endpoint data.
+        """
+        last_digest, last_data = self._payloads.get(endpoint, (None, None))
+
+        # the data may have been replaced since the last refresh e.g. by a refresh for another hostname
+        return digest == last_digest and getattr(self, f"_{endpoint}_data") is last_data
+
+    def _decode(self, endpoint: str, body: bytes) -> Tuple[Dict, bytes]:
+        """Decode the endpoint response body. A body that is byte-identical to the current one is not parsed again.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            body (bytes): The raw response body.
+        Returns:
+            (Tuple[Dict, bytes]): The endpoint data and the digest of the body.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+
+        if self._is_unchanged(endpoint, digest):
+            return getattr(self, f"_{endpoint}_data"), digest
+
+        return serialization.loads(body), digest
+
+    def _store(self, endpoint: str, data: Dict, digest: bytes) -> bool:
+        """Store accepted endpoint data.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            data (Dict): The endpoint data.
+            digest (bytes): The digest of the response body.
+        Returns:
+            (bool): Whether the endpoint data changed since the last refresh.
+        """
+        changed = not self._is_unchanged(endpoint, digest)
+
+        if changed:
+            setattr(self, f"_{endpoint}_data", data)
+            self._payloads[endpoint] = (digest, data)
+
+        self._changed[endpoint] = changed
+        return changed
+
+    def changed(self, endpoint: str) -> bool:
+        """Check whether the endpoint data changed in the last refresh.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+        Returns:
+            (bool): Whether the last refresh returned different data. False when the endpoint was never refreshed.
+        """
+        return self._changed.get(endpoint, False)
+
+    def _log_refresh(self, endpoint: str, data: Dict, changed: bool = True) -> None:
+        """Log the refreshed endpoint data.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            data (Dict): The endpoint data.
+            changed (bool, optional): Whether the endpoint data changed since the last refresh. Defaults to True.
+        """
+        _, description = self.ENDPOINTS[endpoint]
+
+        if not changed:
+            log = (f"Refresh: {description} (unchanged)", {})
+        elif trace := self._trace_description(data):
+            log = (f"Refresh: {description}", {"extra": {"description": trace}})
+        else:
+            log = (f"Refresh: {description}", {})
+
+        deferred = _deferred_refresh_logs.get()
+        if deferred is not None:
+            deferred.append(log)
+        else:
+            message, kwargs = log
+            self.logger.debug(message, **kwargs)
+
+    @contextmanager
+    def _defer_refresh_logs(self, deferred: List[Tuple[str, Dict]]) -> Iterator[None]:
+        """Hold back the refresh logs of the current thread or task so that a concurrent refresh can emit them in endpoint order.
+        Args:
+            deferred (List[Tuple[str, Dict]]): The list that collects the log messages and logger keyword arguments.
+        """
+        token = _deferred_refresh_logs.set(deferred)
+        try:
+            yield
+        finally:
+            _deferred_refresh_logs.reset(token)
+
+    def _emit_refresh_logs(self, deferred: List[Tuple[str, Dict]]) -> None:
+        """Emit the refresh logs that were held back.
+        Args:
+            deferred (List[Tuple[str, Dict]]): The held back log messages and logger keyword arguments.
+        """
+        for message, kwargs in deferred:
+            self.logger.debug(message, **kwargs)
+
+    def _accept(self, endpoint: str, body: bytes, attempt: int, hostname: str) -> Optional[Dict]:
+        """Decode the endpoint response and decide whether it is accepted. Only accepted data is stored. A rate limited response or an empty speed test result pauses the host's requests before it is retried.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            body (bytes): The raw response body.
+            attempt (int): The attempt number starting from 1.
+            hostname (str): The hostname the response came from.
+        Returns:
+            (Dict, None): The endpoint data or None when the request should be retried.
+        Raises:
+            BobcatRateLimitError: When the endpoint is still rate limited after the max number of attempts.
+            BobcatSpeedTestNotReadyError: When the speed test still has no results after the max number of attempts.
+        """
+        data, digest = self._decode(endpoint, body)
+
+        if not self._should_retry(endpoint, data):
+            self._log_refresh(endpoint, data, self._store(endpoint, data, digest))
+            return data
+
+        rate_limited = self._is_rate_limited(data)
+
+        if attempt >= self._rate_limit_max_attempts:
+            waited = self._rate_limit_backoff * (attempt - 1)
+
+            if rate_limited:
+                raise BobcatRateLimitError(endpoint, attempt, waited)
+            raise BobcatSpeedTestNotReadyError(attempt, waited)
+
+        self.logger.debug(
+            f"{'Rate Limited' if rate_limited else 'Not Ready'}: {endpoint} data (attempt {attempt}/{self._rate_limit_max_attempts}). Retrying in {self._rate_limit_backoff} seconds"
+        )
+        self._rate_limiter.pause(hostname, self._rate_limit_backoff)
+        return None
+
+    def _refresh(self, endpoint: str, hostname: str = None) -> Dict:
+        """Refresh the endpoint data. Rate limited responses pause the host's requests and are retried up to `rate_limit_max_attempts` times.
+        Args:
+            endpoint (str): The endpoint name e.g. status, miner, temp, speed or dig.
+            hostname (str, optional): The hostname to refresh. This will override the hostname instance attribute.
+        Returns:
+            (Dict): The endpoint data.
+        Raises:
+            BobcatRateLimitError: When the endpoint is still rate limited after the max number of attempts.
+            BobcatSpeedTestNotReadyError: When the speed test still has no results after the max number of attempts.
+        """
+        _hostname = hostname if hostname else self._hostname
+        path, _ = self.ENDPOINTS[endpoint]
+
+        for attempt in range(1, self._rate_limit_max_attempts + 1):
+            body = self.__get(f"http://{_hostname}/{path}").content
+
+            if (data := self._accept(endpoint, body, attempt, _hostname)) is not None:
+                return data
+
     def __refresh_miner(self, hostname: str = None) -> BobcatConnection:
         """Refresh Bobcat miner data.
         Args:
@@ -49,61 +387,171 @@ class BobcatConnection(BobcatBase):
         Returns:
             (BobcatConnection): The instance of the BobcatConnection.
         """
+        self._refresh("miner", hostname)
+        return self
 
-        _hostname = hostname if hostname else self._hostname
+    def _throttle(self, url: str) -> float:
+        """Reserve a request to the URL host from the rate limiter.
+        Args:
+            url (str): The request URL.
+        Returns:
+            (float): The seconds to wait before the request is sent.
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        if delay := self._rate_limiter.reserve(host):
+            self.logger.debug(f"Rate Limit: Waiting {delay:.1f} seconds for {host}")
+        return delay
 
-        self._miner_data = self.__get("http://" + _hostname + "/miner.json").json()
+    def rate_limit_stats(self, hostname: str = "") -> BobcatRateLimitStats:
+        """Get the request throttling statistics for the host.
+        Args:
+            hostname (str, optional): The hostname. This will override the hostname instance attribute.
+        Returns:
+            (BobcatRateLimitStats): The request count, the throttled request count and the seconds spent waiting.
+        """
+        return self._rate_limiter.stats(hostname if hostname else self._hostname)
 
-        if self._trace:
-            self.logger.debug(
-                "Refresh: Miner Data",
-                extra={"description": f"\n```\n{json.dumps(self._miner_data, indent=4)}\n```"},
-            )
-        else:
-            self.logger.debug("Refresh: Miner Data")
+    def _new_http_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session for the Bobcat API.
+        Returns:
+            (requests.Session): A session that keeps at most `http_pool_size` connections open per host and applies the retry policy timeouts.
+        """
+        session = requests.Session()
+        adapter = BobcatHTTPAdapter(
+            pool_connections=self._http_pool_size,
+            pool_maxsize=self._http_pool_size,
+            timeout=self._retry_policy.timeout,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-        if self._miner_data == {"message": "rate limit exceeded"}:
-            time.sleep(30)
-            self.__refresh_miner(hostname=_hostname)
+    def http_stats(self) -> BobcatHttpStats:
+        """Get the HTTP session statistics to confirm connections to the Bobcat are reused.
+        Returns:
+            (BobcatHttpStats): The request count, the new connection count and the connection reuse ratio.
+        """
+        connections = 0
+        for adapter in set(self._http_session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            connections += sum(pools[key].num_connections for key in pools.keys())
+
+        requests_count = self._http_request_count
+        return BobcatHttpStats(
+            requests=requests_count,
+            connections=connections,
+            reuse_ratio=(
+                max(requests_count - connections, 0) / requests_count if requests_count else 0.0
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self._http_session.close()
+
+    def __enter__(self) -> BobcatConnection:
         return self
 
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _new_scan_session(self) -> aiohttp.ClientSession:
+        """Create a pooled HTTP session for scanning hosts.
+        Returns:
+            (aiohttp.ClientSession): A session with at most `search_concurrency` open sockets.
+        """
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(sock_connect=1, sock_read=5),
+            connector=aiohttp.TCPConnector(limit=self._search_concurrency),
+        )
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the session shared by the running scan or a short-lived session outside of a scan.
+        Returns:
+            (AsyncIterator[aiohttp.ClientSession]): The HTTP session.
+        """
+        if self._scan_session is not None:
+            yield self._scan_session
+        else:
+            async with self._new_scan_session() as session:
+                yield session
+
     async def _get_homepage(self, host: str) -> str:
-        """Get the home page for the host.
+        """Get the head of the home page for the host.
+        The body is streamed and the download stops after the `<title>` or the first `HOMEPAGE_FINGERPRINT_BYTES`.
         Args:
             host (str): The host to check.
         Returns:
-            (str): The homepage content for the host.
+            (str): The homepage content up to the title for the host or None when the homepage is not HTML.
         """
         try:
-            timeout = aiohttp.ClientTimeout(sock_connect=1, sock_read=5)
-
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with self._session() as session:
 
                 async with session.get(f"http://{host}/") as response:
 
-                    return await response.text()
+                    if response.content_type != "text/html":
+                        return None
+
+                    head = bytearray()
+                    while chunk := await response.content.read(self.HOMEPAGE_CHUNK_SIZE):
+                        head += chunk
+
+                        if (
+                            b"</title>" in head.lower()
+                            or len(head) >= self.HOMEPAGE_FINGERPRINT_BYTES
+                        ):
+                            break
+
+                    return head.decode(response.charset or "utf-8", errors="replace")
 
         except Exception as err:
             return None
 
-    def _does_bobcat_match_animal(self, host: str) -> bool:
+    async def _get_miner_data(self, host: str) -> Dict:
+        """Get the miner data for the host. The miner data is fetched once per host during a scan.
+        Args:
+            host (str): The host to check.
+        Returns:
+            (Dict): The miner data for the host or an empty dict when the miner data is unavailable.
+        """
+        if host in self._scan_miner_data:
+            return self._scan_miner_data[host]
+
+        try:
+            async with self._session() as session:
+
+                async with session.get(f"http://{host}/miner.json") as response:
+
+                    miner_data = await response.json(content_type=None, loads=serialization.loads)
+
+        except Exception as err:
+            return {}
+
+        if not isinstance(miner_data, dict) or miner_data == {"message": "rate limit exceeded"}:
+            return {}
+
+        if self._scan_session is not None:
+            self._scan_miner_data[host] = miner_data
+        return miner_data
+
+    async def _does_bobcat_match_animal(self, host: str) -> bool:
         """The host is not the bobcat if the animal name does not match.
         Args:
             host (str): The host to check.
         Returns:
             (bool): Whether or not the bobcat animal matches the search animal.
         """
-        self.__refresh_miner(hostname=host)
+        miner_data = await self._get_miner_data(host)
 
-        bobcat_animal = self._miner_data.get("animal").lower()
+        bobcat_animal = str(miner_data.get("animal")).lower()
 
         # e.g. normalize "Fancy Awesome Bobcat" to "fancy-awesome-bobcat"
-        normalized_animal = (
-            str(self._animal).strip().strip("'").strip('"').replace(" ", "-").lower()
-        )
+        normalized_animal = self._normalize_animal(self._animal)
 
         if does_bobcat_match_animal := normalized_animal == bobcat_animal:
             self.logger.debug(f"Verified Bobcat Animal: {bobcat_animal}")
+            self._miner_data = miner_data
         else:
             self.logger.debug(
                 f"Verification Failed: ({bobcat_animal}) on host ({host}) does not match ({normalized_animal})"
@@ -111,6 +559,74 @@ class BobcatConnection(BobcatBase):
 
         return does_bobcat_match_animal
 
+    async def probe(self, host: str, port: int = 80, timeout: float = 0.5) -> Tuple[bool, str]:
+        """Probe the host with a raw TCP connect. This is the cheap first stage of the search that filters out dead hosts before verification.
+        Args:
+            host (str): The host to check.
+            port (int, optional): The port to connect to. Defaults to port 80.
+            timeout (float, optional): The connect timeout in seconds. Defaults to 0.5 seconds.
+        Returns:
+            (Tuple[bool, str]): A tuple containing whether the port accepted the connection and the hostname that was tested.
+        """
+        return await self._connect(host, port, timeout) is None, host
+
+    async def _connect(self, host: str, port: int, timeout: float) -> (Exception, None):
+        """Open and close a raw TCP connection to the host.
+        Args:
+            host (str): The host to connect to.
+            port (int): The port to connect to.
+            timeout (float): The connect timeout in seconds.
+        Returns:
+            (Exception, None): The connection error or None when the port accepted the connection.
+        """
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError) as err:
+            return err
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError as err:
+            pass
+
+        return None
+
+    async def ping(self, hostname: str = "", port: int = 80, timeout: float = 3) -> BobcatPing:
+        """Probe the Bobcat reachability and measure the connect latency. The result is added to the host's ping history.
+        Args:
+            hostname (str, optional): The hostname to ping. This will override the hostname instance attribute.
+            port (int, optional): The port to connect to. Defaults to port 80.
+            timeout (float, optional): The connect timeout in seconds. Defaults to 3 seconds.
+        Returns:
+            (BobcatPing): The ping result.
+        """
+        _hostname = hostname if hostname else self._hostname
+
+        start = time.monotonic()
+        err = await self._connect(_hostname, port, timeout)
+        latency = time.monotonic() - start
+
+        result = BobcatPing(
+            hostname=_hostname,
+            reachable=err is None,
+            latency=None if err else latency,
+            error=type(err).__name__ if err else None,
+            timestamp=time.time(),
+        )
+        self._ping_history[_hostname].append(result)
+        return result
+
+    def ping_history(self, hostname: str = "") -> List[BobcatPing]:
+        """Get the rolling ping history for the host.
+        Args:
+            hostname (str, optional): The hostname. This will override the hostname instance attribute.
+        Returns:
+            (List[BobcatPing]): The most recent ping results ordered from oldest to newest.
+        """
+        _hostname = hostname if hostname else self._hostname
+        return list(self._ping_history.get(_hostname, []))
+
     async def verify(self, host: str) -> Tuple[bool, str]:
         """Verify the host is a Bobcat.
         Args:
@@ -130,31 +646,275 @@ class BobcatConnection(BobcatBase):
             self.logger.debug(f"Connected to Bobcat: {host}")
 
             does_bobcat_match_animal = (
-                self._does_bobcat_match_animal(host) if self._animal else True
+                await self._does_bobcat_match_animal(host) if self._animal else True
             )
 
             is_bobcat_verified = has_bobcat_diagnostic_dashboard and does_bobcat_match_animal
 
         return is_bobcat_verified, host
 
-    async def _search(self, hosts: List[str]) -> (str, None):
+    async def _scan(
+        self, hosts: Iterable[str], total: int = None
+    ) -> AsyncIterator[Tuple[bool, str, float]]:
+        """Concurrently scan hosts and yield each result as soon as the host is searched.
+        Each host is first probed with a TCP connect on port 80 and only hosts that accept the connection are verified over HTTP.
+        The hosts are consumed lazily in a sliding window of at most `search_concurrency` pending searches over a single pooled
+        session, so memory stays flat no matter how large the search networks are. The remaining probes are cancelled when the
+        caller stops consuming the scan.
+        Args:
+            hosts (Iterable[str]): The hosts to search.
+            total (int, optional): The number of hosts used to log the search progress. Defaults to no progress logging.
+        Returns:
+            (AsyncIterator[Tuple[bool, str, float]]): The verification result, the hostname and the seconds spent searching the host.
+        """
+
+        async def probe_and_verify(host: str) -> Tuple[bool, str, float]:
+            start = time.monotonic()
+
+            is_port_open, _ = await self.probe(host)
+            if not is_port_open:
+                return False, host, time.monotonic() - start
+
+            is_bobcat_verified, _ = await self.verify(host)
+            return is_bobcat_verified, host, time.monotonic() - start
+
+        hosts = iter(hosts)
+        pending = set()
+
+        def schedule(count: int) -> None:
+            for host in itertools.islice(hosts, count):
+                pending.add(asyncio.ensure_future(probe_and_verify(host)))
+
+        searched = 0
+        progress_interval = max(total // 10, 1) if total else None
+        start = time.monotonic()
+        self._scan_session = self._new_scan_session()
+        schedule(self._search_concurrency)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+
+                # refill the window before handing results to the caller so the search keeps moving
+                schedule(len(done))
+
+                for task in done:
+                    searched += 1
+
+                    if progress_interval and searched % progress_interval == 0:
+                        self.logger.debug(
+                            f"Search Progress: {searched}/{total} hosts ({searched / total:.0%})"
+                        )
+
+                    yield task.result()
+
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            await self._scan_session.close()
+            self._scan_session = None
+            self._scan_miner_data = {}
+
+            elapsed = time.monotonic() - start
+            self.logger.debug(
+                f"Searched {searched} hosts in {elapsed:.2f} seconds ({searched / elapsed if elapsed else 0:.1f} hosts/second)"
+            )
+
+    async def _search(self, hosts: Iterable[str], total: int = None) -> (str, None):
         """Concurrently search hosts in network and return the host for the first verified bobcat found.
+        The remaining probes are cancelled as soon as a bobcat is verified.
         Args:
-            hosts (List[str]): The hosts to search.
+            hosts (Iterable[str]): The hosts to search.
+            total (int, optional): The number of hosts used to log the search progress. Defaults to no progress logging.
         Returns:
             (str, None): The IP address for the host when found otherwise None.
         """
+        scan = self._scan(hosts, total)
 
-        tasks = [asyncio.ensure_future(self.verify(host)) for host in hosts]
+        try:
+            async for is_bobcat_verified, host, _ in scan:
+                if is_bobcat_verified:
+                    return host
+            else:
+                return None
+        finally:
+            await scan.aclose()
+
+    async def find_all(self) -> AsyncIterator[BobcatDiscovery]:
+        """Search the local networks and yield every Bobcat as soon as it is verified.
+        Returns:
+            (AsyncIterator[BobcatDiscovery]): The Bobcats found in the local networks.
+        """
+        self.logger.debug(
+            f"Searching for {'every (' + self._animal + ')' if self._animal else 'every bobcat'} in these networks: {', '.join(self._networks)}"
+        )
 
-        for task in asyncio.as_completed(tasks):
+        candidates = self._neighbor_candidates()
+        plan = self._plan_networks()
+        scan = self._scan(
+            itertools.chain(candidates, self._plan_hosts(plan, exclude=candidates)),
+            self._count_hosts(plan),
+        )
 
-            is_bobcat_verified, host = await task
+        try:
+            async for is_bobcat_verified, host, elapsed in scan:
+                if is_bobcat_verified:
+                    miner_data = await self._get_miner_data(host)
+                    yield BobcatDiscovery(
+                        hostname=host,
+                        animal=miner_data.get("animal"),
+                        pubkey=miner_data.get("pubkey"),
+                        elapsed=round(elapsed, 3),
+                    )
+        finally:
+            await scan.aclose()
 
-            if is_bobcat_verified:
-                return host
-        else:
-            return None
+    def _parse_networks(self) -> List[IPNetwork]:
+        """Parse the search networks.
+        Returns:
+            (List[IPNetwork]): The search networks.
+        Raises:
+            BobcatSearchNetworkError: When a search network is not an IPv4 or IPv6 network.
+        """
+        try:
+            return [ipaddress.ip_network(network, strict=False) for network in self._networks]
+        except ValueError as err:
+            raise BobcatSearchNetworkError(str(err))
+
+    def _plan_networks(self) -> List[Tuple[IPNetwork, IPNetwork]]:
+        """Plan the network search. Overlapping networks are collapsed into non-overlapping ranges so every host is searched once
+        and the smallest (most likely) networks are searched first.
+        Returns:
+            (List[Tuple[IPNetwork, IPNetwork]]): The non-overlapping ranges to search paired with the search network they belong to.
+        Raises:
+            BobcatSearchNetworkError: When a search network is not an IPv4 or IPv6 network.
+        """
+        plan = []
+        probed_networks = []
+
+        for network in sorted(self._parse_networks(), key=lambda network: network.num_addresses):
+
+            remaining = [network]
+            for probed_network in probed_networks:
+                remaining = [
+                    subnet
+                    for remaining_network in remaining
+                    for subnet in self._exclude_network(remaining_network, probed_network)
+                ]
+
+            reserved = self._reserved_addresses(network)
+            for subnet in ipaddress.collapse_addresses(remaining):
+                if subnet.num_addresses == 1 and subnet.network_address in reserved:
+                    continue  # a reserved address of this network is not a host to search
+
+                plan.append((subnet, network))
+
+                # the reserved addresses of a smaller network are still hosts of a larger one
+                probed = [subnet]
+                for address in reserved:
+                    probed = [
+                        probed_subnet
+                        for probed_network in probed
+                        for probed_subnet in self._exclude_network(
+                            probed_network, ipaddress.ip_network(address)
+                        )
+                    ]
+                probed_networks.extend(probed)
+
+        return plan
+
+    def _reserved_addresses(self, network: IPNetwork) -> Tuple:
+        """Get the reserved addresses of a search network that are not searched.
+        Args:
+            network (IPNetwork): The search network.
+        Returns:
+            (Tuple): The network and broadcast addresses, or none for point-to-point and single host networks.
+        """
+        if network.num_addresses <= 2:
+            return ()
+        return (network.network_address, network.broadcast_address)
+
+    def _exclude_network(self, network: IPNetwork, excluded: IPNetwork) -> List[IPNetwork]:
+        """Remove the excluded network from the network.
+        Args:
+            network (IPNetwork): The network.
+            excluded (IPNetwork): The network to remove.
+        Returns:
+            (List[IPNetwork]): The subnets of the network that do not overlap the excluded network.
+        """
+        if network.version != excluded.version or not network.overlaps(excluded):
+            return [network]
+        if network.subnet_of(excluded):
+            return []
+        return list(network.address_exclude(excluded))
+
+    def _hosts(self, subnet: IPNetwork, network: IPNetwork) -> Iterator[str]:
+        """Iterate the hosts of a planned subnet. The network and broadcast addresses of the search network are skipped.
+        Args:
+            subnet (IPNetwork): The planned subnet.
+            network (IPNetwork): The search network the subnet belongs to.
+        Returns:
+            (Iterator[str]): The host IP addresses.
+        """
+        reserved = self._reserved_addresses(network)
+        yield from (str(address) for address in subnet if address not in reserved)
+
+    def _count_hosts(self, plan: List[Tuple[IPNetwork, IPNetwork]]) -> int:
+        """Count the hosts in the planned subnets without enumerating them.
+        Args:
+            plan (List[Tuple[IPNetwork, IPNetwork]]): The planned subnets and the search networks they belong to.
+        Returns:
+            (int): The number of hosts to search.
+        """
+        count = 0
+        for subnet, network in plan:
+            reserved = self._reserved_addresses(network)
+            count += subnet.num_addresses - sum(address in subnet for address in set(reserved))
+        return count
+
+    def _plan_hosts(
+        self, plan: List[Tuple[IPNetwork, IPNetwork]], exclude: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """Lazily iterate the hosts to search in the planned search order.
+        Args:
+            plan (List[Tuple[IPNetwork, IPNetwork]]): The planned subnets and the search networks they belong to.
+            exclude (List[str], optional): The hosts that were already searched. Defaults to none.
+        Returns:
+            (Iterator[str]): The hosts to search.
+        """
+        self.logger.debug(f"Searching networks: {', '.join(str(subnet) for subnet, _ in plan)}")
+
+        searched = set(exclude or [])
+        return (
+            host
+            for subnet, network in plan
+            for host in self._hosts(subnet, network)
+            if host not in searched
+        )
+
+    def _neighbor_candidates(self) -> List[str]:
+        """Get the live neighbors from the neighbor source that fall inside the search networks.
+        Returns:
+            (List[str]): The neighbor IP addresses to search first.
+        Raises:
+            BobcatSearchNetworkError: When a search network is not an IPv4 or IPv6 network.
+        """
+        networks = self._parse_networks()
+
+        candidates = []
+        for neighbor in self._neighbor_source.neighbors():
+            try:
+                ip_address = ipaddress.ip_address(neighbor)
+            except ValueError as err:
+                continue
+
+            if any(ip_address in network for network in networks):
+                candidates.append(neighbor)
+
+        return candidates
 
     def find(self) -> str:
         """Find a Bobcat on the local network.
@@ -168,64 +928,60 @@ class BobcatConnection(BobcatBase):
             f"Searching for {'(' + self._animal + ')' if self._animal else 'a bobcat'} in these networks: {', '.join(self._networks)}"
         )
 
-        for network in self._networks:
+        if candidates := self._neighbor_candidates():
 
-            self.logger.debug(f"Searching network: {network}")
+            self.logger.debug(f"Searching neighbors: {', '.join(candidates)}")
 
-            try:
-                hosts = [str(host) for host in ipaddress.ip_network(network, strict=False).hosts()]
-            except ValueError as err:
-                raise BobcatSearchNetworkError(str(err))
-
-            if host := asyncio.run(self._search(hosts)):
+            if host := asyncio.run(self._search(candidates)):
                 self.logger.debug(f"Found Bobcat: {host}")
                 return host
 
-        else:
-            raise BobcatNotFoundError(
-                f"Unable to find the bobcat{' (' + self._animal + ')' if self._animal else ''} in these networks: {', '.join(self._networks)}"
-            )
+        plan = self._plan_networks()
+        hosts = self._plan_hosts(plan, exclude=candidates)
+
+        if host := asyncio.run(self._search(hosts, self._count_hosts(plan) - len(candidates))):
+            self.logger.debug(f"Found Bobcat: {host}")
+            return host
+
+        raise BobcatNotFoundError(
+            f"Unable to find the bobcat{' (' + self._animal + ')' if self._animal else ''} in these networks: {', '.join(self._networks)}"
+        )
 
     def can_connect(self, hostname: str = "", port: int = 80, timeout: int = 3) -> bool:
         """Verify network connectivity.
         Args:
             hostname (str, optional): The hostname to test for a connection. This will override the hostname instance attribute.
             port (int, optional): The socket port. Defaults to port 80.
-            timeout (int, optional): The socket timeout. Defaults to 3 minutes.
+            timeout (int, optional): The connect timeout. Defaults to 3 seconds.
         """
-        _hostname = hostname if hostname else self._hostname
-        try:
-            socket.setdefaulttimeout(timeout)
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((_hostname, port))
-        except OSError as err:
-            result = False
-        else:
-            result = True
-        finally:
-            s.close()
-            return result
-
-    # @backoff.on_exception(
-    #     backoff.expo,
-    #     (requests.exceptions.Timeout, requests.exceptions.ConnectionError),
-    #     max_time=FIVE_MINUTES,
-    # )
+        return asyncio.run(self.ping(hostname, port, timeout)).reachable
+
     def __get(self, url: str) -> str:
-        """Make GET request for a URL. The request will exponentially backoff on connection errors and timeouts. The backoff timeout is 5 minutes.
+        """Make GET request for a URL. Connection errors and timeouts are retried with the retry policy.
         Args:
             url (str): A URL to GET.
         """
-        return requests.get(url)
 
-    # @backoff.on_exception(
-    #     backoff.expo,
-    #     (requests.exceptions.Timeout, requests.exceptions.ConnectionError),
-    #     max_time=FIVE_MINUTES,
-    # )
+        def get() -> requests.Response:
+            if delay := self._throttle(url):
+                time.sleep(delay)
+            with self._http_request_count_lock:
+                self._http_request_count += 1
+            return self._http_session.get(url)
+
+        return self._retry_policy.retry(get, logger=self.logger)()
+
     def __post(self, url: str) -> str:
-        """Make POST request for a URL. The request will exponentially backoff on connection errors and timeouts. The backoff timeout is 5 minutes.
+        """Make POST request for a URL. The actions are not idempotent so only requests that were never sent are retried.
         Args:
             url (str): A URL to POST.
         """
-        return requests.post(url, headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"})
+
+        def post() -> requests.Response:
+            if delay := self._throttle(url):
+                time.sleep(delay)
+            with self._http_request_count_lock:
+                self._http_request_count += 1
+            return self._http_session.post(url, headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"})
+
+        return self._retry_policy.retry(post, retryable=UNSENT_ERRORS, logger=self.logger)()
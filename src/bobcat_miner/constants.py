@@ -1,5 +1,6 @@
 # TIME CONSTANTS
 ONE_SECOND: int = 1
+THIRTY_SECONDS: int = ONE_SECOND * 30
 ONE_MINUTE: int = ONE_SECOND * 60
 THREE_MINUTES: int = ONE_MINUTE * 3
 FIVE_MINUTES: int = ONE_MINUTE * 5
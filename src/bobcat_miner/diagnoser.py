@@ -1,9 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict
 
-import json
 import os
-import re
 import requests
 import time
 
@@ -11,6 +9,10 @@ try:
     from bobcat import Bobcat
 except:
     from .bobcat import Bobcat
+try:
+    import serialization
+except:
+    from . import serialization
 try:
     from constants import *
 except:
@@ -611,13 +613,12 @@ class OnlineStatusCheck(BobcatCheck):
 
     def _is_offline(self) -> (Dict, None):
         """Get Hotspot data from Helium API."""
-        data = requests.get(f"https://api.helium.io/v1/hotspots/{self.bobcat.pubkey}").json()
+        data = serialization.loads(
+            requests.get(f"https://api.helium.io/v1/hotspots/{self.bobcat.pubkey}").content
+        )
 
-        if self.bobcat._trace:
-            self.bobcat.logger.debug(
-                "Refresh: Helium API Data",
-                extra={"description": f"\n```\n{json.dumps(data, indent=4)}\n```"},
-            )
+        if trace := self.bobcat._trace_description(data):
+            self.bobcat.logger.debug("Refresh: Helium API Data", extra={"description": trace})
 
         return data.get("data", {}).get("status", {}).get("online", "offline").lower() != "online"
 
@@ -733,14 +734,11 @@ class RelayStatusCheck(BobcatCheck):
             # do not evaluate relay status if the bobcat is unhealthy
             return False
 
-        is_pub_ip_over_44158 = re.search(
-            f"(/ip4/)({self.bobcat.public_ip})(/tcp/44158)",
-            self.bobcat.peerbook,
-            re.IGNORECASE,
-        )
-        is_nat_type_none = re.search(
-            r"\|.*(nat_type).*\|.*(none).*\|", self.bobcat.p2p_status, re.IGNORECASE
+        public_listen_addr = f"/ip4/{self.bobcat.public_ip}/tcp/44158".lower()
+        is_pub_ip_over_44158 = any(
+            addr.lower() == public_listen_addr for addr in self.bobcat.listen_addrs
         )
+        is_nat_type_none = self.bobcat.nat_type == "none"
 
         if is_relayed := not is_pub_ip_over_44158 and not is_nat_type_none:
             self.bobcat.logger.warning(
@@ -777,6 +775,14 @@ class NetworkStatusCheck(BobcatCheck):
         )
 
     def check(self) -> bool:
+        # the speed worker was only just started in a one-shot run so give its first speed test time to finish
+        if self.bobcat.speed_result() is None:
+            self.bobcat.wait_for_speed_result(timeout=THREE_MINUTES)
+
+        if not all([self.bobcat.download_speed, self.bobcat.upload_speed, self.bobcat.latency]):
+            self.bobcat.logger.debug(f"{self.name}: Skipped. The speed test has no results yet")
+            return False
+
         download_speed = int(self.bobcat.download_speed.strip(" Mbit/s"))
         upload_speed = int(self.bobcat.upload_speed.strip(" Mbit/s"))
         latency = float(self.bobcat.latency.strip("ms"))
@@ -878,18 +884,18 @@ class OTAVersionStatusCheck(BobcatCheck):
 
         if not os.path.isfile(self.state_file):
             with open(self.state_file, "w") as f:
-                json.dump({"ota_version": self.bobcat.ota_version}, f)
+                serialization.dump({"ota_version": self.bobcat.ota_version}, f)
 
     def check(self) -> bool:
         try:
             with open(self.state_file, "r") as f:
-                state = json.load(f)
+                state = serialization.load(f)
                 previous_ota_version = state.get("ota_version", self.bobcat.ota_version)
 
-        except json.decoder.JSONDecodeError as err:
+        except serialization.JSONDecodeError as err:
             previous_ota_version = state.get("ota_version", self.bobcat.ota_version)
             with open(self.state_file, "w") as f:
-                json.dump({"ota_version": previous_ota_version}, f)
+                serialization.dump({"ota_version": previous_ota_version}, f)
 
         if did_ota_version_change := previous_ota_version != self.bobcat.ota_version:
             state["ota_version"] = self.bobcat.ota_version
@@ -899,6 +905,6 @@ class OTAVersionStatusCheck(BobcatCheck):
             )
 
         with open(self.state_file, "w") as f:
-            json.dump(state, f)
+            serialization.dump(state, f)
 
         return did_ota_version_change
@@ -20,3 +20,56 @@ class BobcatConnectionError(Exception):
     """Error thrown when unable to connect to bobcat."""
 
     pass
+
+
+class BobcatRefreshError(Exception):
+    """Error thrown when one or more Bobcat endpoints fail to refresh. The data for the other endpoints is still refreshed."""
+
+    def __init__(self, errors: dict) -> None:
+        """The Bobcat Refresh Error constructor.
+
+        Args:
+            errors (dict): The exception raised for each endpoint that failed to refresh e.g. {"speed": ReadTimeout(...)}.
+        """
+        self.errors = errors
+        super().__init__(
+            "Unable to refresh the Bobcat "
+            + ", ".join(f"{endpoint} data ({err!r})" for endpoint, err in errors.items())
+        )
+
+
+class BobcatRateLimitError(Exception):
+    """Error thrown when the Bobcat is still rate limiting an endpoint after the max number of attempts."""
+
+    def __init__(self, endpoint: str, attempts: int, waited: float) -> None:
+        """The Bobcat Rate Limit Error constructor.
+
+        Args:
+            endpoint (str): The endpoint name e.g. status.
+            attempts (int): The number of requests that were rate limited.
+            waited (float): The total seconds spent waiting for the rate limit.
+        """
+        self.endpoint = endpoint
+        self.attempts = attempts
+        self.waited = waited
+        super().__init__(
+            f"The Bobcat is still rate limiting the {endpoint} endpoint after {attempts} attempts and {waited:.0f} seconds of waiting"
+        )
+
+
+class BobcatSpeedTestNotReadyError(Exception):
+    """Error thrown when the Bobcat speed test still has no results after the max number of attempts."""
+
+    def __init__(self, attempts: int, waited: float) -> None:
+        """The Bobcat Speed Test Not Ready Error constructor.
+
+        Args:
+            attempts (int): The number of requests that returned an empty speed test result.
+            waited (float): The total seconds spent waiting for the speed test.
+        """
+        self.endpoint = "speed"
+        self.attempts = attempts
+        self.waited = waited
+        super().__init__(
+            f"The Bobcat speed test has no results after {attempts} attempts and {waited:.0f} seconds of waiting"
+        )
@@ -4,6 +4,12 @@ from logging import LogRecord
 from logging.handlers import TimedRotatingFileHandler
 from discord_lumberjack.handlers import DiscordWebhookHandler
 from discord_lumberjack.message_creators import EmbedMessageCreator
+from typing import Any
+
+try:
+    import serialization
+except:
+    from . import serialization
 
 import logging
 
@@ -78,6 +84,38 @@ class BobcatLogger:
         logging.getLogger("discord_lumberjack").setLevel(logging.ERROR)
 
 
+class BobcatTraceDescription:
+    """A class for a lazy trace log description. The data is only serialized when a log handler formats the record."""
+
+    def __init__(self, data: Any, max_length: int = None) -> None:
+        """The Bobcat Trace Description constructor.
+
+        Args:
+            data (Any): The traced data e.g. the refreshed endpoint data.
+            max_length (int, optional): The max number of characters before the serialized data is truncated. Defaults to no limit.
+        """
+        self.data = data
+        self.max_length = max_length
+        self._rendered = None
+
+    def __str__(self) -> str:
+        """Render the data as an indented JSON code block. The rendered description is reused by every handler.
+        Returns:
+            (str): The description.
+        """
+        if self._rendered is None:
+            text = serialization.dumps(self.data, indent=True)
+
+            if self.max_length and len(text) > self.max_length:
+                text = (
+                    f"{text[:self.max_length]}\n... ({len(text) - self.max_length} more characters)"
+                )
+
+            self._rendered = f"\n```\n{text}\n```"
+
+        return self._rendered
+
+
 @dataclass
 class Color:
     """A class for console color codes."""
@@ -0,0 +1,104 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+import subprocess
+
+
+class BobcatNeighborSource(ABC):
+    """An abstract class for a source of neighbor IP addresses e.g. the kernel neighbor table."""
+
+    def neighbors(self) -> List[str]:
+        """Get the live neighbor IP addresses.
+        Returns:
+            (List[str]): The neighbor IP addresses in the order they were listed.
+        """
+        return self.parse(self.read())
+
+    @abstractmethod
+    def read(self) -> str:
+        """Read the raw neighbor table. Return an empty string when the table is unavailable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse(self, table: str) -> List[str]:
+        """Parse the raw neighbor table and return the live neighbor IP addresses."""
+        raise NotImplementedError
+
+
+class ArpTableNeighborSource(BobcatNeighborSource):
+    """A neighbor source for the Linux ARP table."""
+
+    # https://github.com/torvalds/linux/blob/master/include/uapi/linux/if_arp.h
+    ATF_COM = 0x02  # completed entry (hardware address is valid)
+
+    def __init__(self, arp_table: str = "/proc/net/arp") -> None:
+        """The ARP Table Neighbor Source constructor.
+
+        Args:
+            arp_table (str, optional): The ARP table file path. Defaults to /proc/net/arp.
+        """
+        self.arp_table = arp_table
+
+    def read(self) -> str:
+        try:
+            with open(self.arp_table, "r") as f:
+                return f.read()
+        except OSError as err:
+            return ""
+
+    def parse(self, table: str) -> List[str]:
+        neighbors = []
+
+        # IP address       HW type     Flags       HW address            Mask     Device
+        # 192.168.0.10     0x1         0x2         aa:bb:cc:dd:ee:ff     *        eth0
+        for line in table.splitlines()[1:]:
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+
+            ip_address, flags = fields[0], fields[2]
+            try:
+                is_complete = int(flags, 16) & self.ATF_COM
+            except ValueError as err:
+                continue
+
+            if is_complete and ip_address not in neighbors:
+                neighbors.append(ip_address)
+
+        return neighbors
+
+
+class IpNeighNeighborSource(BobcatNeighborSource):
+    """A neighbor source for the `ip neigh` command output."""
+
+    FAILED_STATES = ("FAILED", "INCOMPLETE", "NOARP")
+
+    def __init__(self, command: Sequence[str] = ("ip", "neigh", "show")) -> None:
+        """The IP Neigh Neighbor Source constructor.
+
+        Args:
+            command (Sequence[str], optional): The command that lists the neighbor table. Defaults to `ip neigh show`.
+        """
+        self.command = command
+
+    def read(self) -> str:
+        try:
+            return subprocess.run(
+                list(self.command), capture_output=True, text=True, timeout=5, check=True
+            ).stdout
+        except (OSError, subprocess.SubprocessError) as err:
+            return ""
+
+    def parse(self, table: str) -> List[str]:
+        neighbors = []
+
+        # 192.168.0.10 dev eth0 lladdr aa:bb:cc:dd:ee:ff REACHABLE
+        for line in table.splitlines():
+            fields = line.split()
+            if not fields or "lladdr" not in fields or fields[-1] in self.FAILED_STATES:
+                continue
+
+            if fields[0] not in neighbors:
+                neighbors.append(fields[0])
+
+        return neighbors
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import time
+
+try:
+    from constants import *
+except:
+    from .constants import *
+
+# the action phases in the order they happen
+ACCEPTED = "accepted"  # the Bobcat accepted the action request
+UNREACHABLE = "unreachable"  # the Bobcat went down
+REACHABLE = "reachable"  # the Bobcat is back up
+RUNNING = "running"  # the miner is running
+SYNCED = "synced"  # the miner is synced
+ACTION_PHASES = (ACCEPTED, UNREACHABLE, REACHABLE, RUNNING, SYNCED)
+
+
+@dataclass(frozen=True)
+class BobcatPollingPolicy:
+    """A class for the Bobcat recovery polling policy. After an action the Bobcat is watched every `down_interval` until it goes down. Then the interval between polls grows from `initial_interval` up to `max_interval` until the `deadline`."""
+
+    down_interval: float = 2.0  # seconds between checks while waiting for the Bobcat to go down
+    down_timeout: float = THIRTY_SECONDS  # max seconds to wait for the Bobcat to go down
+    initial_interval: float = 10.0  # seconds between the first polls
+    growth: float = 2.0  # the interval multiplier after each poll
+    max_interval: float = ONE_MINUTE  # max seconds between polls
+    deadline: float = ONE_HOUR  # max seconds of polling before giving up
+
+    def start(self) -> BobcatPoller:
+        """Start polling for the recovery.
+        Returns:
+            (BobcatPoller): The poller that hands out the growing intervals until the deadline.
+        """
+        return BobcatPoller(self.initial_interval, self.growth, self.max_interval, self.deadline)
+
+    def start_down_watch(self) -> BobcatPoller:
+        """Start watching for the Bobcat to go down after an action.
+        Returns:
+            (BobcatPoller): The poller that hands out the `down_interval` until the `down_timeout`.
+        """
+        return BobcatPoller(self.down_interval, 1.0, self.down_interval, self.down_timeout)
+
+
+class BobcatPoller:
+    """A class for handing out polling intervals until a deadline."""
+
+    def __init__(
+        self, initial_interval: float, growth: float, max_interval: float, deadline: float
+    ) -> None:
+        """The Bobcat Poller constructor.
+
+        Args:
+            initial_interval (float): The seconds before the first poll.
+            growth (float): The interval multiplier after each poll.
+            max_interval (float): The max seconds between polls.
+            deadline (float): The max seconds of polling.
+        """
+        self.growth = growth
+        self.max_interval = max_interval
+        self.deadline = deadline
+        self.polls = 0
+        self._started = time.monotonic()
+        self._scheduled = 0.0
+        self._interval = initial_interval
+
+    @property
+    def elapsed(self) -> float:
+        """Get the polling time. The scheduled intervals count in full even when the wait was skipped e.g. with `no_wait`.
+        Returns:
+            (float): The seconds since polling started.
+        """
+        return max(time.monotonic() - self._started, self._scheduled)
+
+    def next_interval(self) -> Optional[float]:
+        """Get the seconds to wait before the next poll.
+        Returns:
+            (float, None): The interval, cut short by the deadline, or None when the deadline has passed.
+        """
+        remaining = self.deadline - self.elapsed
+
+        if remaining <= 0:
+            return None
+
+        interval = min(self._interval, remaining)
+        self._interval = min(self._interval * self.growth, self.max_interval)
+        self._scheduled += interval
+        self.polls += 1
+        return interval
+
+
+@dataclass
+class BobcatRecovery:
+    """A class for the lifecycle of a Bobcat action e.g. a reboot. Each phase is recorded with the time it was first seen."""
+
+    action: str
+    phases: Dict[str, float] = field(default_factory=dict)  # the phase mapped to its timestamp
+
+    def record(self, phase: str, timestamp: float = None) -> None:
+        """Record a phase. A phase that was already seen keeps its first timestamp.
+        Args:
+            phase (str): The phase e.g. unreachable.
+            timestamp (float, optional): The time the phase was seen. Defaults to now.
+        """
+        self.phases.setdefault(phase, time.time() if timestamp is None else timestamp)
+
+    def elapsed(self, phase: str) -> Optional[float]:
+        """Get the time from the accepted action to a phase.
+        Args:
+            phase (str): The phase e.g. running.
+        Returns:
+            (float, None): The seconds or None when the phase was not seen.
+        """
+        if phase not in self.phases or ACCEPTED not in self.phases:
+            return None
+
+        return self.phases[phase] - self.phases[ACCEPTED]
+
+    @property
+    def phase(self) -> Optional[str]:
+        """Get the last phase.
+        Returns:
+            (str, None): The last phase that was seen or None when the action was not accepted.
+        """
+        return next((phase for phase in reversed(ACTION_PHASES) if phase in self.phases), None)
+
+    @property
+    def went_down(self) -> bool:
+        """Check whether the Bobcat went down. An action that never took the Bobcat down may have been ignored.
+        Returns:
+            (bool): Whether the Bobcat was seen unreachable after the action.
+        """
+        return UNREACHABLE in self.phases
+
+    @property
+    def running(self) -> bool:
+        """Check whether the miner is running again.
+        Returns:
+            (bool): Whether the miner was seen running after the action.
+        """
+        return RUNNING in self.phases
+
+    @property
+    def synced(self) -> bool:
+        """Check whether the final phase was reached.
+        Returns:
+            (bool): Whether the miner was seen synced after the action.
+        """
+        return SYNCED in self.phases
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the recovery time.
+        Returns:
+            (float, None): The seconds from the accepted action to the last phase or None when the action was not accepted.
+        """
+        return self.elapsed(self.phase) if self.phase else None
+
+    def __str__(self) -> str:
+        phases = " → ".join(
+            f"{phase} ({int(self.elapsed(phase))}s)"
+            for phase in ACTION_PHASES
+            if phase in self.phases
+        )
+        return f"{self.action}: {phases}"
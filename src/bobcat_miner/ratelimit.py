@@ -0,0 +1,133 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict
+
+import threading
+import time
+
+
+@dataclass
+class BobcatRateLimitStats:
+    """A class for the request throttling statistics of a host."""
+
+    requests: int
+    throttled: int  # requests that waited for a token
+    waited: float  # total seconds spent waiting for tokens
+
+
+class TokenBucket:
+    """A thread safe token bucket. Requests reserve a token and wait until the reservation is due, so throttled requests are served in order."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """The Token Bucket constructor.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (int): The max number of tokens i.e. the request burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._stats = BobcatRateLimitStats(requests=0, throttled=0, waited=0.0)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update.
+        Args:
+            now (float): The current monotonic time.
+        """
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve a token.
+        Returns:
+            (float): The seconds to wait before the token can be used.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            delay = max(-self._tokens / self.rate, 0.0)
+
+            self._stats.requests += 1
+            if delay:
+                self._stats.throttled += 1
+                self._stats.waited += delay
+
+            return delay
+
+    def pause(self, duration: float) -> None:
+        """Drain the bucket so the next token is available after the duration e.g. when the host refused a request.
+        Args:
+            duration (float): The seconds to pause.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1.0) - duration * self.rate
+
+    def stats(self) -> BobcatRateLimitStats:
+        """Get the throttling statistics.
+        Returns:
+            (BobcatRateLimitStats): A copy of the throttling statistics.
+        """
+        with self._lock:
+            return BobcatRateLimitStats(**vars(self._stats))
+
+
+class BobcatRateLimiter:
+    """A class for per-host request throttling. Each host gets its own token bucket.
+
+    The default bucket lets one full refresh of the five diagnoser endpoints through at once and then refills one token every
+    two seconds, which keeps a polling loop below the point where the diagnoser answers "rate limit exceeded".
+    """
+
+    def __init__(self, rate: float = 0.5, capacity: int = 5) -> None:
+        """The Bobcat Rate Limiter constructor.
+
+        Args:
+            rate (float, optional): The sustained requests per second for each host. Defaults to 0.5.
+            capacity (int, optional): The request burst size for each host. Defaults to 5.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get the token bucket for the host.
+        Args:
+            host (str): The host e.g. 192.168.0.10.
+        Returns:
+            (TokenBucket): The token bucket for the host.
+        """
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[host]
+
+    def reserve(self, host: str) -> float:
+        """Reserve a request for the host.
+        Args:
+            host (str): The host e.g. 192.168.0.10.
+        Returns:
+            (float): The seconds to wait before the request is sent.
+        """
+        return self.bucket(host).reserve()
+
+    def pause(self, host: str, duration: float) -> None:
+        """Pause the requests for the host.
+        Args:
+            host (str): The host e.g. 192.168.0.10.
+            duration (float): The seconds to pause.
+        """
+        self.bucket(host).pause(duration)
+
+    def stats(self, host: str) -> BobcatRateLimitStats:
+        """Get the throttling statistics for the host.
+        Args:
+            host (str): The host e.g. 192.168.0.10.
+        Returns:
+            (BobcatRateLimitStats): The throttling statistics.
+        """
+        return self.bucket(host).stats()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Tuple, Type
+
+import aiohttp
+import asyncio
+import backoff
+import logging
+import requests
+
+RETRYABLE_ERRORS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
+# a request that was never sent can not have reached the bobcat so it is always safe to retry
+UNSENT_ERRORS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectTimeout,
+    aiohttp.ClientConnectorError,
+)
+
+
+@dataclass(frozen=True)
+class BobcatRetryPolicy:
+    """A class for the Bobcat request timeout and retry policy. Retries back off exponentially with full jitter."""
+
+    connect_timeout: float = 5.0  # seconds to open the connection
+    read_timeout: float = 60.0  # seconds between response bytes e.g. speed.json
+    max_attempts: int = 3
+    backoff_factor: float = 1.0  # seconds before the first retry
+    backoff_max: float = 30.0  # max seconds between retries
+    jitter: bool = True
+    retryable: Tuple[Type[Exception], ...] = RETRYABLE_ERRORS
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Get the requests timeout.
+        Returns:
+            (Tuple[float, float]): The connect and read timeouts in seconds.
+        """
+        return self.connect_timeout, self.read_timeout
+
+    @property
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """Get the aiohttp timeout.
+        Returns:
+            (aiohttp.ClientTimeout): The connect and read timeouts.
+        """
+        return aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+
+    def retry(
+        self,
+        func: Callable,
+        retryable: Tuple[Type[Exception], ...] = None,
+        logger: logging.Logger = None,
+    ) -> Callable:
+        """Wrap the function so retryable errors are retried. Coroutine functions are awaited between retries without blocking the event loop.
+        Args:
+            func (Callable): The function or coroutine function that makes the request.
+            retryable (Tuple[Type[Exception], ...], optional): The errors to retry. Defaults to the policy's retryable errors.
+            logger (logging.Logger, optional): The logger for the retry warnings.
+        Returns:
+            (Callable): The wrapped function. The last error is raised after `max_attempts`.
+        """
+
+        def log_backoff(details: dict) -> None:
+            if logger:
+                logger.debug(
+                    f"Retrying in {details['wait']:.1f} seconds (attempt {details['tries']}/{self.max_attempts}): {details['exception']!r}"
+                )
+
+        return backoff.on_exception(
+            backoff.expo,
+            retryable if retryable is not None else self.retryable,
+            max_tries=self.max_attempts,
+            jitter=backoff.full_jitter if self.jitter else None,
+            on_backoff=log_backoff,
+            logger=None,
+            factor=self.backoff_factor,
+            max_value=self.backoff_max,
+        )(func)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from typing import IO, Any, Union
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass so callers only need to catch the stdlib error
+JSONDecodeError = json.JSONDecodeError
+
+BACKEND = "orjson" if orjson else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON with orjson when it is installed.
+    Args:
+        data (bytes, str): The JSON document.
+    Returns:
+        (Any): The deserialized object.
+    Raises:
+        JSONDecodeError: When the document is not valid JSON.
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize JSON with orjson when it is installed.
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool, optional): Whether to pretty print with a two space indent. Defaults to False.
+    Returns:
+        (str): The JSON document. Both backends produce the same compact or indented output.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+        except TypeError:
+            # e.g. non-string dict keys
+            pass
+
+    return json.dumps(obj, indent=2) if indent else json.dumps(obj, separators=(",", ":"))
+
+
+def load(f: IO) -> Any:
+    """Deserialize a JSON file.
+    Args:
+        f (IO): The open file.
+    Returns:
+        (Any): The deserialized object.
+    Raises:
+        JSONDecodeError: When the file is not valid JSON.
+    """
+    return loads(f.read())
+
+
+def dump(obj: Any, f: IO) -> None:
+    """Serialize an object to a JSON file.
+    Args:
+        obj (Any): The object to serialize.
+        f (IO): The open text file.
+    """
+    f.write(dumps(obj))
@@ -0,0 +1,295 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import re
+
+
+def _parse_int(value: Any) -> Any:
+    """Parse a numeric string e.g. the gap.
+    Args:
+        value (Any): The raw value.
+    Returns:
+        (Any): The int or the raw value when it is not numeric e.g. "-".
+    """
+    return int(value) if isinstance(value, str) and value.lstrip("-").isdigit() else value
+
+
+# the measurement units mapped to the factor that converts them to Mbit/s or milliseconds
+SPEED_UNITS = {"bit/s": 1e-6, "Kbit/s": 1e-3, "Mbit/s": 1.0, "Gbit/s": 1e3}
+LATENCY_UNITS = {"ns": 1e-6, "µs": 1e-3, "us": 1e-3, "ms": 1.0, "s": 1e3}
+
+
+def _parse_measurement(value: Any, units: Dict[str, float]) -> Optional[float]:
+    """Parse a measurement string e.g. "94 Mbit/s" or "7.669083ms".
+    Args:
+        value (Any): The raw value.
+        units (Dict[str, float]): The units mapped to their conversion factor.
+    Returns:
+        (float, None): The converted number or None when it is not a measurement e.g. an empty speed test result.
+    """
+    match = (
+        re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(\S+)\s*", value) if isinstance(value, str) else None
+    )
+
+    if not match or match.group(2) not in units:
+        return None
+
+    return float(match.group(1)) * units[match.group(2)]
+
+
+def _parse_tables(lines: List[str]) -> List[Tuple[List[str], List[List[str]]]]:
+    """Parse the ASCII tables e.g. the p2p_status or peerbook lines.
+    Args:
+        lines (List[str]): The raw table lines.
+    Returns:
+        (List[Tuple[List[str], List[List[str]]]]): The header cells and the row cells of each table.
+    """
+    tables, header, rows, borders = [], None, [], 0
+
+    for line in list(lines or []) + [""]:
+        line = line.strip()
+
+        if line.startswith("+"):
+            borders += 1
+        elif line.startswith("|"):
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+
+            if borders == 1 and header is None:
+                header = cells
+            else:
+                rows.append(cells)
+        elif borders:
+            # a line that is not part of the table ends it
+            tables.append((header or [], rows))
+            header, rows, borders = None, [], 0
+
+    return tables
+
+
+def _parse_yes_no(value: Optional[str]) -> Optional[bool]:
+    """Parse a yes or no value e.g. the connected row.
+    Args:
+        value (str, None): The raw value.
+    Returns:
+        (bool, None): Whether the value is yes or None when it is missing.
+    """
+    return None if value is None else value.lower() == "yes"
+
+
+@dataclass(frozen=True)
+class BobcatPeerSession:
+    """A class for a row of the peerbook session table."""
+
+    local: str
+    remote: str
+    p2p: str
+    name: str
+
+
+class BobcatSnapshot:
+    """A base class for an immutable snapshot of the endpoint data. Snapshots are parsed once per refresh and the raw data is kept in `raw`."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Dict) -> None:
+        """The Bobcat Snapshot constructor.
+
+        Args:
+            raw (Dict): The raw endpoint data.
+        """
+        object.__setattr__(self, "raw", raw)
+
+    def _set(self, **fields: Any) -> None:
+        """Set the parsed fields once from the constructor.
+        Args:
+            fields (Any): The parsed field values.
+        """
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class StatusSnapshot(BobcatSnapshot):
+    """A class for the status.json snapshot."""
+
+    __slots__ = ("status", "gap", "miner_height", "blockchain_height", "epoch", "tip")
+
+    def __init__(self, raw: Dict) -> None:
+        super().__init__(raw)
+        self._set(
+            status=raw.get("status"),
+            gap=_parse_int(raw.get("gap")),
+            miner_height=_parse_int(raw.get("miner_height")),
+            blockchain_height=_parse_int(raw.get("blockchain_height")),
+            epoch=_parse_int(raw.get("epoch")),
+            tip=raw.get("tip"),
+        )
+
+
+class MinerSnapshot(BobcatSnapshot):
+    """A class for the miner.json snapshot."""
+
+    __slots__ = (
+        "ota_version",
+        "region",
+        "frequency_plan",
+        "animal",
+        "helium_animal",
+        "pubkey",
+        "miner_state",
+        "miner_status",
+        "miner_alert",
+        "miner_desc",
+        "names",
+        "image",
+        "created",
+        "p2p_status",
+        "ports_desc",
+        "ports",
+        "private_ip",
+        "public_ip",
+        "peerbook",
+        "timestamp",
+        "error",
+        "connected",
+        "dialable",
+        "nat_type",
+        "p2p_height",
+        "listen_addrs",
+        "sessions",
+    )
+
+    def __init__(self, raw: Dict) -> None:
+        super().__init__(raw)
+        miner = raw.get("miner", {})
+        animal = raw.get("animal")
+
+        # the p2p_status table has a name and a result column e.g. |nat_type | none  |
+        p2p_status = {
+            row[0].lower(): row[1]
+            for _, rows in _parse_tables(raw.get("p2p_status"))
+            for row in rows
+            if len(row) == 2
+        }
+
+        # the peerbook has the peer, listen_addrs and session tables
+        listen_addrs, sessions = (), ()
+        for header, rows in _parse_tables(raw.get("peerbook")):
+            if header and header[0].startswith("listen_addrs"):
+                listen_addrs = tuple(row[0] for row in rows if row)
+            elif header == ["local", "remote", "p2p", "name"]:
+                sessions = tuple(BobcatPeerSession(*row) for row in rows if len(row) == 4)
+
+        self._set(
+            ota_version=raw.get("ota_version"),
+            region=raw.get("region"),
+            frequency_plan=raw.get("frequency_plan"),
+            animal=animal,
+            helium_animal=(
+                " ".join(word.capitalize() for word in animal.split("-")) if animal else animal
+            ),
+            pubkey=raw.get("pubkey"),
+            miner_state=str(miner.get("State")),
+            miner_status=miner.get("Status"),
+            miner_alert=raw.get("miner_alert", None),
+            miner_desc=raw.get("miner_desc", {}),
+            names=miner.get("Names"),
+            image=miner.get("Image"),
+            created=miner.get("Created"),
+            p2p_status="\n".join(raw.get("p2p_status") or []),
+            ports_desc=raw.get("ports_desc"),
+            ports=raw.get("ports", {}),
+            private_ip=raw.get("private_ip"),
+            public_ip=raw.get("public_ip"),
+            peerbook="\n".join(raw.get("peerbook", [])),
+            timestamp=raw.get("timestamp"),
+            error=raw.get("error", None),
+            connected=_parse_yes_no(p2p_status.get("connected")),
+            dialable=_parse_yes_no(p2p_status.get("dialable")),
+            nat_type=p2p_status.get("nat_type", "").lower() or None,
+            p2p_height=_parse_int(p2p_status.get("height")),
+            listen_addrs=listen_addrs,
+            sessions=sessions,
+        )
+
+
+class TempSnapshot(BobcatSnapshot):
+    """A class for the temp.json snapshot. Temperatures are in Celsius unless the field name ends in `_f`."""
+
+    __slots__ = ("temp0", "temp1", "coldest_temp", "hottest_temp", "temp0_f", "temp1_f")
+
+    def __init__(self, raw: Dict) -> None:
+        super().__init__(raw)
+        temp0, temp1 = int(raw.get("temp0")), int(raw.get("temp1"))
+
+        self._set(
+            temp0=temp0,
+            temp1=temp1,
+            coldest_temp=min(temp0, temp1),
+            hottest_temp=max(temp0, temp1),
+            temp0_f=round(temp0 * 1.8 + 32, 1),
+            temp1_f=round(temp1 * 1.8 + 32, 1),
+        )
+
+
+class SpeedSnapshot(BobcatSnapshot):
+    """A class for the speed.json snapshot. The raw strings are kept next to the parsed numbers."""
+
+    __slots__ = (
+        "download_speed",
+        "upload_speed",
+        "latency",
+        "download_mbps",
+        "upload_mbps",
+        "latency_ms",
+    )
+
+    def __init__(self, raw: Dict) -> None:
+        super().__init__(raw)
+        download_speed = raw.get("DownloadSpeed")
+        upload_speed = raw.get("UploadSpeed")
+        latency = raw.get("Latency")
+
+        self._set(
+            download_speed=download_speed,
+            upload_speed=upload_speed,
+            latency=latency,
+            download_mbps=_parse_measurement(download_speed, SPEED_UNITS),
+            upload_mbps=_parse_measurement(upload_speed, SPEED_UNITS),
+            latency_ms=_parse_measurement(latency, LATENCY_UNITS),
+        )
+
+
+class DigSnapshot(BobcatSnapshot):
+    """A class for the dig.json snapshot."""
+
+    __slots__ = ("name", "message", "dns", "records")
+
+    def __init__(self, raw: Dict) -> None:
+        super().__init__(raw)
+        self._set(
+            name=raw.get("name"),
+            message=raw.get("message"),
+            dns=raw.get("DNS"),
+            records=raw.get("records", []),
+        )
+
+
+# the endpoint name mapped to its snapshot class
+SNAPSHOTS = {
+    "status": StatusSnapshot,
+    "miner": MinerSnapshot,
+    "temp": TempSnapshot,
+    "speed": SpeedSnapshot,
+    "dig": DigSnapshot,
+}
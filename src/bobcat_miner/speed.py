@@ -0,0 +1,149 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import threading
+import time
+
+try:
+    from constants import *
+except:
+    from .constants import *
+
+
+@dataclass
+class BobcatSpeedResult:
+    """A class for a network speed test result."""
+
+    data: Dict
+    timestamp: float  # when the result was refreshed
+
+    @property
+    def age(self) -> float:
+        """Get the age of the result.
+        Returns:
+            (float): The seconds since the result was refreshed.
+        """
+        return time.time() - self.timestamp
+
+
+class BobcatSpeedWorker:
+    """A class for refreshing the network speed data in the background. The speed test is slow and often returns empty results, so callers are served the last good result instead of waiting for it."""
+
+    def __init__(
+        self,
+        bobcat: BobcatAPI,
+        interval: float = THIRTY_MINUTES,
+        retry_interval: float = THIRTY_SECONDS,
+    ) -> None:
+        """The Bobcat Speed Worker constructor.
+
+        Args:
+            bobcat (BobcatAPI): The Bobcat to refresh.
+            interval (float, optional): The seconds between speed tests. Defaults to THIRTY_MINUTES.
+            retry_interval (float, optional): The seconds before an empty or failed speed test is retried. Defaults to THIRTY_SECONDS.
+        """
+        self.bobcat = bobcat
+        self.interval = interval
+        self.retry_interval = retry_interval
+        self._result = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def result(self) -> Optional[BobcatSpeedResult]:
+        """Get the last good speed test result.
+        Returns:
+            (BobcatSpeedResult, None): The last good result or None when no speed test has succeeded yet.
+        """
+        return self._result
+
+    @property
+    def running(self) -> bool:
+        """Check whether the worker is running.
+        Returns:
+            (bool): Whether the background refresh is running.
+        """
+        return bool(self._thread and self._thread.is_alive() and not self._stopped.is_set())
+
+    def refresh(self) -> bool:
+        """Run one speed test. Empty results are discarded so the last good result is kept.
+        Returns:
+            (bool): Whether the speed test returned a good result.
+        """
+        path, description = self.bobcat.ENDPOINTS["speed"]
+
+        try:
+            response = self.bobcat._BobcatConnection__get(f"http://{self.bobcat._hostname}/{path}")
+            data, digest = self.bobcat._decode("speed", response.content)
+        except Exception as err:
+            self.bobcat.logger.warning(f"Refresh: Unable to refresh {description} ({err!r})")
+            return False
+
+        if self.bobcat._should_retry("speed", data):
+            self.bobcat.logger.debug(
+                f"Refresh: {description} is not ready. Retrying in {self.retry_interval} seconds"
+            )
+            return False
+
+        changed = self.bobcat._store("speed", data, digest)
+        self._result = BobcatSpeedResult(data=data, timestamp=time.time())
+        self.bobcat._endpoint_cache.touch("speed")
+        self.bobcat._log_refresh("speed", data, changed)
+        self._ready.set()
+        return True
+
+    def _seed(self) -> float:
+        """Use the speed data that the Bobcat already has as the first result.
+        Returns:
+            (float): The seconds before the first speed test.
+        """
+        age = self.bobcat._endpoint_cache.age("speed")
+        data = self.bobcat._speed_data
+
+        if age is None or not data or self.bobcat._should_retry("speed", data):
+            return 0
+
+        self._result = BobcatSpeedResult(data=data, timestamp=time.time() - age)
+        self._ready.set()
+        return max(self.interval - age, 0)
+
+    def _run(self) -> None:
+        """Refresh the speed data until the worker is stopped."""
+        delay = self._seed()
+
+        while not self._stopped.wait(delay):
+            delay = self.interval if self.refresh() else self.retry_interval
+
+    def start(self) -> BobcatSpeedWorker:
+        """Start refreshing the speed data in a daemon thread.
+        Returns:
+            (BobcatSpeedWorker): The instance of the BobcatSpeedWorker.
+        """
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="bobcat-speed", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the worker. A speed test that is still running is abandoned after the timeout.
+        Args:
+            timeout (float, optional): The max seconds to wait for the worker to finish. Defaults to waiting until it finishes.
+        """
+        self._stopped.set()
+
+        if self._thread:
+            self._thread.join(timeout)
+
+    def wait(self, timeout: float = None) -> Optional[BobcatSpeedResult]:
+        """Wait for the first good speed test result.
+        Args:
+            timeout (float, optional): The max seconds to wait. Defaults to waiting forever.
+        Returns:
+            (BobcatSpeedResult, None): The last good result or None when the timeout expired first.
+        """
+        self._ready.wait(timeout)
+        return self._result
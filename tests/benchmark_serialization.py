@@ -0,0 +1,51 @@
+"""Benchmark the JSON serialization backend against the stdlib on the mock Bobcat endpoint payloads.
+
+Usage: python tests/benchmark_serialization.py
+"""
+
+import json
+import timeit
+
+from bobcat_miner import serialization
+
+import mock_endpoints
+
+PAYLOADS = {
+    "status.json": mock_endpoints.synced_status_data,
+    "miner.json": mock_endpoints.synced_miner_data,
+    "temp.json": mock_endpoints.synced_temp_data,
+    "speed.json": mock_endpoints.synced_speed_data,
+    "dig.json": mock_endpoints.synced_dig_data,
+}
+
+NUMBER = 10000
+
+
+def bench(func) -> float:
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(f"backend: {serialization.BACKEND}")
+    print(f"{'payload':<12} {'op':<14} {'json (us)':>10} {'backend (us)':>13} {'speedup':>8}")
+
+    for name, data in PAYLOADS.items():
+        body = json.dumps(data).encode()
+
+        for op, baseline, candidate in [
+            ("loads", lambda: json.loads(body), lambda: serialization.loads(body)),
+            (
+                "dumps indent",
+                lambda: json.dumps(data, indent=4),
+                lambda: serialization.dumps(data, indent=True),
+            ),
+        ]:
+            baseline_us, candidate_us = bench(baseline), bench(candidate)
+            print(
+                f"{name:<12} {op:<14} {baseline_us:>10.2f} {candidate_us:>13.2f} {baseline_us / candidate_us:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
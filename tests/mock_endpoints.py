@@ -341,3 +341,10 @@ def mock_healthy_and_helium_api_is_stale(*args, **kwargs):
     response.status_code = 200
     response._content = str.encode(response_content)
     return response
+
+
+def mock_json_response(data):
+    response = Response()
+    response.status_code = 200
+    response._content = str.encode(json.dumps(data))
+    return response
@@ -1,9 +1,16 @@
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from unittest.mock import call
 
+import requests
+import time
 import unittest
 
-from bobcat_miner import BobcatAPI
+from bobcat_miner import (
+    BobcatAPI,
+    BobcatRateLimitError,
+    BobcatRefreshError,
+    BobcatSpeedTestNotReadyError,
+)
 
 import mock_endpoints
 
@@ -17,7 +24,7 @@ class TestBobcatAPI(unittest.TestCase):
         self.mock_hostname = "192.168.0.10"
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_status(self, mock_requests_get, mock_bobcat_conn_is_bobcat):
         BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_status()
         mock_requests_get.assert_called_once_with("http://" + self.mock_hostname + "/status.json")
@@ -29,25 +36,25 @@ class TestBobcatAPI(unittest.TestCase):
         mock_refresh_miner.assert_called_once_with()
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_temp(self, mock_requests_get, mock_verify):
         BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_temp()
         mock_requests_get.assert_called_once_with("http://" + self.mock_hostname + "/temp.json")
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_speed(self, mock_requests_get, mock_verify):
         BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_speed()
         mock_requests_get.assert_called_once_with("http://" + self.mock_hostname + "/speed.json")
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_dig(self, mock_requests_get, mock_verify):
         BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_dig()
         mock_requests_get.assert_called_once_with("http://" + self.mock_hostname + "/dig.json")
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh(self, mock_requests_get, mock_verify):
         BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh()
         mock_requests_get.assert_has_calls(
@@ -62,7 +69,177 @@ class TestBobcatAPI(unittest.TestCase):
         )
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.get")
+    def test_refresh_is_concurrent(self, mock_requests_get, mock_verify):
+        def slow_endpoint(url):
+            time.sleep(0.2)
+            return mock_endpoints.mock_online(url)
+
+        mock_requests_get.side_effect = slow_endpoint
+
+        start = time.monotonic()
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(mock_requests_get.call_count, 5)
+        self.assertLess(elapsed, 0.2 * 5)
+        self.assertEqual(b._speed_data, mock_endpoints.synced_speed_data)
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_logs_in_endpoint_order(self, mock_requests_get, mock_verify):
+        def status_is_slowest(url):
+            if url.endswith("/status.json"):
+                time.sleep(0.2)
+            return mock_endpoints.mock_online(url)
+
+        mock_requests_get.side_effect = status_is_slowest
+        b = BobcatAPI(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+        b.refresh()
+
+        self.assertEqual(
+            b.logger.mock_calls,
+            [
+                call.debug("Refresh: Status Data"),
+                call.debug("Refresh: Miner Data"),
+                call.debug("Refresh: Network Speed Data"),
+                call.debug("Refresh: Temperature Data"),
+                call.debug("Refresh: DNS Data"),
+            ],
+        )
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_reports_endpoint_errors(self, mock_requests_get, mock_verify):
+        def flaky_endpoint(url):
+            if url.endswith(("/speed.json", "/dig.json")):
+                raise requests.exceptions.ReadTimeout(url)
+            return mock_endpoints.mock_online(url)
+
+        mock_requests_get.side_effect = flaky_endpoint
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED, max_attempts=1)
+
+        with self.assertRaises(BobcatRefreshError) as cm:
+            b.refresh()
+
+        self.assertEqual(sorted(cm.exception.errors), ["dig", "speed"])
+        self.assertIsInstance(cm.exception.errors["speed"], requests.exceptions.ReadTimeout)
+
+        # the other endpoints are still refreshed
+        self.assertEqual(b._status_data, mock_endpoints.synced_status_data)
+        self.assertEqual(b._miner_data, mock_endpoints.synced_miner_data)
+        self.assertEqual(b._temp_data, mock_endpoints.synced_temp_data)
+
+    @patch("time.sleep")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_status_retries_rate_limit(self, mock_requests_get, mock_verify, mock_sleep):
+        rate_limited = mock_endpoints.mock_json_response({"message": "rate limit exceeded"})
+        mock_requests_get.side_effect = [rate_limited, mock_endpoints.mock_online("/status.json")]
+
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_status()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(b._status_data, mock_endpoints.synced_status_data)
+
+        # the retry waits for the backoff instead of sleeping and recursing
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 30, places=1)
+        self.assertEqual(b.rate_limit_stats().throttled, 1)
+
+    @patch("time.sleep")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_status_raises_rate_limit_error(
+        self, mock_requests_get, mock_verify, mock_sleep
+    ):
+        mock_requests_get.side_effect = lambda url: mock_endpoints.mock_json_response(
+            {"message": "rate limit exceeded"}
+        )
+
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED, rate_limit_max_attempts=4)
+        with self.assertRaises(BobcatRateLimitError) as cm:
+            b.refresh_status()
+
+        self.assertEqual(mock_requests_get.call_count, 4)
+        self.assertEqual(cm.exception.endpoint, "status")
+        self.assertEqual(cm.exception.attempts, 4)
+        self.assertEqual(cm.exception.waited, 90)
+
+    @patch("time.sleep")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_status_keeps_data_when_rate_limited(
+        self, mock_requests_get, mock_verify, mock_sleep
+    ):
+        mock_requests_get.side_effect = mock_endpoints.mock_online
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED).refresh_status()
+        status_data = b._status_data
+
+        mock_requests_get.side_effect = lambda url: mock_endpoints.mock_json_response(
+            {"message": "rate limit exceeded"}
+        )
+        with self.assertRaises(BobcatRateLimitError):
+            b.refresh_status()
+
+        # the rate limited response is never stored as the status data
+        self.assertIs(b._status_data, status_data)
+
+    @patch("time.sleep")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_refresh_speed_raises_speed_test_not_ready_error(
+        self, mock_requests_get, mock_verify, mock_sleep
+    ):
+        mock_requests_get.side_effect = lambda url: mock_endpoints.mock_json_response(
+            {"DownloadSpeed": "", "UploadSpeed": "", "Latency": ""}
+        )
+
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED, rate_limit_max_attempts=2)
+        with self.assertRaises(BobcatSpeedTestNotReadyError) as cm:
+            b.refresh_speed()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(cm.exception.attempts, 2)
+        self.assertEqual(cm.exception.waited, 30)
+        self.assertEqual(b._speed_data, {})
+
+    @patch("time.sleep")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
+    def test_refresh_is_throttled_per_host(self, mock_requests_get, mock_verify, mock_sleep):
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
+        b.refresh()
+        self.assertFalse(mock_sleep.called)
+
+        # the burst is spent so the next refresh is throttled before the bobcat refuses it
+        b.refresh_status()
+        mock_sleep.assert_called_once()
+        self.assertEqual(b.rate_limit_stats().requests, 6)
+        self.assertEqual(b.rate_limit_stats().throttled, 1)
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
+    def test_refresh_detects_unchanged_data(self, mock_requests_get, mock_verify):
+        b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
+        self.assertFalse(b.changed("dig"))
+
+        dig_data = b.refresh_dig()._dig_data
+        self.assertTrue(b.changed("dig"))
+
+        # an identical body is not parsed again so the data is the same object
+        with patch("bobcat_miner.serialization.loads") as mock_json_loads:
+            self.assertIs(b.refresh_dig()._dig_data, dig_data)
+        self.assertFalse(mock_json_loads.called)
+        self.assertFalse(b.changed("dig"))
+
+        mock_requests_get.side_effect = mock_endpoints.mock_offline
+        self.assertEqual(b.refresh_dig()._dig_data, mock_endpoints.down_dig_data)
+        self.assertTrue(b.changed("dig"))
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     def test_reboot(self, mock_requests_post, mock_verify):
         b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
         actual_response = b._BobcatAPI__reboot()
@@ -74,7 +251,7 @@ class TestBobcatAPI(unittest.TestCase):
         self.assertEqual(actual_response.text, mock_endpoints.reboot_response_data)
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     def test_reset(self, mock_requests_post, mock_verify):
         b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
         actual_response = b._BobcatAPI__reset()
@@ -89,7 +266,7 @@ class TestBobcatAPI(unittest.TestCase):
         )
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     def test_resync(self, mock_requests_post, mock_verify):
         b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
         actual_response = b._BobcatAPI__resync()
@@ -104,7 +281,7 @@ class TestBobcatAPI(unittest.TestCase):
         )
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     def test_fastsync(self, mock_requests_post, mock_verify):
         b = BobcatAPI(hostname=self.mock_hostname, log_level=DISABLED)
         actual_response = b._BobcatAPI__fastsync()
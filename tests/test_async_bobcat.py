@@ -0,0 +1,230 @@
+from aiohttp import web
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import aiohttp
+import asyncio
+import unittest
+
+from bobcat_miner import AsyncBobcat, BobcatRefreshError, BobcatVerificationError
+
+import mock_endpoints
+
+DISABLED = 100
+
+
+class TestAsyncBobcat(unittest.TestCase):
+    """Test AsyncBobcat."""
+
+    def setUp(self):
+        self.requests = []
+        self.endpoints = {
+            "/status.json": mock_endpoints.synced_status_data,
+            "/miner.json": mock_endpoints.synced_miner_data,
+            "/temp.json": mock_endpoints.synced_temp_data,
+            "/speed.json": mock_endpoints.synced_speed_data,
+            "/dig.json": mock_endpoints.synced_dig_data,
+        }
+
+    async def handler(self, request):
+        self.requests.append((request.method, request.path, request.headers.get("Authorization")))
+
+        if request.path == "/":
+            return web.Response(
+                text="<html><head><title>Diagnoser - Bobcatminer Diagnostic Dashboard</title></head></html>",
+                content_type="text/html",
+            )
+        if request.path == "/admin/reboot":
+            return web.Response(text=mock_endpoints.reboot_response_data)
+
+        data = self.endpoints[request.path]
+        if isinstance(data, list):
+            data = data.pop(0)
+        if isinstance(data, Exception):
+            raise data
+        return web.json_response(data)
+
+    def run_with_server(self, test):
+        """Run the async test with the hostname of a local Bobcat web server."""
+
+        async def run():
+            app = web.Application()
+            app.router.add_route("*", "/{path:.*}", self.handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                return await test(f"127.0.0.1:{port}")
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(run())
+
+    def test_with_statement_requires_async_with(self):
+        bobcat = AsyncBobcat(hostname="192.168.0.10", log_level=DISABLED)
+
+        with self.assertRaisesRegex(TypeError, "async with"):
+            with bobcat:
+                pass
+
+    def test_refresh(self):
+        async def test(hostname):
+            async with AsyncBobcat(hostname=hostname, log_level=DISABLED) as bobcat:
+                await bobcat.refresh()
+                return bobcat
+
+        bobcat = self.run_with_server(test)
+
+        self.assertEqual(bobcat.status, "Synced")
+        self.assertEqual(bobcat.gap, 0)
+        self.assertEqual(bobcat.animal, "fancy-awesome-bobcat")
+        self.assertEqual(bobcat.hottest_temp, 38)
+        self.assertEqual(bobcat.download_speed, "94 Mbit/s")
+        self.assertTrue(bobcat.is_healthy)
+        self.assertEqual(
+            sorted(path for _, path, _ in self.requests),
+            ["/", "/dig.json", "/miner.json", "/speed.json", "/status.json", "/temp.json"],
+        )
+
+    def test_refresh_detects_unchanged_data(self):
+        self.endpoints["/status.json"] = [
+            mock_endpoints.synced_status_data,
+            mock_endpoints.synced_status_data,
+            mock_endpoints.down_status_data,
+        ]
+
+        async def test(hostname):
+            async with AsyncBobcat(hostname=hostname, log_level=DISABLED) as bobcat:
+                changed = []
+                for _ in range(3):
+                    await bobcat.refresh_status()
+                    changed.append(bobcat.changed("status"))
+                return bobcat, changed
+
+        bobcat, changed = self.run_with_server(test)
+
+        self.assertEqual(changed, [True, False, True])
+        self.assertEqual(bobcat.status, "Error")
+
+    def test_refresh_shares_session(self):
+        async def test(hostname):
+            async with aiohttp.ClientSession() as session:
+                bobcats = [
+                    AsyncBobcat(
+                        hostname=hostname, session=session, discover=False, log_level=DISABLED
+                    )
+                    for _ in range(10)
+                ]
+                await asyncio.gather(*(bobcat.refresh_status() for bobcat in bobcats))
+
+                for bobcat in bobcats:
+                    await bobcat.close()
+                return session.closed, [bobcat.status for bobcat in bobcats]
+
+        session_closed, statuses = self.run_with_server(test)
+
+        # the shared session is owned by the caller
+        self.assertFalse(session_closed)
+        self.assertEqual(statuses, ["Synced"] * 10)
+
+    def test_refresh_reports_endpoint_errors(self):
+        self.endpoints["/speed.json"] = web.HTTPInternalServerError(text="not json")
+
+        async def test(hostname):
+            async with AsyncBobcat(hostname=hostname, discover=False, log_level=DISABLED) as bobcat:
+                with self.assertRaises(BobcatRefreshError) as cm:
+                    await bobcat.refresh()
+                return bobcat, cm.exception
+
+        bobcat, err = self.run_with_server(test)
+
+        self.assertEqual(list(err.errors), ["speed"])
+        self.assertEqual(bobcat.status, "Synced")
+        self.assertEqual(bobcat.temp0, 38)
+
+    @patch("asyncio.sleep", return_value=AsyncMock())
+    def test_refresh_retries_rate_limit(self, mock_sleep):
+        self.endpoints["/temp.json"] = [
+            {"message": "rate limit exceeded"},
+            mock_endpoints.synced_temp_data,
+        ]
+
+        async def test(hostname):
+            async with AsyncBobcat(hostname=hostname, discover=False, log_level=DISABLED) as bobcat:
+                await bobcat.refresh_temp()
+                return bobcat
+
+        bobcat = self.run_with_server(test)
+
+        # the retry waits for the rate limit backoff
+        self.assertGreaterEqual(max(args[0] for args, _ in mock_sleep.await_args_list), 29)
+        self.assertEqual(bobcat.temp0, 38)
+
+    @patch("bobcat_miner.AsyncBobcat._recover")
+    def test_reboot(self, mock_recover):
+        async def test(hostname):
+            async with AsyncBobcat(hostname=hostname, discover=False, log_level=DISABLED) as bobcat:
+                await bobcat.reboot()
+
+        self.run_with_server(test)
+
+        self.assertEqual(self.requests, [("POST", "/admin/reboot", "Basic Ym9iY2F0Om1pbmVy")])
+        mock_recover.assert_awaited_once_with("Reboot", goes_down=True)
+
+    @patch("bobcat_miner.AsyncBobcat.ping", return_value=AsyncMock())
+    def test_connect_raises_verification_error(self, mock_ping):
+        mock_ping.return_value.reachable = True
+
+        async def test(hostname):
+            async with AsyncBobcat(
+                hostname=hostname, animal="Fancy Other Bobcat", log_level=DISABLED
+            ) as bobcat:
+                pass
+
+        with self.assertRaises(BobcatVerificationError):
+            self.run_with_server(test)
+
+    @patch("bobcat_miner.AsyncBobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.AsyncBobcat.wait_for_connection")
+    @patch("bobcat_miner.AsyncBobcat.wait")
+    @patch("bobcat_miner.AsyncBobcat.ping")
+    def test_recover(self, mock_ping, mock_wait, mock_wait_for_connection, mock_wait_until_running):
+        mock_ping.side_effect = [MagicMock(reachable=True), MagicMock(reachable=False)]
+
+        bobcat = AsyncBobcat(hostname="192.168.0.10", discover=False, log_level=DISABLED)
+        bobcat._status_data = mock_endpoints.synced_status_data
+        recovery = asyncio.run(bobcat._recover("Reboot", goes_down=True))
+
+        self.assertEqual(mock_wait.await_count, 2)
+        self.assertEqual(
+            list(recovery.phases), ["accepted", "unreachable", "reachable", "running", "synced"]
+        )
+        self.assertIs(bobcat.last_recovery(), recovery)
+
+    @patch("bobcat_miner.AsyncBobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.AsyncBobcat.wait_for_connection")
+    @patch("bobcat_miner.AsyncBobcat.wait")
+    @patch("bobcat_miner.AsyncBobcat.ping")
+    def test_recover_when_reboot_is_ignored(
+        self, mock_ping, mock_wait, mock_wait_for_connection, mock_wait_until_running
+    ):
+        mock_ping.return_value = MagicMock(reachable=True)
+
+        bobcat = AsyncBobcat(hostname="192.168.0.10", discover=False, log_level=DISABLED)
+        bobcat._status_data = mock_endpoints.synced_status_data
+        recovery = asyncio.run(bobcat._recover("Reboot", goes_down=True))
+
+        self.assertEqual(list(recovery.phases), ["accepted"])
+        self.assertFalse(mock_wait_for_connection.called)
+        self.assertFalse(mock_wait_until_running.called)
+
+    def test_attributes_are_not_refreshed_implicitly(self):
+        bobcat = AsyncBobcat(hostname="192.168.0.10", discover=False, log_level=DISABLED)
+
+        with self.assertRaises(RuntimeError):
+            bobcat.status
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,15 @@
 from unittest.mock import patch, call, PropertyMock, AsyncMock, MagicMock, mock_open
 
+import threading
 import unittest
 
-from bobcat_miner import BobcatAutopilot, Bobcat, OnlineStatusCheck
+from bobcat_miner import (
+    BobcatAutopilot,
+    Bobcat,
+    BobcatRecovery,
+    NetworkStatusCheck,
+    OnlineStatusCheck,
+)
 
 import mock_endpoints
 
@@ -13,8 +20,8 @@ class TestAutopilot(unittest.TestCase):
     @patch("bobcat_miner.BobcatAutopilot.error_checks", new_callable=PropertyMock)
     @patch("bobcat_miner.BobcatAutopilot.status_checks", new_callable=PropertyMock)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.post")
-    @patch("requests.get", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def setUp(
         self,
         mock_requests_get,
@@ -84,6 +91,85 @@ class TestAutopilot(unittest.TestCase):
             any_order=False,
         )
 
+    @patch("bobcat_miner.BobcatAPI.stop_speed_worker")
+    @patch("bobcat_miner.BobcatAPI.start_speed_worker")
+    @patch("bobcat_miner.BobcatAutopilot.status_checks", new_callable=PropertyMock)
+    @patch("bobcat_miner.BobcatAutopilot.error_checks", new_callable=PropertyMock)
+    @patch("bobcat_miner.OnlineStatusCheck.check")
+    @patch("filelock.FileLock.acquire")
+    def test_run_starts_and_stops_speed_worker(
+        self,
+        mock_filelock,
+        mock_online_status_check,
+        mock_error_checks,
+        mock_status_checks,
+        mock_start_speed_worker,
+        mock_stop_speed_worker,
+    ):
+        mock_error_checks.return_value = []
+        mock_status_checks.return_value = []
+
+        self.autopilot.run()
+
+        mock_start_speed_worker.assert_called_once_with()
+        mock_stop_speed_worker.assert_called_once_with(timeout=0)
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    @patch("bobcat_miner.BobcatAutopilot.status_checks", new_callable=PropertyMock)
+    @patch("bobcat_miner.BobcatAutopilot.error_checks", new_callable=PropertyMock)
+    @patch("bobcat_miner.OnlineStatusCheck.check")
+    @patch("filelock.FileLock.acquire")
+    def test_run_waits_for_the_first_speed_test(
+        self,
+        mock_filelock,
+        mock_online_status_check,
+        mock_error_checks,
+        mock_status_checks,
+        mock_requests_get,
+        mock_sleep,
+    ):
+        def slow_speed_test(url):
+            if url.endswith("/speed.json"):
+                threading.Event().wait(0.2)
+            return mock_endpoints.mock_online(url)
+
+        # a one-shot run has no speed data until the speed worker's first speed test
+        mock_requests_get.side_effect = slow_speed_test
+        self.bobcat._speed_data = {}
+        mock_error_checks.return_value = []
+        mock_status_checks.return_value = [NetworkStatusCheck(self.bobcat, False)]
+
+        self.autopilot.run()
+
+        self.bobcat.logger.info.assert_called_with("Network Status: Good 📶")
+        self.assertNotIn(
+            call.debug("Network Status: Skipped. The speed test has no results yet"),
+            self.bobcat.logger.mock_calls,
+        )
+
+    @patch("bobcat_miner.Bobcat.is_healthy", new_callable=PropertyMock, return_value=False)
+    @patch("bobcat_miner.BobcatAPI.refresh")
+    def test_run_autopilot_repair_steps_checks_health_after_synced_recovery(
+        self, mock_refresh, mock_is_healthy
+    ):
+        recovery = BobcatRecovery(action="Reboot")
+        for phase in ["accepted", "unreachable", "reachable", "running", "synced"]:
+            recovery.record(phase)
+
+        mock_reboot = MagicMock(return_value=recovery)
+        mock_reset = MagicMock()
+        mock_check = MagicMock()
+        mock_check.autopilot_repair_steps = [{"func": mock_reboot}, {"func": mock_reset}]
+
+        self.autopilot.run_autopilot_repair_steps(mock_check)
+
+        # a synced miner can still have an alert so the next repair step runs
+        mock_reboot.assert_called_once_with()
+        mock_reset.assert_called_once_with()
+        self.assertEqual(mock_refresh.call_count, 2)
+        self.assertNotIn(call.info("Repair Status: Complete"), self.bobcat.logger.mock_calls)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,20 @@
 from unittest.mock import call, patch, AsyncMock, PropertyMock, MagicMock
 
+import requests
+import threading
 import unittest
 
-from bobcat_miner import Bobcat, BobcatConnectionError
+from bobcat_miner import (
+    Bobcat,
+    BobcatCacheStats,
+    BobcatConnectionError,
+    BobcatPoller,
+    BobcatPollingPolicy,
+    BobcatRefreshError,
+)
 
 import mock_endpoints
 
-
 DISABLED = 100
 
 
@@ -14,10 +22,13 @@ class TestBobcat(unittest.TestCase):
     """Test Bobcat."""
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def setUp(self, mock_requests_get, mock_bobcat_conn_is_bobcat):
         self.mock_hostname = "192.168.0.10"
         self.mock_animal = "fancy-awesome-bobcat"
+        self.mock_polling_policy = BobcatPollingPolicy(
+            initial_interval=10, growth=2, max_interval=30, deadline=100
+        )
         self.bobcat = Bobcat(hostname=self.mock_hostname, log_level=DISABLED)
         self.bobcat.refresh()
 
@@ -107,6 +118,14 @@ class TestBobcat(unittest.TestCase):
     def test_public_ip(self):
         self.assertEqual(self.bobcat.public_ip, "33.117.96.28")
 
+    def test_p2p_records(self):
+        self.assertTrue(self.bobcat.connected)
+        self.assertTrue(self.bobcat.dialable)
+        self.assertEqual(self.bobcat.nat_type, "none")
+        self.assertEqual(self.bobcat.p2p_height, 1148539)
+        self.assertEqual(self.bobcat.listen_addrs, ("/ip4/33.117.96.28/tcp/44158",))
+        self.assertEqual(self.bobcat.sessions[0].name, "fancy-other-bobc")
+
     def test_peerbook(self):
         self.assertTrue(
             "|/p2p/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx|fancy-awesome-|    1     |    7    |non| 293.353s |"
@@ -176,43 +195,198 @@ class TestBobcat(unittest.TestCase):
     def test_is_healthy(self):
         self.assertTrue(self.bobcat.is_healthy)
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_offline)
+    def test_snapshot_is_parsed_once_per_refresh(self, mock_requests_get):
+        snapshot = self.bobcat._snapshot("status")
+        self.assertIs(self.bobcat._snapshot("status"), snapshot)
+        self.assertIs(snapshot.raw, self.bobcat._status_data)
+
+        self.bobcat.refresh_status()
+        self.assertIsNot(self.bobcat._snapshot("status"), snapshot)
+        self.assertEqual(self.bobcat.gap, "-")
+
+    def test_parse_html(self):
+        self.assertEqual(
+            self.bobcat._parse_html(mock_endpoints.reboot_response_data), "Rebooting hotspot"
+        )
+        self.assertEqual(
+            self.bobcat._parse_html(mock_endpoints.resync_response_data),
+            "\n".join(
+                [
+                    "1: Your miner is going to rest",
+                    "2: Docker is going to be stopped",
+                    "3: Boom! Old blockchain data gone",
+                    "4: Bam! Rebuilding miner data",
+                    "Miner successfully restarted, but it may take 30 minutes to load files from internet, please be patient. 2022-01-20 18:12:28 +0000 UTC",
+                ]
+            ),
+        )
+        self.assertEqual(
+            self.bobcat._parse_html("<p>a &amp; b</p><script>x()</script><!-- c -->c"),
+            "a & b\nc",
+        )
+
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.status", new_callable=PropertyMock, return_value="Synced")
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.Bobcat.wait_for_connection")
+    @patch("bobcat_miner.BobcatConnection.can_connect", side_effect=[True, True, False])
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_reboot(self, mock_verify, mock_requests_post, mock_wait, mock_heartbeat):
-        Bobcat(hostname=self.mock_hostname, log_level=DISABLED).reboot()
+    def test_reboot(
+        self,
+        mock_verify,
+        mock_requests_post,
+        mock_wait,
+        mock_can_connect,
+        mock_wait_for_connection,
+        mock_wait_until_running,
+        mock_status,
+        mock_animal,
+    ):
+        b = Bobcat(hostname=self.mock_hostname, log_level=DISABLED)
+        self.assertIsNone(b.last_recovery())
+        recovery = b.reboot()
+
         mock_requests_post.assert_called_once_with(
             f"http://{self.mock_hostname}/admin/reboot",
             headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"},
         )
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+        # the bobcat is watched at a fine interval until it goes down instead of a fixed five minute wait
+        mock_wait.assert_has_calls([call(2), call(2), call(2)])
+        self.assertEqual(mock_can_connect.call_count, 3)
+
+        # the recovery polls share one deadline
+        poller = mock_wait_for_connection.call_args.kwargs["poller"]
+        mock_wait_until_running.assert_called_once_with(poller=poller)
+
+        self.assertIs(b.last_recovery(), recovery)
+        self.assertEqual(recovery.action, "Reboot")
+        self.assertEqual(
+            list(recovery.phases), ["accepted", "unreachable", "reachable", "running", "synced"]
+        )
+        self.assertTrue(recovery.went_down)
+        self.assertTrue(recovery.synced)
+        self.assertGreaterEqual(recovery.duration, 0)
+
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.status", new_callable=PropertyMock, return_value="Synced")
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.Bobcat.wait_for_connection")
+    @patch("bobcat_miner.BobcatConnection.can_connect", return_value=True)
+    @patch("bobcat_miner.Bobcat.wait")
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_reboot_that_never_went_down(
+        self,
+        mock_verify,
+        mock_requests_post,
+        mock_wait,
+        mock_can_connect,
+        mock_wait_for_connection,
+        mock_wait_until_running,
+        mock_status,
+        mock_animal,
+    ):
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+        recovery = b.reboot()
+
+        # the bobcat is watched until the down timeout
+        self.assertEqual(mock_wait.call_count, 15)
+        b.logger.warning.assert_called_with(
+            f"The Bobcat ({self.mock_animal}) did not go down after the Reboot"
+        )
+        self.assertFalse(b.logger.info.called)
+
+        # the ignored reboot is not mistaken for a fast recovery from the miner state before it
+        self.assertFalse(mock_wait_for_connection.called)
+        self.assertFalse(mock_wait_until_running.called)
+        self.assertIs(b.last_recovery(), recovery)
+        self.assertEqual(list(recovery.phases), ["accepted"])
+        self.assertFalse(recovery.went_down)
+        self.assertFalse(recovery.running)
+        self.assertFalse(recovery.synced)
+
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.status", new_callable=PropertyMock, return_value="Synced")
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.Bobcat.wait_for_connection")
+    @patch("bobcat_miner.BobcatConnection.can_connect")
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_reset(self, mock_verify, mock_requests_post, mock_wait, mock_heartbeat):
+    def test_recover_without_down_watch(
+        self,
+        mock_verify,
+        mock_wait,
+        mock_can_connect,
+        mock_wait_for_connection,
+        mock_wait_until_running,
+        mock_status,
+        mock_animal,
+    ):
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+        recovery = b._recover("Resync")
+
+        # the diagnoser stays up during a resync so it is not watched for going down
+        self.assertFalse(mock_wait.called)
+        self.assertFalse(mock_can_connect.called)
+        self.assertEqual(list(recovery.phases), ["accepted", "reachable", "running", "synced"])
+        self.assertFalse(b.logger.warning.called)
+        b.logger.info.assert_called_once_with(f"Reconnected to the Bobcat ({self.mock_animal})")
+
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=False)
+    @patch("bobcat_miner.Bobcat.wait_for_connection")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_recover_when_not_running(
+        self, mock_verify, mock_wait_for_connection, mock_wait_until_running, mock_animal
+    ):
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+        recovery = b._recover("Resync")
+
+        self.assertEqual(list(recovery.phases), ["accepted", "reachable"])
+        b.logger.warning.assert_called_once_with(
+            f"The Bobcat ({self.mock_animal}) is reachable but the miner is not running"
+        )
+        self.assertFalse(b.logger.info.called)
+
+    @patch("bobcat_miner.Bobcat._recover")
+    @patch("bobcat_miner.Bobcat.wait")
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_reset(self, mock_verify, mock_requests_post, mock_wait, mock_recover):
         Bobcat(hostname=self.mock_hostname, log_level=DISABLED).reset()
         mock_requests_post.assert_called_once_with(
             f"http://{self.mock_hostname}/admin/reset",
             headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"},
         )
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+    @patch("bobcat_miner.Bobcat._recover")
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_resync(self, mock_verify, mock_requests_post, mock_wait, mock_heartbeat):
+    def test_resync(self, mock_verify, mock_requests_post, mock_wait, mock_recover):
         Bobcat(hostname=self.mock_hostname, log_level=DISABLED).resync()
         mock_requests_post.assert_called_once_with(
             f"http://{self.mock_hostname}/admin/resync",
             headers={"Authorization": "Basic Ym9iY2F0Om1pbmVy"},
         )
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+    @patch("bobcat_miner.Bobcat._recover")
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
-    @patch("requests.get", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.Bobcat.is_healthy", new_callable=PropertyMock, return_value=True)
     @patch("bobcat_miner.Bobcat.gap", new_callable=PropertyMock, return_value=1000)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
@@ -224,7 +398,7 @@ class TestBobcat(unittest.TestCase):
         mock_requests_get,
         mock_requests_post,
         mock_wait,
-        mock_heartbeat,
+        mock_recover,
     ):
         b = Bobcat(hostname=self.mock_hostname)
         b.logger = MagicMock()
@@ -237,10 +411,10 @@ class TestBobcat(unittest.TestCase):
             [call("Refresh: Status Data"), call("Syncing your miner, please leave your power on.")]
         )
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+    @patch("bobcat_miner.Bobcat._recover")
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
-    @patch("requests.get", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.Bobcat.gap", new_callable=PropertyMock, return_value="mock bad gap")
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
     def test_fastsync_should_skip_when_unable_to_read_gap(
@@ -250,7 +424,7 @@ class TestBobcat(unittest.TestCase):
         mock_requests_get,
         mock_requests_post,
         mock_wait,
-        mock_heartbeat,
+        mock_recover,
     ):
         b = Bobcat(hostname=self.mock_hostname)
         b.logger = MagicMock()
@@ -261,10 +435,10 @@ class TestBobcat(unittest.TestCase):
         )
         self.assertFalse(mock_requests_post.called)
 
-    @patch("bobcat_miner.Bobcat.heartbeat")
+    @patch("bobcat_miner.Bobcat._recover")
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("requests.post", side_effect=mock_endpoints.mock_online)
-    @patch("requests.get", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.post", side_effect=mock_endpoints.mock_online)
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
     def test_fastsync_should_skip_when_gap_is_less_than_400(
         self,
@@ -272,7 +446,7 @@ class TestBobcat(unittest.TestCase):
         mock_requests_get,
         mock_requests_post,
         mock_wait,
-        mock_heartbeat,
+        mock_recover,
     ):
         b = Bobcat(hostname=self.mock_hostname)
         b.logger = MagicMock()
@@ -299,11 +473,11 @@ class TestBobcat(unittest.TestCase):
     def test_wait_for_connection(self, mock_verify, mock_can_connect, mock_wait, mock_animal):
         mock_animal.return_value = self.mock_animal
 
-        b = Bobcat(hostname=self.mock_hostname)
+        b = Bobcat(hostname=self.mock_hostname, polling_policy=self.mock_polling_policy)
         b.logger = MagicMock()
-        b.wait_for_connection(backoff_duration=300, max_attempts=3)
+        b.wait_for_connection()
 
-        mock_wait.assert_has_calls([call(300), call(300)])
+        mock_wait.assert_has_calls([call(10), call(20)])
         b.logger.warning.assert_has_calls(
             [
                 call(f"The Bobcat ({self.mock_animal}) is unreachable"),
@@ -313,24 +487,28 @@ class TestBobcat(unittest.TestCase):
 
     @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
     @patch("bobcat_miner.Bobcat.wait")
-    @patch("bobcat_miner.BobcatConnection.can_connect", side_effect=[False, False, False, False])
+    @patch("bobcat_miner.BobcatConnection.can_connect", return_value=False)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_wait_for_connection_throw_connection_error_after_max_tries(
+    def test_wait_for_connection_throw_connection_error_after_deadline(
         self, mock_verify, mock_can_connect, mock_wait, mock_animal
     ):
         mock_animal.return_value = self.mock_animal
 
-        b = Bobcat(hostname=self.mock_hostname)
+        b = Bobcat(hostname=self.mock_hostname, polling_policy=self.mock_polling_policy)
         b.logger = MagicMock()
 
         with self.assertRaises(BobcatConnectionError) as err:
-            b.wait_for_connection(backoff_duration=300, max_attempts=3)
+            b.wait_for_connection()
 
-        mock_wait.assert_called_with(300)
-        self.assertEqual(mock_wait.call_count, 3)
+        # the interval grows up to the max interval and the last one is cut short by the deadline
+        mock_wait.assert_has_calls([call(10), call(20), call(30), call(30), call(10)])
+        self.assertEqual(
+            str(err.exception),
+            f"Waited for 1 Minute and still cannot connect to {self.mock_hostname}",
+        )
 
         b.logger.warning.assert_called_with(f"The Bobcat ({self.mock_animal}) is unreachable")
-        self.assertEqual(b.logger.warning.call_count, 3)
+        self.assertEqual(b.logger.warning.call_count, 6)
 
     @patch("bobcat_miner.Bobcat.wait")
     @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
@@ -343,11 +521,12 @@ class TestBobcat(unittest.TestCase):
         mock_miner_state.side_effect = ["None", "", "", "running"]
         mock_animal.return_value = self.mock_animal
 
-        b = Bobcat(hostname=self.mock_hostname)
+        b = Bobcat(hostname=self.mock_hostname, polling_policy=self.mock_polling_policy)
         b.logger = MagicMock()
-        b.wait_until_running(backoff_duration=300, max_attempts=12)
+        self.assertTrue(b.wait_until_running())
 
-        mock_wait.assert_has_calls([call(300), call(300), call(300)], any_order=False)
+        mock_wait.assert_has_calls([call(10), call(20), call(30)], any_order=False)
+        self.assertEqual(mock_refresh.call_count, 4)
 
         b.logger.warning.assert_has_calls(
             [
@@ -358,50 +537,162 @@ class TestBobcat(unittest.TestCase):
             any_order=False,
         )
 
+    @patch("bobcat_miner.Bobcat.wait")
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.miner_state", new_callable=PropertyMock, return_value="running")
+    @patch("bobcat_miner.BobcatAPI.refresh")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_wait_until_running_when_refresh_fails_while_booting(
+        self, mock_verify, mock_refresh, mock_miner_state, mock_animal, mock_wait
+    ):
+        mock_refresh.side_effect = [
+            BobcatRefreshError({"miner": requests.exceptions.ReadTimeout()}),
+            None,
+        ]
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname, polling_policy=self.mock_polling_policy)
+        b.logger = MagicMock()
+        self.assertTrue(b.wait_until_running())
+
+        # the failed refresh counts as not running and the status is polled again
+        mock_wait.assert_called_once_with(10)
+        self.assertEqual(mock_refresh.call_count, 2)
+        self.assertEqual(mock_miner_state.call_count, 1)
+
     @patch("bobcat_miner.Bobcat.wait")
     @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
     @patch("bobcat_miner.Bobcat.miner_state", new_callable=PropertyMock)
     @patch("bobcat_miner.BobcatAPI.refresh")
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_wait_until_running_logs_warning_after_max_tries(
+    def test_wait_until_running_logs_warning_after_deadline(
         self, mock_verify, mock_refresh, mock_miner_state, mock_animal, mock_wait
     ):
-        mock_miner_state.side_effect = ["None", "", "", ""]
+        mock_miner_state.side_effect = ["None", "", ""]
         mock_animal.return_value = self.mock_animal
 
-        b = Bobcat(hostname=self.mock_hostname)
+        b = Bobcat(
+            hostname=self.mock_hostname,
+            polling_policy=BobcatPollingPolicy(initial_interval=10, growth=2, deadline=30),
+        )
         b.logger = MagicMock()
-        b.wait_until_running(backoff_duration=300, max_attempts=2)
+        self.assertFalse(b.wait_until_running())
 
-        mock_wait.assert_called_with(300)
+        mock_wait.assert_has_calls([call(10), call(20)], any_order=False)
         self.assertEqual(mock_wait.call_count, 2)
 
         b.logger.warning.assert_has_calls(
             [
                 call("The Bobcat (fancy-awesome-bobcat) is not running"),
                 call("The Bobcat (fancy-awesome-bobcat) is not running"),
-                call("Waited for 10 minutes and still not running"),
+                call("The Bobcat (fancy-awesome-bobcat) is not running"),
+                call("Waited for 30 Seconds and still not running"),
             ],
             any_order=False,
         )
 
     @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
     @patch("bobcat_miner.Bobcat.wait_for_connection")
-    @patch("bobcat_miner.Bobcat.wait_until_running")
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=True)
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
     def test_heartbeat(
-        self, mock_verify, mock_wait_for_connection, mock_wait_until_running, mock_animal
+        self, mock_verify, mock_wait_until_running, mock_wait_for_connection, mock_animal
     ):
         mock_animal.return_value = self.mock_animal
 
         b = Bobcat(hostname=self.mock_hostname)
         b.logger = MagicMock()
-        b.heartbeat(backoff_duration=300, max_attempts=3)
+        self.assertTrue(b.heartbeat())
 
-        mock_wait_for_connection.assert_called_once_with(300, 3)
-        mock_wait_until_running.assert_called_once_with(300, 3)
+        # both waits share one polling deadline
+        poller = mock_wait_for_connection.call_args.kwargs["poller"]
+        self.assertIsInstance(poller, BobcatPoller)
+        mock_wait_until_running.assert_called_once_with(poller=poller)
         b.logger.info.assert_called_once_with(f"Reconnected to the Bobcat ({self.mock_animal})")
 
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.wait")
+    @patch("bobcat_miner.BobcatConnection.can_connect", return_value=False)
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_wait_for_connection_with_deprecated_arguments(
+        self, mock_verify, mock_can_connect, mock_wait, mock_animal
+    ):
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+
+        with self.assertWarns(DeprecationWarning):
+            with self.assertRaises(BobcatConnectionError) as err:
+                b.wait_for_connection(backoff_duration=60, max_attempts=3)
+
+        # the deprecated arguments poll at a fixed interval
+        mock_wait.assert_has_calls([call(60), call(60), call(60)])
+        self.assertEqual(mock_wait.call_count, 3)
+        self.assertEqual(
+            str(err.exception),
+            f"Waited for 3 Minutes and still cannot connect to {self.mock_hostname}",
+        )
+
+    @patch("bobcat_miner.Bobcat.animal", new_callable=PropertyMock)
+    @patch("bobcat_miner.Bobcat.wait_for_connection")
+    @patch("bobcat_miner.Bobcat.wait_until_running", return_value=True)
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_heartbeat_with_deprecated_arguments(
+        self, mock_verify, mock_wait_until_running, mock_wait_for_connection, mock_animal
+    ):
+        mock_animal.return_value = self.mock_animal
+
+        b = Bobcat(hostname=self.mock_hostname)
+        b.logger = MagicMock()
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(b.heartbeat(backoff_duration=300, max_attempts=12))
+
+        poller = mock_wait_for_connection.call_args.kwargs["poller"]
+        self.assertEqual(poller.deadline, 3600)
+        self.assertEqual(poller.next_interval(), 300)
+        self.assertEqual(poller.next_interval(), 300)
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_attributes_are_cached(self, mock_requests_get, mock_verify):
+        mock_requests_get.side_effect = mock_endpoints.mock_online
+
+        b = Bobcat(hostname=self.mock_hostname, log_level=DISABLED)
+        self.assertEqual(b.status, "Synced")
+        self.assertEqual(b.gap, 0)
+        self.assertEqual(b.tip, None)
+
+        mock_requests_get.assert_called_once_with(f"http://{self.mock_hostname}/status.json")
+        self.assertEqual(b.cache_stats("status"), BobcatCacheStats(hits=2, misses=1, stale=0))
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get")
+    def test_stale_attributes_are_refreshed_in_the_background(self, mock_requests_get, mock_verify):
+        responded = threading.Event()
+
+        def status_endpoint(url):
+            if mock_requests_get.call_count == 1:
+                return mock_endpoints.mock_online(url)
+            responded.wait()
+            return mock_endpoints.mock_offline(url)
+
+        mock_requests_get.side_effect = status_endpoint
+
+        b = Bobcat(hostname=self.mock_hostname, log_level=DISABLED, cache_ttls={"status": -1})
+        self.assertEqual(b.status, "Synced")
+
+        # the stale status is served while the bobcat is polled again
+        self.assertEqual(b.status, "Synced")
+        responded.set()
+        b._revalidating["status"].result()
+        b.close()
+
+        self.assertEqual(b._status_data, mock_endpoints.down_status_data)
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(b.cache_stats("status").stale, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
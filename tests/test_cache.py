@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import os
+import tempfile
+import unittest
+
+from bobcat_miner import BobcatCacheStats, BobcatDiscoveryCache, BobcatEndpointCache
+
+
+class TestBobcatDiscoveryCache(unittest.TestCase):
+    """Test BobcatDiscoveryCache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp_dir.name, "bobcat", "discovery.json")
+        self.cache = BobcatDiscoveryCache(self.cache_file, ttl=60)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_when_cache_file_is_missing(self):
+        self.assertIsNone(self.cache.get("fancy-awesome-bobcat"))
+
+    def test_get_when_cache_file_is_corrupt(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w") as f:
+            f.write("{not json")
+        self.assertIsNone(self.cache.get("fancy-awesome-bobcat"))
+
+    def test_set_and_get(self):
+        self.cache.set("192.168.0.10", "fancy-awesome-bobcat")
+        self.cache.set("192.168.0.11")
+
+        self.assertEqual(self.cache.get("fancy-awesome-bobcat"), "192.168.0.10")
+        self.assertEqual(self.cache.get(), "192.168.0.11")
+        self.assertIsNone(self.cache.get("fancy-other-bobcat"))
+
+    @patch("time.time")
+    def test_get_when_expired(self, mock_time):
+        mock_time.return_value = 1000
+        self.cache.set("192.168.0.10", "fancy-awesome-bobcat")
+
+        mock_time.return_value = 1060
+        self.assertEqual(self.cache.get("fancy-awesome-bobcat"), "192.168.0.10")
+
+        mock_time.return_value = 1061
+        self.assertIsNone(self.cache.get("fancy-awesome-bobcat"))
+
+
+class TestBobcatEndpointCache(unittest.TestCase):
+    """Test BobcatEndpointCache."""
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_lookup(self, mock_monotonic):
+        cache = BobcatEndpointCache({"status": 10})
+
+        self.assertEqual(cache.lookup("status"), BobcatEndpointCache.MISS)
+
+        cache.touch("status")
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(cache.lookup("status"), BobcatEndpointCache.HIT)
+
+        mock_monotonic.return_value = 110.5
+        self.assertEqual(cache.lookup("status"), BobcatEndpointCache.STALE)
+        self.assertEqual(cache.age("status"), 10.5)
+
+        cache.invalidate("status")
+        self.assertEqual(cache.lookup("status"), BobcatEndpointCache.MISS)
+        self.assertIsNone(cache.age("status"))
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_ttls_are_per_endpoint(self, mock_monotonic):
+        cache = BobcatEndpointCache()
+        cache.touch("status")
+        cache.touch("speed")
+
+        mock_monotonic.return_value = 100.0 + cache.DEFAULT_TTLS["status"] + 1
+        self.assertEqual(cache.lookup("status"), BobcatEndpointCache.STALE)
+        self.assertEqual(cache.lookup("speed"), BobcatEndpointCache.HIT)
+
+    def test_stats(self):
+        cache = BobcatEndpointCache({"status": 0})
+        cache.lookup("status")
+        cache.touch("status")
+        cache.touch("dig")
+        cache.lookup("status")
+        cache.lookup("dig")
+
+        self.assertEqual(cache.stats("status"), BobcatCacheStats(hits=1, misses=1, stale=1))
+        self.assertEqual(cache.stats("dig"), BobcatCacheStats(hits=1, misses=0, stale=0))
+        self.assertEqual(cache.stats(), BobcatCacheStats(hits=2, misses=1, stale=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,24 @@
-from unittest.mock import patch, call, AsyncMock
+from aiohttp import web
+from unittest.mock import patch, call, AsyncMock, MagicMock
 
 import asyncio
+import http.server
+import mock_endpoints
+import os
+import socket
+import tempfile
+import threading
 import unittest
 
-from bobcat_miner import BobcatConnection, BobcatNotFoundError
+from bobcat_miner import (
+    BobcatConnection,
+    BobcatDiscovery,
+    BobcatDiscoveryCache,
+    BobcatHttpStats,
+    BobcatNeighborSource,
+    BobcatNotFoundError,
+    BobcatPing,
+)
 
 DISABLED = 100
 
@@ -13,6 +28,8 @@ class TestBobcatConnection(unittest.TestCase):
 
     def setUp(self):
         self.mock_hostname = "192.168.0.10"
+        self.mock_neighbor_source = MagicMock(spec=BobcatNeighborSource)
+        self.mock_neighbor_source.neighbors.return_value = []
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
     def test_BobcatConnection_with_hostname(self, mock_verify):
@@ -27,8 +44,38 @@ class TestBobcatConnection(unittest.TestCase):
         _ = BobcatConnection()
         mock_find.assert_called_once_with()
 
+    @patch("bobcat_miner.BobcatConnection.find", return_value="192.168.0.10")
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    def test_BobcatConnection_with_discovery_cache_hit(self, mock_verify, mock_find):
+        mock_verify.return_value = (True, self.mock_hostname)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, "discovery.json")
+            BobcatDiscoveryCache(cache_file).set(self.mock_hostname, "fancy-awesome-bobcat")
+
+            b = BobcatConnection(animal="Fancy Awesome Bobcat", discovery_cache_file=cache_file)
+
+        mock_verify.assert_awaited_once_with(self.mock_hostname)
+        self.assertFalse(mock_find.called)
+        self.assertEqual(b._hostname, self.mock_hostname)
+
+    @patch("bobcat_miner.BobcatConnection.find", return_value="192.168.0.20")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_BobcatConnection_with_discovery_cache_stale(self, mock_verify, mock_find):
+        mock_verify.return_value = (False, self.mock_hostname)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, "discovery.json")
+            BobcatDiscoveryCache(cache_file).set(self.mock_hostname)
+
+            b = BobcatConnection(discovery_cache_file=cache_file)
+
+            mock_find.assert_called_once_with()
+            self.assertEqual(b._hostname, "192.168.0.20")
+            self.assertEqual(BobcatDiscoveryCache(cache_file).get(), "192.168.0.20")
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_miner_with_hostname(self, mock_requests_get, mock_verify):
         mock_hostname_override = "192.168.0.20"
         b = BobcatConnection(hostname=self.mock_hostname)
@@ -38,7 +85,7 @@ class TestBobcatConnection(unittest.TestCase):
         )
 
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("requests.get")
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
     def test_refresh_miner_without_hostname(self, mock_requests_get, mock_verify):
         b = BobcatConnection(hostname=self.mock_hostname)
         b._BobcatConnection__refresh_miner()
@@ -87,12 +134,32 @@ class TestBobcatConnection(unittest.TestCase):
         self.assertTrue(is_bobcat_verified)
         self.assertEqual(host, self.mock_hostname)
 
+    @patch("bobcat_miner.BobcatConnection.find")
+    @patch("requests.Session.get")
+    @patch("bobcat_miner.BobcatConnection._get_miner_data", return_value=AsyncMock())
+    def test_does_bobcat_match_animal(self, mock_get_miner_data, mock_requests_get, mock_find):
+        mock_get_miner_data.return_value = mock_endpoints.synced_miner_data
+        b = BobcatConnection(animal="Fancy Awesome Bobcat")
+
+        self.assertTrue(asyncio.run(b._does_bobcat_match_animal(self.mock_hostname)))
+        mock_get_miner_data.assert_awaited_once_with(self.mock_hostname)
+        self.assertEqual(b._miner_data, mock_endpoints.synced_miner_data)
+
+        b._animal = "Fancy Other Bobcat"
+        b._miner_data = {}
+        self.assertFalse(asyncio.run(b._does_bobcat_match_animal(self.mock_hostname)))
+        self.assertEqual(b._miner_data, {})
+
+        # the event loop is never blocked by the synchronous requests client
+        self.assertFalse(mock_requests_get.called)
+
+    @patch("bobcat_miner.BobcatConnection.probe", side_effect=lambda host: (True, host))
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_search_throws_error_when_bobcat_not_found(self, mock_verify):
+    def test_search_throws_error_when_bobcat_not_found(self, mock_verify, mock_probe):
         mock_verify.side_effect = [(False, "192.168.0.1"), (False, "192.168.0.2")]
 
         with self.assertRaises(BobcatNotFoundError) as err:
-            BobcatConnection(networks=["192.168.0.0/30"])
+            BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
             mock_verify.assert_has_calls(
                 [
                     call("192.168.0.1"),
@@ -101,11 +168,12 @@ class TestBobcatConnection(unittest.TestCase):
                 any_order=False,
             )
 
+    @patch("bobcat_miner.BobcatConnection.probe", side_effect=lambda host: (True, host))
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    def test_search_finds_hostname(self, mock_verify):
+    def test_search_finds_hostname(self, mock_verify, mock_probe):
         mock_verify.side_effect = [(False, "192.168.0.1"), (True, "192.168.0.2")]
 
-        b = BobcatConnection(networks=["192.168.0.0/30"])
+        b = BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
         mock_verify.assert_has_calls(
             [
                 call("192.168.0.1"),
@@ -115,17 +183,346 @@ class TestBobcatConnection(unittest.TestCase):
         )
         self.assertEqual(b._hostname, "192.168.0.2")
 
+    @patch("bobcat_miner.BobcatConnection.probe")
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def test_search_only_verifies_hosts_with_open_port(self, mock_verify, mock_probe):
+        mock_probe.side_effect = lambda host: (host == "192.168.0.2", host)
+        mock_verify.side_effect = lambda host: (True, host)
+
+        b = BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
+        mock_verify.assert_awaited_once_with("192.168.0.2")
+        self.assertEqual(b._hostname, "192.168.0.2")
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_probe(self, mock_find):
+        b = BobcatConnection()
+
+        async def probe_open_and_closed_ports():
+            server = await asyncio.start_server(
+                lambda reader, writer: writer.close(), "127.0.0.1", 0
+            )
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                is_open = await b.probe("127.0.0.1", port=port)
+            is_closed = await b.probe("127.0.0.1", port=port)
+            return is_open, is_closed
+
+        is_open, is_closed = asyncio.run(probe_open_and_closed_ports())
+        self.assertEqual(is_open, (True, "127.0.0.1"))
+        self.assertEqual(is_closed, (False, "127.0.0.1"))
+
+    async def serve_homepage(self, b, handler):
+        """Get the homepage from a local web server that serves the homepage with the handler."""
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await b._get_homepage(f"127.0.0.1:{port}")
+        finally:
+            await runner.cleanup()
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_get_homepage_stops_after_title(self, mock_find):
+        b = BobcatConnection()
+        title = "<title>Diagnoser - Bobcatminer Diagnostic Dashboard</title>"
+        chunks_sent = 0
+
+        async def homepage(request):
+            nonlocal chunks_sent
+            response = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+            await response.prepare(request)
+            await response.write(f"<html><head>{title}".encode())
+            try:
+                for _ in range(64):
+                    await asyncio.sleep(0.005)
+                    await response.write(b"<style>" + b"x" * 1024 + b"</style>")
+                    chunks_sent += 1
+            except ConnectionResetError:
+                pass
+            return response
+
+        html = asyncio.run(self.serve_homepage(b, homepage))
+        self.assertTrue(html.endswith(title))
+        self.assertLess(chunks_sent, 64)
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_get_homepage_rejects_non_html(self, mock_find):
+        b = BobcatConnection()
+
+        async def homepage(request):
+            return web.json_response({"title": "Diagnoser - Bobcatminer Diagnostic Dashboard"})
+
+        self.assertIsNone(asyncio.run(self.serve_homepage(b, homepage)))
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_search_bounds_concurrency(self, mock_find):
+        b = BobcatConnection(search_concurrency=2)
+        running, max_running = 0, 0
+
+        async def mock_verify(host):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return False, host
+
+        b.probe = AsyncMock(side_effect=lambda host: (True, host))
+        b.verify = mock_verify
+        self.assertIsNone(asyncio.run(b._search([f"192.168.0.{i}" for i in range(1, 11)])))
+        self.assertEqual(max_running, 2)
+        self.assertIsNone(b._scan_session)
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_search_consumes_hosts_lazily(self, mock_find):
+        b = BobcatConnection(search_concurrency=4)
+        consumed = []
+
+        def hosts():
+            for i in range(1, 101):
+                consumed.append(i)
+                yield f"192.168.0.{i}"
+
+        b.probe = AsyncMock(side_effect=lambda host: (True, host))
+        b.verify = AsyncMock(side_effect=lambda host: (host == "192.168.0.2", host))
+        self.assertEqual(asyncio.run(b._search(hosts(), 100)), "192.168.0.2")
+
+        # only the first window plus the refills for completed searches are pulled from the iterator
+        self.assertLessEqual(len(consumed), 8)
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_search_logs_progress(self, mock_find):
+        b = BobcatConnection(search_concurrency=4)
+        b.probe = AsyncMock(side_effect=lambda host: (False, host))
+
+        with self.assertLogs(b.logger, level="DEBUG") as cm:
+            self.assertIsNone(asyncio.run(b._search((f"10.0.0.{i}" for i in range(1, 21)), 20)))
+
+        progress = [
+            record.getMessage() for record in cm.records if "Progress" in record.getMessage()
+        ]
+        self.assertEqual(len(progress), 10)
+        self.assertEqual(progress[-1], "Search Progress: 20/20 hosts (100%)")
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_search_cancels_pending_probes_when_found(self, mock_find):
+        b = BobcatConnection(search_concurrency=4)
+        cancelled = []
+
+        async def mock_verify(host):
+            if host == "192.168.0.1":
+                return True, host
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(host)
+                raise
+            return False, host
+
+        b.probe = AsyncMock(side_effect=lambda host: (True, host))
+        b.verify = mock_verify
+        self.assertEqual(
+            asyncio.run(b._search(["192.168.0.1", "192.168.0.2", "192.168.0.3"])), "192.168.0.1"
+        )
+        self.assertEqual(sorted(cancelled), ["192.168.0.2", "192.168.0.3"])
+
     @patch("bobcat_miner.BobcatConnection._search", return_value=AsyncMock())
     def test_find(self, mock_search):
-        BobcatConnection(networks=["192.168.0.0/30"])
-        mock_search.assert_called_once_with(["192.168.0.1", "192.168.0.2"])
+        BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
+        mock_search.assert_called_once()
+        hosts, total = mock_search.call_args[0]
+        self.assertEqual(list(hosts), ["192.168.0.1", "192.168.0.2"])
+        self.assertEqual(total, 2)
+
+    @patch("bobcat_miner.BobcatConnection._search", return_value=AsyncMock())
+    def test_find_searches_neighbors_first(self, mock_search):
+        mock_search.side_effect = [None, "192.168.0.2"]
+        self.mock_neighbor_source.neighbors.return_value = ["10.0.0.5", "192.168.0.2", "bad"]
+
+        b = BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
+        self.assertEqual(mock_search.call_count, 2)
+        self.assertEqual(mock_search.call_args_list[0], call(["192.168.0.2"]))
+        hosts, total = mock_search.call_args_list[1][0]
+        self.assertEqual(list(hosts), ["192.168.0.1"])
+        self.assertEqual(total, 1)
+        self.assertEqual(b._hostname, "192.168.0.2")
+
+    @patch("bobcat_miner.BobcatConnection._search", return_value=AsyncMock())
+    def test_find_skips_network_search_when_neighbor_is_verified(self, mock_search):
+        mock_search.return_value = "192.168.0.2"
+        self.mock_neighbor_source.neighbors.return_value = ["192.168.0.2"]
+
+        b = BobcatConnection(networks=["192.168.0.0/30"], neighbor_source=self.mock_neighbor_source)
+        mock_search.assert_called_once_with(["192.168.0.2"])
+        self.assertEqual(b._hostname, "192.168.0.2")
+
+    @patch("bobcat_miner.BobcatConnection._search", return_value=AsyncMock())
+    def test_find_searches_overlapping_networks_once(self, mock_search):
+        mock_search.return_value = None
 
+        with self.assertRaises(BobcatNotFoundError):
+            BobcatConnection(
+                networks=["192.168.0.1/16", "192.168.0.0/24", "10.0.0.0/30", "192.168.0.0/24"],
+                neighbor_source=self.mock_neighbor_source,
+            )
+
+        mock_search.assert_called_once()
+        hosts, total = mock_search.call_args[0]
+        hosts = list(hosts)
+
+        self.assertEqual(len(hosts), len(set(hosts)))
+        # 10.0.0.0/30 hosts + 192.168.0.0/16 hosts
+        self.assertEqual(len(hosts), 2 + 65534)
+        self.assertEqual(total, len(hosts))
+        self.assertEqual(hosts[:4], ["10.0.0.1", "10.0.0.2", "192.168.0.1", "192.168.0.2"])
+        self.assertIn("192.168.1.0", hosts)
+        # the broadcast address of 192.168.0.0/24 is a host of 192.168.0.0/16
+        self.assertIn("192.168.0.255", hosts)
+        self.assertNotIn("192.168.0.0", hosts)
+        self.assertNotIn("192.168.255.255", hosts)
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_BobcatConnection_without_discovery(self, mock_find):
+        b = BobcatConnection(hostname=self.mock_hostname, discover=False)
+        self.assertFalse(mock_find.called)
+        self.assertEqual(b._hostname, self.mock_hostname)
+
+    @patch("bobcat_miner.BobcatConnection._get_miner_data", return_value=AsyncMock())
+    @patch("bobcat_miner.BobcatConnection.probe", side_effect=lambda host: (True, host))
     @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
-    @patch("socket.socket.connect")
-    def test_can_connect(self, mock_socket_connect, mock_verify):
+    def test_find_all(self, mock_verify, mock_probe, mock_get_miner_data):
+        mock_verify.side_effect = lambda host: (host in ["10.0.0.1", "192.168.0.2"], host)
+        mock_get_miner_data.side_effect = lambda host: {
+            "animal": f"bobcat-{host}",
+            "pubkey": f"pubkey-{host}",
+        }
+        self.mock_neighbor_source.neighbors.return_value = ["192.168.0.2"]
+
+        b = BobcatConnection(
+            networks=["192.168.0.0/30", "10.0.0.0/30"],
+            neighbor_source=self.mock_neighbor_source,
+            discover=False,
+        )
+
+        async def find_all():
+            return [discovery async for discovery in b.find_all()]
+
+        discoveries = asyncio.run(find_all())
+
+        self.assertEqual(
+            sorted(discovery.hostname for discovery in discoveries), ["10.0.0.1", "192.168.0.2"]
+        )
+        for discovery in discoveries:
+            self.assertIsInstance(discovery, BobcatDiscovery)
+            self.assertEqual(discovery.animal, f"bobcat-{discovery.hostname}")
+            self.assertEqual(discovery.pubkey, f"pubkey-{discovery.hostname}")
+            self.assertGreaterEqual(discovery.elapsed, 0)
+
+        # every host is searched once and the neighbor is searched first
+        self.assertEqual(mock_probe.call_count, 4)
+        self.assertEqual(mock_probe.call_args_list[0], call("192.168.0.2"))
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_plan_networks(self, mock_find):
+        b = BobcatConnection(networks=["192.168.0.1/16", "10.0.0.0/24", "192.168.0.0/24"])
+        self.assertEqual(
+            [str(subnet) for subnet, _ in b._plan_networks()],
+            ["10.0.0.0/24", "192.168.0.0/24", "192.168.0.255/32"]
+            + [f"192.168.{2 ** i}.0/{24 - i}" for i in range(8)],
+        )
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_http_session_reuses_connections(self, mock_find):
+        class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b'{"status": "Synced"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/status.json"
+
+        try:
+            with BobcatConnection(discover=False) as b:
+                for _ in range(5):
+                    self.assertEqual(b._BobcatConnection__get(url).json(), {"status": "Synced"})
+
+                stats = b.http_stats()
+                self.assertIsInstance(stats, BobcatHttpStats)
+                self.assertEqual(stats.requests, 5)
+                self.assertEqual(stats.connections, 1)
+                self.assertEqual(stats.reuse_ratio, 0.8)
+
+            # the pooled connections are closed when the context exits
+            self.assertEqual(b.http_stats().connections, 0)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    @patch("bobcat_miner.BobcatConnection._connect", return_value=AsyncMock())
+    def test_can_connect(self, mock_connect, mock_verify):
+        mock_connect.return_value = None
         b = BobcatConnection(hostname=self.mock_hostname)
         self.assertTrue(b.can_connect())
-        mock_socket_connect.assert_called_once_with((self.mock_hostname, 80))
+        mock_connect.assert_awaited_once_with(self.mock_hostname, 80, 3)
+
+        mock_connect.return_value = ConnectionRefusedError()
+        self.assertFalse(b.can_connect())
+
+    @patch("bobcat_miner.BobcatConnection.find")
+    def test_ping(self, mock_find):
+        b = BobcatConnection(hostname="127.0.0.1", discover=False)
+        default_timeout = socket.getdefaulttimeout()
+
+        async def ping_open_and_closed_ports():
+            server = await asyncio.start_server(
+                lambda reader, writer: writer.close(), "127.0.0.1", 0
+            )
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reachable = await asyncio.gather(*(b.ping(port=port) for _ in range(3)))
+            unreachable = await b.ping(port=port)
+            return reachable, unreachable
+
+        reachable, unreachable = asyncio.run(ping_open_and_closed_ports())
+
+        for result in reachable:
+            self.assertIsInstance(result, BobcatPing)
+            self.assertTrue(result.reachable)
+            self.assertGreaterEqual(result.latency, 0)
+            self.assertIsNone(result.error)
+
+        self.assertFalse(unreachable.reachable)
+        self.assertIsNone(unreachable.latency)
+        self.assertEqual(unreachable.error, "ConnectionRefusedError")
+
+        self.assertEqual(b.ping_history(), reachable + [unreachable])
+        self.assertEqual(b.ping_history("192.168.0.10"), [])
+        self.assertEqual(socket.getdefaulttimeout(), default_timeout)
+
+    @patch("bobcat_miner.BobcatConnection._connect", return_value=AsyncMock())
+    def test_ping_history_is_bounded(self, mock_connect):
+        mock_connect.return_value = None
+        b = BobcatConnection(hostname=self.mock_hostname, discover=False)
+
+        for _ in range(BobcatConnection.PING_HISTORY_SIZE + 5):
+            asyncio.run(b.ping())
+
+        self.assertEqual(len(b.ping_history()), BobcatConnection.PING_HISTORY_SIZE)
 
 
 if __name__ == "__main__":
@@ -242,67 +242,34 @@ class TestRelayStatusCheck(unittest.TestCase):
         mock_verbose = False
         self.check = RelayStatusCheck(self.mock_bobcat, mock_verbose)
 
-    def test_RelayStatusCheck_when_not_relayed(self):
-        self.mock_bobcat.p2p_status = "\n".join(
-            [
-                "+---------+---------+",
-                "|  name   |result   |",
-                "+---------+---------+",
-                "|connected|  yes    |",
-                "|dialable |  yes    |",
-                "|nat_type |symmetric|",
-                "| height  |1148539  |",
-                "+---------+---------+",
-            ]
-        )
-        self.mock_bobcat.peerbook = "\n".join(
-            [
-                "+---------------------------------------------+",
-                "|listen_addrs (prioritized)                   |",
-                "+---------------------------------------------+",
-                "|/p2p//p2p/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx|",
-                "+---------------------------------------------+",
-            ]
-        )
+    def test_RelayStatusCheck_when_relayed(self):
+        self.mock_bobcat.nat_type = "symmetric"
+        self.mock_bobcat.listen_addrs = ("/p2p/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",)
 
-        self.assertFalse(self.check.check())
+        self.assertTrue(self.check.check())
 
         self.check.verbose = True
-        self.assertFalse(self.check.check())
+        self.assertTrue(self.check.check())
 
         self.check.bobcat.logger.assert_has_calls(
             [
-                call.error("Relay Status: Relayed"),
-                call.error("Relay Status: Relayed", extra={"description": str(self.check)}),
+                call.warning("Relay Status: Relayed", extra={}),
+                call.warning("Relay Status: Relayed", extra={"description": str(self.check)}),
             ],
             any_order=False,
         )
 
     def test_RelayStatusCheck_when_not_relayed(self):
-        self.mock_bobcat.p2p_status = "\n".join(
-            [
-                "+---------+-------+",
-                "|  name   |result |",
-                "+---------+-------+",
-                "|connected|  yes  |",
-                "|dialable |  yes  |",
-                "|nat_type | none  |",
-                "| height  |1148539|",
-                "+---------+-------+",
-            ]
-        )
-        self.mock_bobcat.peerbook = "\n".join(
-            [
-                "+---------------------------+",
-                "|listen_addrs (prioritized) |",
-                "+---------------------------+",
-                "|/ip4/33.117.96.28/tcp/44158|",
-                "+---------------------------+",
-            ]
-        )
+        self.mock_bobcat.nat_type = "none"
+        self.mock_bobcat.listen_addrs = ("/ip4/33.117.96.28/tcp/44158",)
         self.assertFalse(self.check.check())
         self.mock_bobcat.logger.info.assert_called_once_with("Relay Status: Not Relayed ✨")
 
+    def test_RelayStatusCheck_when_listening_on_public_ip(self):
+        self.mock_bobcat.nat_type = "symmetric"
+        self.mock_bobcat.listen_addrs = ("/ip4/33.117.96.28/tcp/44158",)
+        self.assertFalse(self.check.check())
+
 
 class TestNetworkStatusCheck(unittest.TestCase):
     def setUp(self):
@@ -350,6 +317,15 @@ class TestNetworkStatusCheck(unittest.TestCase):
         self.assertFalse(self.check.check())
         self.mock_bobcat.logger.info.assert_called_once_with("Network Status: Good 📶")
 
+    def test_NetworkStatusCheck_when_speed_test_has_no_results(self):
+        self.mock_bobcat.download_speed = ""
+        self.mock_bobcat.upload_speed = ""
+        self.mock_bobcat.latency = ""
+        self.assertFalse(self.check.check())
+        self.mock_bobcat.logger.debug.assert_called_once_with(
+            "Network Status: Skipped. The speed test has no results yet"
+        )
+
 
 class TestTemperatureStatusCheck(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import io
+import logging
+import unittest
+
+from bobcat_miner import BobcatBase, BobcatTraceDescription
+from bobcat_miner.logger import BobcatLogFileFormatter
+
+import mock_endpoints
+
+DISABLED = 100
+
+
+class TestBobcatTraceDescription(unittest.TestCase):
+    """Test BobcatTraceDescription."""
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setFormatter(BobcatLogFileFormatter())
+        self.logger = logging.getLogger("bobcat.test_logger")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    @patch("bobcat_miner.serialization.dumps", return_value="{}")
+    def test_data_is_serialized_only_when_formatted(self, mock_dumps):
+        description = BobcatTraceDescription(mock_endpoints.synced_miner_data)
+
+        self.logger.setLevel(logging.INFO)
+        self.logger.debug("Refresh: Miner Data", extra={"description": description})
+        self.assertFalse(mock_dumps.called)
+
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.debug("Refresh: Miner Data", extra={"description": description})
+        self.logger.debug("Refresh: Miner Data", extra={"description": description})
+        mock_dumps.assert_called_once_with(mock_endpoints.synced_miner_data, indent=True)
+        self.assertIn("Refresh: Miner Data\n```\n{}\n```", self.stream.getvalue())
+
+    def test_truncate(self):
+        description = str(BobcatTraceDescription({"status": "Synced"}, max_length=10))
+        self.assertEqual(description, '\n```\n{\n  "statu\n... (14 more characters)\n```')
+
+        description = str(BobcatTraceDescription({"status": "Synced"}, max_length=100))
+        self.assertEqual(description, '\n```\n{\n  "status": "Synced"\n}\n```')
+
+
+class TestBobcatBaseTrace(unittest.TestCase):
+    """Test the BobcatBase trace sampling."""
+
+    def test_trace_is_off(self):
+        b = BobcatBase(log_level=DISABLED)
+        self.assertIsNone(b._trace_description({}))
+
+    @patch("random.random")
+    def test_trace_sample_rate(self, mock_random):
+        b = BobcatBase(log_level=DISABLED, trace=True, trace_sample_rate=0.25, trace_max_length=5)
+
+        mock_random.return_value = 0.1
+        description = b._trace_description({"status": "Synced"})
+        self.assertIsInstance(description, BobcatTraceDescription)
+        self.assertEqual(description.max_length, 5)
+
+        mock_random.return_value = 0.25
+        self.assertIsNone(b._trace_description({"status": "Synced"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
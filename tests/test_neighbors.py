@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+import os
+import subprocess
+import unittest
+
+from bobcat_miner import ArpTableNeighborSource, IpNeighNeighborSource
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class TestArpTableNeighborSource(unittest.TestCase):
+    """Test ArpTableNeighborSource."""
+
+    def test_neighbors(self):
+        source = ArpTableNeighborSource(os.path.join(FIXTURES, "proc_net_arp"))
+        self.assertEqual(
+            source.neighbors(), ["192.168.0.1", "192.168.0.10", "10.0.0.5", "172.17.0.2"]
+        )
+
+    def test_neighbors_when_arp_table_is_missing(self):
+        source = ArpTableNeighborSource(os.path.join(FIXTURES, "does_not_exist"))
+        self.assertEqual(source.neighbors(), [])
+
+
+class TestIpNeighNeighborSource(unittest.TestCase):
+    """Test IpNeighNeighborSource."""
+
+    def test_parse(self):
+        with open(os.path.join(FIXTURES, "ip_neigh"), "r") as f:
+            table = f.read()
+
+        self.assertEqual(
+            IpNeighNeighborSource().parse(table),
+            ["192.168.0.1", "192.168.0.10", "10.0.0.5", "fe80::1"],
+        )
+
+    @patch("subprocess.run", side_effect=FileNotFoundError("ip"))
+    def test_neighbors_when_command_is_missing(self, mock_run):
+        self.assertEqual(IpNeighNeighborSource().neighbors(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
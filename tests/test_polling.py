@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import unittest
+
+from bobcat_miner import BobcatPollingPolicy, BobcatRecovery
+
+
+class TestBobcatPoller(unittest.TestCase):
+    """Test BobcatPoller."""
+
+    @patch("time.monotonic", return_value=0)
+    def test_intervals_grow_until_the_deadline(self, mock_monotonic):
+        poller = BobcatPollingPolicy(
+            initial_interval=10, growth=1.5, max_interval=30, deadline=100
+        ).start()
+
+        intervals = []
+        while (interval := poller.next_interval()) is not None:
+            intervals.append(interval)
+
+        self.assertEqual(intervals, [10, 15, 22.5, 30, 22.5])
+        self.assertEqual(poller.polls, 5)
+        self.assertEqual(poller.elapsed, 100)
+
+    @patch("time.monotonic")
+    def test_deadline_uses_the_real_time(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        poller = BobcatPollingPolicy(initial_interval=10, deadline=100).start()
+        self.assertEqual(poller.next_interval(), 10)
+
+        # the polls took longer than the scheduled intervals
+        mock_monotonic.return_value = 95
+        self.assertEqual(poller.next_interval(), 5)
+
+        mock_monotonic.return_value = 100
+        self.assertIsNone(poller.next_interval())
+
+    @patch("time.monotonic", return_value=0)
+    def test_down_watch_uses_a_fixed_interval(self, mock_monotonic):
+        poller = BobcatPollingPolicy(down_interval=2, down_timeout=5).start_down_watch()
+        self.assertEqual([poller.next_interval() for _ in range(4)], [2, 2, 1, None])
+
+
+class TestBobcatRecovery(unittest.TestCase):
+    """Test BobcatRecovery."""
+
+    def test_phases(self):
+        recovery = BobcatRecovery(action="Reboot")
+        self.assertIsNone(recovery.phase)
+        self.assertIsNone(recovery.duration)
+
+        recovery.record("accepted", 100)
+        recovery.record("unreachable", 112)
+        recovery.record("reachable", 170)
+        recovery.record("running", 195)
+        recovery.record("running", 200)  # the first time is kept
+
+        self.assertEqual(recovery.phase, "running")
+        self.assertEqual(recovery.elapsed("unreachable"), 12)
+        self.assertIsNone(recovery.elapsed("synced"))
+        self.assertEqual(recovery.duration, 95)
+        self.assertTrue(recovery.went_down)
+        self.assertTrue(recovery.running)
+        self.assertFalse(recovery.synced)
+        self.assertEqual(
+            str(recovery),
+            "Reboot: accepted (0s) → unreachable (12s) → reachable (70s) → running (95s)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import unittest
+
+from bobcat_miner import BobcatRateLimiter, BobcatRateLimitStats, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test TokenBucket."""
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_reserve_allows_burst_then_throttles(self, mock_monotonic):
+        bucket = TokenBucket(rate=0.5, capacity=5)
+
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+        # throttled requests are queued one token interval apart
+        self.assertEqual([bucket.reserve() for _ in range(2)], [2.0, 4.0])
+        self.assertEqual(bucket.stats(), BobcatRateLimitStats(requests=7, throttled=2, waited=6.0))
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_reserve_refills_over_time(self, mock_monotonic):
+        bucket = TokenBucket(rate=0.5, capacity=5)
+        for _ in range(5):
+            bucket.reserve()
+
+        mock_monotonic.return_value = 104.0
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 2.0])
+
+        # the bucket never holds more than the capacity
+        mock_monotonic.return_value = 1000.0
+        self.assertEqual([bucket.reserve() for _ in range(6)], [0.0] * 5 + [2.0])
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_pause(self, mock_monotonic):
+        bucket = TokenBucket(rate=0.5, capacity=5)
+        bucket.reserve()
+        bucket.pause(30)
+
+        self.assertEqual(bucket.reserve(), 30.0)
+
+
+class TestBobcatRateLimiter(unittest.TestCase):
+    """Test BobcatRateLimiter."""
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_buckets_are_per_host(self, mock_monotonic):
+        limiter = BobcatRateLimiter(rate=1, capacity=1)
+
+        self.assertEqual(limiter.reserve("192.168.0.10"), 0.0)
+        self.assertEqual(limiter.reserve("192.168.0.10"), 1.0)
+        self.assertEqual(limiter.reserve("192.168.0.11"), 0.0)
+
+        self.assertIs(limiter.bucket("192.168.0.10"), limiter.bucket("192.168.0.10"))
+        self.assertEqual(limiter.stats("192.168.0.10").throttled, 1)
+        self.assertEqual(limiter.stats("192.168.0.11").throttled, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock
+
+import http.server
+import requests
+import threading
+import time
+import unittest
+
+from bobcat_miner import BobcatConnection, BobcatRetryPolicy
+
+DISABLED = 100
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+    """A stand-in Bobcat that drops the first connections and then answers slowly or normally."""
+
+    protocol_version = "HTTP/1.1"
+    drops = 0
+    delay = 0.0
+    requests = 0
+
+    def respond(self):
+        type(self).requests += 1
+
+        if type(self).requests <= self.drops:
+            # close the socket without a response
+            self.close_connection = True
+            return
+
+        time.sleep(self.delay)
+        body = b'{"status": "Synced"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # the client timed out and hung up
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBobcatRetryPolicy(unittest.TestCase):
+    """Test BobcatRetryPolicy."""
+
+    def setUp(self):
+        FlakyHandler.drops, FlakyHandler.delay, FlakyHandler.requests = 0, 0.0, 0
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/status.json"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def connection(self, **kwargs):
+        policy = BobcatRetryPolicy(backoff_factor=0.01, backoff_max=0.05, **kwargs)
+        return BobcatConnection(discover=False, log_level=DISABLED, retry_policy=policy)
+
+    def test_retry_recovers_from_dropped_connections(self):
+        FlakyHandler.drops = 2
+
+        with self.connection(max_attempts=3) as b:
+            response = b._BobcatConnection__get(self.url)
+
+        self.assertEqual(response.json(), {"status": "Synced"})
+        self.assertEqual(FlakyHandler.requests, 3)
+
+    def test_retry_gives_up_after_max_attempts(self):
+        FlakyHandler.drops = 5
+
+        with self.connection(max_attempts=2) as b:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                b._BobcatConnection__get(self.url)
+
+        self.assertEqual(FlakyHandler.requests, 2)
+
+    def test_read_timeout(self):
+        FlakyHandler.delay = 0.5
+
+        start = time.monotonic()
+        with self.connection(read_timeout=0.1, max_attempts=2) as b:
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                b._BobcatConnection__get(self.url)
+
+        # the slow bobcat can not hang the caller
+        self.assertLess(time.monotonic() - start, 0.5 * 2)
+        self.assertEqual(FlakyHandler.requests, 2)
+
+    def test_post_is_not_retried_after_it_was_sent(self):
+        FlakyHandler.drops = 1
+
+        with self.connection(max_attempts=3) as b:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                b._BobcatConnection__post(self.url)
+
+        self.assertEqual(FlakyHandler.requests, 1)
+
+    def test_retry_logs_backoff(self):
+        logger = MagicMock()
+        func = MagicMock(side_effect=[requests.exceptions.ConnectTimeout(), "ok"])
+
+        policy = BobcatRetryPolicy(backoff_factor=0.01, jitter=False)
+        self.assertEqual(policy.retry(func, logger=logger)(), "ok")
+
+        self.assertEqual(func.call_count, 2)
+        logger.debug.assert_called_once_with(
+            "Retrying in 0.0 seconds (attempt 1/3): ConnectTimeout()"
+        )
+
+    def test_timeout(self):
+        policy = BobcatRetryPolicy(connect_timeout=2, read_timeout=10)
+        self.assertEqual(policy.timeout, (2, 10))
+        self.assertEqual(policy.client_timeout.sock_connect, 2)
+        self.assertEqual(policy.client_timeout.sock_read, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
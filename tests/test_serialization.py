@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import io
+import json
+import unittest
+
+from bobcat_miner import serialization
+
+import mock_endpoints
+
+
+class TestSerialization(unittest.TestCase):
+    """Test the JSON serialization backends."""
+
+    def test_loads(self):
+        body = json.dumps(mock_endpoints.synced_miner_data)
+
+        self.assertEqual(serialization.loads(body), mock_endpoints.synced_miner_data)
+        self.assertEqual(serialization.loads(body.encode()), mock_endpoints.synced_miner_data)
+
+        with patch("bobcat_miner.serialization.orjson", None):
+            self.assertEqual(serialization.loads(body.encode()), mock_endpoints.synced_miner_data)
+
+    def test_loads_raises_json_decode_error(self):
+        for orjson in [serialization.orjson, None]:
+            with patch("bobcat_miner.serialization.orjson", orjson):
+                with self.assertRaises(serialization.JSONDecodeError):
+                    serialization.loads(b"{not json")
+
+    def test_dumps_is_the_same_for_every_backend(self):
+        data = mock_endpoints.synced_status_data
+
+        with patch("bobcat_miner.serialization.orjson", None):
+            compact, indented = serialization.dumps(data), serialization.dumps(data, indent=True)
+
+        self.assertEqual(serialization.dumps(data), compact)
+        self.assertEqual(serialization.dumps(data, indent=True), indented)
+        self.assertEqual(indented, json.dumps(data, indent=2))
+
+    def test_dumps_non_string_keys(self):
+        self.assertEqual(serialization.dumps({1: "one"}), '{"1":"one"}')
+
+    def test_dump_and_load(self):
+        f = io.StringIO()
+        serialization.dump({"ota_version": "1.0.2.76"}, f)
+        f.seek(0)
+        self.assertEqual(serialization.load(f), {"ota_version": "1.0.2.76"})
+
+
+if __name__ == "__main__":
+    unittest.main()
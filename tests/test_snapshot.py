@@ -0,0 +1,110 @@
+import unittest
+
+from bobcat_miner import (
+    BobcatPeerSession,
+    DigSnapshot,
+    MinerSnapshot,
+    SpeedSnapshot,
+    StatusSnapshot,
+    TempSnapshot,
+)
+
+import mock_endpoints
+
+
+class TestBobcatSnapshot(unittest.TestCase):
+    """Test the endpoint snapshots."""
+
+    def test_status_snapshot(self):
+        snapshot = StatusSnapshot(mock_endpoints.synced_status_data)
+
+        self.assertIs(snapshot.raw, mock_endpoints.synced_status_data)
+        self.assertEqual(snapshot.status, "Synced")
+        self.assertEqual(snapshot.gap, 0)
+        self.assertEqual(snapshot.miner_height, 1148539)
+        self.assertEqual(snapshot.epoch, 30157)
+
+        # non numeric values are kept as is
+        self.assertEqual(StatusSnapshot(mock_endpoints.down_status_data).gap, "-")
+
+    def test_miner_snapshot(self):
+        snapshot = MinerSnapshot(mock_endpoints.synced_miner_data)
+
+        self.assertEqual(snapshot.helium_animal, "Fancy Awesome Bobcat")
+        self.assertEqual(snapshot.miner_state, "running")
+        self.assertEqual(
+            snapshot.p2p_status, "\n".join(mock_endpoints.synced_miner_data["p2p_status"])
+        )
+        self.assertEqual(snapshot.peerbook, "\n".join(mock_endpoints.synced_miner_data["peerbook"]))
+
+    def test_miner_snapshot_p2p_records(self):
+        snapshot = MinerSnapshot(mock_endpoints.synced_miner_data)
+
+        self.assertTrue(snapshot.connected)
+        self.assertTrue(snapshot.dialable)
+        self.assertEqual(snapshot.nat_type, "none")
+        self.assertEqual(snapshot.p2p_height, 1148539)
+        self.assertEqual(snapshot.listen_addrs, ("/ip4/33.117.96.28/tcp/44158",))
+        self.assertEqual(len(snapshot.sessions), 8)
+        self.assertEqual(
+            snapshot.sessions[0],
+            BobcatPeerSession(
+                local="/ip4/x.x.x.x/tcp/4",
+                remote="/ip4/x.x.x.x/tcp/4415",
+                p2p="/p2p/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
+                name="fancy-other-bobc",
+            ),
+        )
+
+        # the tables are missing when the miner is down
+        snapshot = MinerSnapshot(mock_endpoints.down_miner_data)
+        self.assertIsNone(snapshot.connected)
+        self.assertIsNone(snapshot.nat_type)
+        self.assertEqual(snapshot.listen_addrs, ())
+        self.assertEqual(snapshot.sessions, ())
+
+    def test_temp_snapshot(self):
+        snapshot = TempSnapshot(mock_endpoints.synced_temp_data)
+
+        self.assertEqual((snapshot.temp0, snapshot.temp1), (38, 37))
+        self.assertEqual((snapshot.coldest_temp, snapshot.hottest_temp), (37, 38))
+        self.assertEqual((snapshot.temp0_f, snapshot.temp1_f), (100.4, 98.6))
+
+    def test_speed_snapshot(self):
+        snapshot = SpeedSnapshot(mock_endpoints.synced_speed_data)
+
+        self.assertEqual(snapshot.download_speed, "94 Mbit/s")
+        self.assertEqual(snapshot.download_mbps, 94.0)
+        self.assertEqual(snapshot.upload_mbps, 57.0)
+        self.assertEqual(snapshot.latency_ms, 7.669083)
+
+        snapshot = SpeedSnapshot(
+            {"DownloadSpeed": "900 Kbit/s", "UploadSpeed": "", "Latency": "1.5s"}
+        )
+        self.assertEqual(snapshot.download_mbps, 0.9)
+        self.assertIsNone(snapshot.upload_mbps)
+        self.assertEqual(snapshot.latency_ms, 1500.0)
+
+    def test_dig_snapshot(self):
+        snapshot = DigSnapshot(mock_endpoints.synced_dig_data)
+
+        self.assertEqual(snapshot.name, "seed.helium.io.")
+        self.assertEqual(snapshot.dns, "Local DNS")
+        self.assertEqual(len(snapshot.records), 3)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = StatusSnapshot(mock_endpoints.synced_status_data)
+
+        with self.assertRaises(AttributeError):
+            snapshot.gap = 1
+        with self.assertRaises(AttributeError):
+            snapshot.other = 1
+        with self.assertRaises(AttributeError):
+            del snapshot.gap
+
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+        self.assertTrue(repr(snapshot).startswith("StatusSnapshot(status='Synced', gap=0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
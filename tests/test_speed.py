@@ -0,0 +1,105 @@
+from unittest.mock import patch, AsyncMock
+
+import threading
+import time
+import unittest
+
+from bobcat_miner import Bobcat, BobcatSpeedResult, BobcatSpeedWorker
+
+import mock_endpoints
+
+DISABLED = 100
+
+EMPTY_SPEED_DATA = {"DownloadSpeed": "", "UploadSpeed": "", "Latency": ""}
+
+
+class TestBobcatSpeedWorker(unittest.TestCase):
+    """Test BobcatSpeedWorker."""
+
+    @patch("bobcat_miner.BobcatConnection.verify", return_value=AsyncMock())
+    def setUp(self, mock_verify):
+        self.bobcat = Bobcat(hostname="192.168.0.10", log_level=DISABLED)
+
+    def tearDown(self):
+        self.bobcat.close()
+
+    @patch("requests.Session.get")
+    def test_empty_results_are_retried_in_the_background(self, mock_requests_get):
+        mock_requests_get.side_effect = [
+            mock_endpoints.mock_json_response(EMPTY_SPEED_DATA),
+            mock_endpoints.mock_online("/speed.json"),
+        ]
+
+        worker = self.bobcat.start_speed_worker(retry_interval=0.01)
+        result = worker.wait(timeout=5)
+
+        self.assertEqual(result.data, mock_endpoints.synced_speed_data)
+        self.assertEqual(self.bobcat.speed_result(), result)
+        self.assertEqual(self.bobcat.download_speed, "94 Mbit/s")
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch("requests.Session.get")
+    def test_attributes_do_not_wait_for_the_speed_test(self, mock_requests_get):
+        responded = threading.Event()
+
+        def slow_speed_test(url):
+            responded.wait()
+            return mock_endpoints.mock_online(url)
+
+        mock_requests_get.side_effect = slow_speed_test
+
+        worker = self.bobcat.start_speed_worker()
+        self.assertIsNone(self.bobcat.download_speed)
+        self.assertIsNone(self.bobcat.speed_result())
+
+        responded.set()
+        self.assertIsNotNone(worker.wait(timeout=5))
+        self.assertEqual(self.bobcat.latency, "7.669083ms")
+        self.assertEqual(mock_requests_get.call_count, 1)
+
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
+    def test_existing_speed_data_is_the_first_result(self, mock_requests_get):
+        self.bobcat.refresh_speed()
+
+        worker = self.bobcat.start_speed_worker(interval=60)
+
+        self.assertEqual(worker.wait(timeout=5).data, mock_endpoints.synced_speed_data)
+        self.assertLess(worker.result.age, 5)
+        self.assertEqual(mock_requests_get.call_count, 1)
+
+        self.bobcat.stop_speed_worker()
+        self.assertFalse(worker.running)
+
+    @patch("requests.Session.get", side_effect=mock_endpoints.mock_online)
+    def test_refresh_tracks_changed_data(self, mock_requests_get):
+        worker = BobcatSpeedWorker(self.bobcat)
+
+        self.assertTrue(worker.refresh())
+        self.assertTrue(self.bobcat.changed("speed"))
+        speed_data = self.bobcat._speed_data
+
+        # an identical speed test is not parsed again and is not logged as changed
+        self.assertTrue(worker.refresh())
+        self.assertFalse(self.bobcat.changed("speed"))
+        self.assertIs(self.bobcat._speed_data, speed_data)
+
+    @patch("requests.Session.get")
+    def test_refresh_discards_empty_results(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_endpoints.mock_online
+        worker = BobcatSpeedWorker(self.bobcat)
+        worker.refresh()
+
+        mock_requests_get.side_effect = lambda url: mock_endpoints.mock_json_response(
+            EMPTY_SPEED_DATA
+        )
+        self.assertFalse(worker.refresh())
+        self.assertEqual(self.bobcat._speed_data, mock_endpoints.synced_speed_data)
+        self.assertEqual(worker.result.data, mock_endpoints.synced_speed_data)
+
+    @patch("time.time", return_value=1000.0)
+    def test_result_age(self, mock_time):
+        self.assertEqual(BobcatSpeedResult(data={}, timestamp=940.0).age, 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()